@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+_geomc - C-ядра самых горячих геометрических примитивов BESS_Geometry
+
+Необязательное расширение на Cython. Ядра работают напрямую с буферами
+array('d') / array('f') (типизированные memoryview, без numpy) и отпускают GIL
+на время вычислений. Если модуль не собран, geometry_utils использует
+numba или чистый Python.
+
+Сборка (из каталога bess_geometry):
+    cythonize -i _geomc.pyx
+"""
+
+from libc.stdlib cimport malloc, free
+from libc.math cimport INFINITY, fabs
+
+
+def shoelace_moments(const double[::1] xs, const double[::1] ys):
+    """Удвоенная площадь со знаком и моменты первого порядка за один проход"""
+    cdef Py_ssize_t n = xs.shape[0]
+    cdef Py_ssize_t i
+    cdef double x0, y0, x1, y1, cross
+    cdef double double_area = 0.0, mx = 0.0, my = 0.0
+
+    if n == 0:
+        return 0.0, 0.0, 0.0
+
+    with nogil:
+        x0 = xs[n - 1]
+        y0 = ys[n - 1]
+        for i in range(n):
+            x1 = xs[i]
+            y1 = ys[i]
+            cross = x0 * y1 - x1 * y0
+            double_area += cross
+            mx += (x0 + x1) * cross
+            my += (y0 + y1) * cross
+            x0 = x1
+            y0 = y1
+
+    return double_area, mx, my
+
+
+def points_in_polygon(const double[::1] pxs, const double[::1] pys,
+                      const double[::1] xi, const double[::1] yi, const double[::1] yj,
+                      const double[::1] dx, const double[::1] dy, unsigned char[::1] inside):
+    """Ray casting для пакета точек по подготовленной таблице ребер (результат в inside)"""
+    cdef Py_ssize_t m = pxs.shape[0]
+    cdef Py_ssize_t edges = xi.shape[0]
+    cdef Py_ssize_t k, e
+    cdef double px, py
+    cdef unsigned char flag
+
+    with nogil:
+        for k in range(m):
+            px = pxs[k]
+            py = pys[k]
+            flag = 0
+            for e in range(edges):
+                if ((yi[e] > py) != (yj[e] > py)) and (px < dx[e] * (py - yi[e]) / dy[e] + xi[e]):
+                    flag ^= 1
+            inside[k] = flag
+
+
+def douglas_peucker(const float[::1] xs, const float[::1] ys, Py_ssize_t start, Py_ssize_t end,
+                    double epsilon2, double tolerance, unsigned char[::1] keep):
+    """
+    Итеративный алгоритм Дугласа-Пёкера на диапазоне [start, end]
+
+    Отмечает в keep (длина end - start + 1) сохраняемые вершины. Арифметика
+    совпадает с _dist2_point_to_line() из geometry_utils и ведется во float64.
+    """
+    cdef Py_ssize_t count = end - start + 1
+    cdef Py_ssize_t *stack
+    cdef Py_ssize_t top, lo, hi, i, max_index
+    cdef double x1, y1, dx, dy, length2, px, py, ex, ey, t, distance2, max_distance2
+    cdef bint degenerate
+
+    if count < 1:
+        return
+    keep[0] = 1
+    keep[count - 1] = 1
+    if count < 3:
+        return
+
+    # Ожидающие диапазоны не пересекаются, поэтому их не больше числа вершин
+    stack = <Py_ssize_t *> malloc(2 * count * sizeof(Py_ssize_t))
+    if stack == NULL:
+        raise MemoryError()
+
+    with nogil:
+        stack[0] = start
+        stack[1] = end
+        top = 2
+
+        while top > 0:
+            top -= 2
+            lo = stack[top]
+            hi = stack[top + 1]
+            if hi - lo < 2:
+                continue
+
+            x1 = xs[lo]
+            y1 = ys[lo]
+            dx = <double> xs[hi] - x1
+            dy = <double> ys[hi] - y1
+            degenerate = fabs(dx) < tolerance and fabs(dy) < tolerance
+            length2 = dx * dx + dy * dy
+
+            max_distance2 = 0.0
+            max_index = lo
+            for i in range(lo + 1, hi):
+                px = xs[i]
+                py = ys[i]
+                ex = px - x1
+                ey = py - y1
+                if not degenerate:
+                    t = (ex * dx + ey * dy) / length2
+                    t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+                    ex = px - (x1 + t * dx)
+                    ey = py - (y1 + t * dy)
+                distance2 = ex * ex + ey * ey
+                if distance2 != distance2:
+                    distance2 = INFINITY
+                if distance2 > max_distance2:
+                    max_distance2 = distance2
+                    max_index = i
+
+            if max_distance2 > epsilon2 and max_index > lo:
+                keep[max_index - start] = 1
+                stack[top] = max_index
+                stack[top + 1] = hi
+                stack[top + 2] = lo
+                stack[top + 3] = max_index
+                top += 4
+
+    free(stack)
@@ -105,6 +105,9 @@ class InteractionController:
         self.element_mappings: Dict[int, ElementHitInfo] = {}
         # element_id -> List[canvas_id]
         self.element_canvas_map: Dict[str, List[int]] = {}
+        # element_id -> ElementHitInfo (в том числе для элементов без объектов
+        # на canvas, например отсеченных за пределами видимой области)
+        self.element_info_map: Dict[str, ElementHitInfo] = {}
         
         # === DRAG-SELECT СОСТОЯНИЕ ===
         self.is_dragging = False
@@ -550,9 +553,41 @@ class InteractionController:
         
         # Обновляем обратное отображение
         self.element_canvas_map[element_id] = canvas_ids.copy()
+        self.element_info_map[element_id] = hit_info
         
         print(f"🎯 Зарегистрирован элемент {element_id} ({element_type}) с {len(canvas_ids)} canvas объектами")
     
+    def register_elements_bulk(self, elements: List[Tuple[List[int], str, str, Optional[Dict]]]):
+        """
+        Пакетная регистрация элементов за один проход
+        
+        Маппинги собираются локально и добавляются двумя dict.update вместо
+        отдельного вызова register_element (и вывода в консоль) на каждый элемент.
+        
+        Args:
+            elements: Кортежи (canvas_ids, element_id, element_type, properties)
+        """
+        mappings = {}
+        canvas_map = {}
+        info_map = {}
+        
+        for canvas_ids, element_id, element_type, properties in elements:
+            hit_info = ElementHitInfo(
+                element_id=element_id,
+                element_type=element_type,
+                canvas_ids=list(canvas_ids),
+                properties=properties or {}
+            )
+            mappings.update(dict.fromkeys(canvas_ids, hit_info))
+            canvas_map[element_id] = list(canvas_ids)
+            info_map[element_id] = hit_info
+        
+        self.element_mappings.update(mappings)
+        self.element_canvas_map.update(canvas_map)
+        self.element_info_map.update(info_map)
+        
+        print(f"🎯 Зарегистрировано элементов: {len(canvas_map)} ({len(mappings)} canvas объектов)")
+    
     def unregister_element(self, element_id: str):
         """Отмена регистрации элемента"""
         if element_id in self.element_canvas_map:
@@ -564,16 +599,27 @@ class InteractionController:
                     del self.element_mappings[canvas_id]
             
             del self.element_canvas_map[element_id]
+            self.element_info_map.pop(element_id, None)
             
             # Убираем из выделения
             self.selection_state.selected_ids.discard(element_id)
             
             print(f"🗑️ Элемент {element_id} удален из системы интерактивности")
     
+    def get_element_info(self, element_id: str) -> Optional[ElementHitInfo]:
+        """
+        Информация о зарегистрированном элементе по его ID
+        
+        Поиск за O(1) по element_info_map, в том числе для элементов,
+        у которых сейчас нет объектов на canvas.
+        """
+        return self.element_info_map.get(element_id)
+    
     def clear_all_elements(self):
         """Очистка всех зарегистрированных элементов"""
         self.element_mappings.clear()
         self.element_canvas_map.clear()
+        self.element_info_map.clear()
         self.clear_selection()
         self._clear_hover_state()
         print("🧹 Все элементы очищены из системы интерактивности")
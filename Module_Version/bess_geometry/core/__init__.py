@@ -25,7 +25,8 @@ try:
         GeometryValidator, 
         SpatialCalculator,
         GeometricProperties,
-        SpatialRelationship
+        SpatialRelationship,
+        PolygonBuffer
     )
     SPATIAL_PROCESSOR_AVAILABLE = True
 except ImportError as e:
@@ -107,7 +108,8 @@ if SPATIAL_PROCESSOR_AVAILABLE:
         'GeometryValidator',
         'SpatialCalculator',
         'GeometricProperties',
-        'SpatialRelationship'
+        'SpatialRelationship',
+        'PolygonBuffer'
     ])
 
 if FILE_MANAGER_AVAILABLE:
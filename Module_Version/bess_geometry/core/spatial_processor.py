@@ -15,11 +15,17 @@ SpatialProcessor понимает пространственные отноше
 """
 
 import math
+import os
+import pickle
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Tuple, Dict, Optional, Set, Union, Any
-from dataclasses import dataclass, field
-from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from bisect import bisect_left
+from collections import Counter
 from enum import Enum
 
 # Добавляем корневую директорию проекта в путь для импорта утилит
@@ -29,11 +35,23 @@ if str(current_dir) not in sys.path:
 
 # Импортируем наши геометрические утилиты
 from geometry_utils import (
-    centroid_xy, bounds, r2, polygon_area, 
+    r2, 
     point_in_polygon, distance_point_to_line, 
-    line_intersection, simplify_polygon
+    line_intersections_batch, simplify_polygons,
+    polygon_area_fast, centroid_fast, bounds_fast
 )
-from performance import PerformanceMonitor, performance_monitor
+from performance import PerformanceMonitor, performance_monitor, LRUCache
+
+# shapely (GEOS) - необязательная зависимость: при наличии общие границы
+# и самопересечения считаются нативным кодом, иначе - собственными алгоритмами
+try:
+    from shapely.geometry import Polygon as ShapelyPolygon
+    from shapely.ops import snap as shapely_snap
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    ShapelyPolygon = None
+    shapely_snap = None
+    SHAPELY_AVAILABLE = False
 
 
 class ElementType(Enum):
@@ -55,8 +73,136 @@ class AdjacencyType(Enum):
 
 
 @dataclass
+class PolygonBuffer:
+    """
+    Контур полигона в виде раздельных массивов координат (Structure-of-Arrays)
+    
+    Вместо списка кортежей (каждая координата - отдельный объект float)
+    координаты хранятся в двух непрерывных буферах double. Буфер строится
+    один раз на элемент и передается во все геометрические расчеты.
+    """
+    xs: array                                   # X-координаты вершин
+    ys: array                                   # Y-координаты вершин
+    shape: Any = field(default=None, repr=False, compare=False)  # Кэш полигона shapely
+    edges: Any = field(default=None, repr=False, compare=False)  # Кэш таблицы ребер
+    
+    @classmethod
+    def from_points(cls, points: List[Tuple[float, float]]) -> 'PolygonBuffer':
+        """Построение буфера из списка точек [(x, y), ...]"""
+        return cls(array('d', [p[0] for p in points]),
+                   array('d', [p[1] for p in points]))
+    
+    def __len__(self) -> int:
+        return len(self.xs)
+    
+    def signed_area(self) -> float:
+        """Площадь со знаком по формуле шнурков (положительная - против часовой)"""
+        area = polygon_area_fast(self.xs, self.ys)
+        return area if math.isfinite(area) else 0.0
+    
+    def perimeter(self) -> float:
+        """Периметр замкнутого контура"""
+        xs, ys = self.xs, self.ys
+        if len(xs) < 2:
+            return 0.0
+        
+        perimeter = 0.0
+        x0, y0 = xs[-1], ys[-1]
+        for x1, y1 in zip(xs, ys):
+            dx = x1 - x0
+            dy = y1 - y0
+            perimeter += math.hypot(dx, dy)
+            x0, y0 = x1, y1
+        
+        return perimeter
+    
+    def centroid(self) -> Optional[Tuple[float, float]]:
+        """Центроид контура (та же формула, что и в centroid_xy, но без округления)"""
+        return centroid_fast(self.xs, self.ys)
+    
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Габариты контура (min_x, min_y, max_x, max_y) без округления"""
+        return bounds_fast(self.xs, self.ys)
+    
+    def edge_table(self) -> Tuple[List[Tuple[float, float, float]], Optional[Tuple[float, float, float, float]]]:
+        """
+        Таблица ребер контура (строится один раз и кэшируется)
+        
+        Returns:
+            Кортеж (список (mx, my, длина) для каждого сегмента,
+            габариты центров сегментов (min_mx, min_my, max_mx, max_my) или None)
+        """
+        if self.edges is None:
+            xs, ys = self.xs, self.ys
+            segments = []
+            if xs:
+                x0, y0 = xs[-1], ys[-1]
+                for x1, y1 in zip(xs, ys):
+                    segments.append(((x0 + x1) * 0.5, (y0 + y1) * 0.5, math.hypot(x1 - x0, y1 - y0)))
+                    x0, y0 = x1, y1
+            
+            midpoint_bounds = None
+            if segments:
+                mxs = [seg[0] for seg in segments]
+                mys = [seg[1] for seg in segments]
+                midpoint_bounds = (min(mxs), min(mys), max(mxs), max(mys))
+            
+            self.edges = (segments, midpoint_bounds)
+        return self.edges
+    
+    def to_shapely(self) -> Any:
+        """Полигон shapely для контура (строится один раз и кэшируется)"""
+        if self.shape is None:
+            self.shape = ShapelyPolygon(list(zip(self.xs, self.ys)))
+        return self.shape
+
+
+def _shared_boundary_kernel(buffer1: PolygonBuffer, buffer2: PolygonBuffer,
+                            tolerance: float) -> float:
+    """
+    Ядро расчета общей границы двух контуров
+    
+    Центры и длины сегментов берутся из кэшированных таблиц ребер контуров
+    (PolygonBuffer.edge_table), поэтому при анализе смежности каждая таблица
+    строится один раз на элемент, а не на каждую пару. Сегменты первого
+    контура, центр которых лежит вне расширенных на tolerance габаритов
+    центров второго контура, отбрасываются без внутреннего цикла.
+    Во внутреннем цикле нет вызовов функций - только арифметика над локальными
+    переменными.
+    """
+    segments1, _ = buffer1.edge_table()
+    segments2, midpoint_bounds2 = buffer2.edge_table()
+    if not segments1 or not segments2:
+        return 0.0
+    
+    min_mx = midpoint_bounds2[0] - tolerance
+    min_my = midpoint_bounds2[1] - tolerance
+    max_mx = midpoint_bounds2[2] + tolerance
+    max_my = midpoint_bounds2[3] + tolerance
+    tolerance_sq = tolerance * tolerance
+    
+    shared_length = 0.0
+    for mx, my, len1 in segments1:
+        if min_mx <= mx <= max_mx and min_my <= my <= max_my:
+            for mx2, my2, len2 in segments2:
+                dx = mx - mx2
+                dy = my - my2
+                if dx * dx + dy * dy <= tolerance_sq:
+                    shared_length += (len1 + len2) / 2
+    
+    return shared_length
+
+
+def _as_buffer(points: Union[List[Tuple[float, float]], PolygonBuffer]) -> PolygonBuffer:
+    """Приведение входных данных к PolygonBuffer без повторного копирования"""
+    if isinstance(points, PolygonBuffer):
+        return points
+    return PolygonBuffer.from_points(points)
+
+
+@dataclass(slots=True, frozen=True)
 class GeometricProperties:
-    """Геометрические свойства элемента здания"""
+    """Геометрические свойства элемента здания (неизменяемые, без __dict__)"""
     area_m2: float                               # Площадь в квадратных метрах
     perimeter_m: float                          # Периметр в метрах
     centroid: Tuple[float, float]               # Центроид (центр масс)
@@ -66,11 +212,30 @@ class GeometricProperties:
     complexity_factor: float                    # Коэффициент сложности геометрии
     volume_m3: Optional[float] = None           # Объем (если известна высота)
     height_m: Optional[float] = None            # Высота элемента
+    
+    def to_dict(self, precision: int = 2) -> Dict[str, Any]:
+        """
+        Сериализация в словарь для JSON
+        
+        Значения хранятся без округления, округление до precision знаков
+        выполняется только здесь, на выходе.
+        """
+        return {
+            'area_m2': round(self.area_m2, precision),
+            'perimeter_m': round(self.perimeter_m, precision),
+            'centroid': (round(self.centroid[0], precision), round(self.centroid[1], precision)),
+            'bounding_box': tuple(round(v, precision) for v in self.bounding_box),
+            'is_clockwise': self.is_clockwise,
+            'is_self_intersecting': self.is_self_intersecting,
+            'complexity_factor': round(self.complexity_factor, precision),
+            'volume_m3': round(self.volume_m3, precision) if self.volume_m3 is not None else None,
+            'height_m': round(self.height_m, precision) if self.height_m is not None else None
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpatialRelationship:
-    """Пространственное отношение между двумя элементами"""
+    """Пространственное отношение между двумя элементами (неизменяемое, без __dict__)"""
     element1_id: str                            # ID первого элемента
     element2_id: str                            # ID второго элемента
     relationship_type: AdjacencyType            # Тип смежности
@@ -79,6 +244,19 @@ class SpatialRelationship:
     contact_points: List[Tuple[float, float]]   # Точки контакта/пересечения
     confidence: float = 1.0                     # Уверенность в определении связи
     metadata: Dict[str, Any] = field(default_factory=dict)  # Дополнительные данные
+    
+    def to_dict(self, precision: int = 2) -> Dict[str, Any]:
+        """Сериализация в словарь для JSON с округлением до precision знаков"""
+        return {
+            'element1_id': self.element1_id,
+            'element2_id': self.element2_id,
+            'relationship_type': self.relationship_type.value,
+            'shared_boundary_length_m': round(self.shared_boundary_length_m, precision),
+            'distance_m': round(self.distance_m, precision),
+            'contact_points': [(round(x, precision), round(y, precision))
+                               for x, y in self.contact_points],
+            'confidence': round(self.confidence, precision)
+        }
 
 
 class GeometryValidator:
@@ -101,13 +279,15 @@ class GeometryValidator:
     
     @performance_monitor("geometry_validation")
     def validate_polygon(self, points: List[Tuple[float, float]], 
-                        element_type: ElementType = ElementType.ROOM) -> Dict[str, Any]:
+                        element_type: ElementType = ElementType.ROOM,
+                        buffer: Optional[PolygonBuffer] = None) -> Dict[str, Any]:
         """
         Комплексная валидация полигона для архитектурного использования
         
         Args:
             points: Точки полигона в порядке обхода
             element_type: Тип архитектурного элемента
+            buffer: Готовый PolygonBuffer для points (строится при отсутствии)
             
         Returns:
             Словарь с результатами валидации и рекомендациями
@@ -140,8 +320,12 @@ class GeometryValidator:
         if not validation_result['is_valid']:
             return validation_result
         
+        if buffer is None:
+            buffer = PolygonBuffer.from_points(points)
+        
         # Геометрические проверки
-        area = abs(polygon_area(points))
+        signed_area = buffer.signed_area()
+        area = abs(signed_area)
         validation_result['metrics']['area_m2'] = area
         
         # Проверка минимальной площади
@@ -164,7 +348,7 @@ class GeometryValidator:
             validation_result['is_valid'] = False
         
         # Проверка направления обхода
-        is_clockwise = polygon_area(points) < 0
+        is_clockwise = signed_area < 0
         validation_result['metrics']['is_clockwise'] = is_clockwise
         
         if is_clockwise:
@@ -173,7 +357,7 @@ class GeometryValidator:
             )
         
         # Проверка сложности геометрии
-        complexity = self._calculate_complexity(points)
+        complexity = self._calculate_complexity(buffer)
         validation_result['metrics']['complexity_factor'] = complexity
         
         if complexity < 0.3:
@@ -182,7 +366,7 @@ class GeometryValidator:
             )
         
         # Проверка на вырожденные сегменты
-        degenerate_segments = self._find_degenerate_segments(points)
+        degenerate_segments = self._find_degenerate_segments(buffer)
         if degenerate_segments:
             validation_result['warnings'].append(
                 f"Обнаружены {len(degenerate_segments)} вырожденных сегментов"
@@ -197,24 +381,27 @@ class GeometryValidator:
         if n < 4:
             return False
         
-        # Проверяем каждую пару несмежных сегментов
-        for i in range(n):
-            for j in range(i + 2, n):
-                # Избегаем проверки последнего сегмента с первым
-                if i == 0 and j == n - 1:
-                    continue
-                
-                p1 = points[i]
-                p2 = points[(i + 1) % n]
-                p3 = points[j]
-                p4 = points[(j + 1) % n]
-                
-                if line_intersection(p1, p2, p3, p4):
-                    return True
+        if SHAPELY_AVAILABLE:
+            try:
+                return not ShapelyPolygon(points).is_valid
+            except Exception:
+                pass  # Некорректные для GEOS данные - проверяем собственным алгоритмом
+        
+        # Проверяем каждую пару несмежных сегментов: сегмент i против
+        # всех последующих одним пакетом
+        ends = points[1:] + points[:1]
+        for i in range(n - 2):
+            # Избегаем проверки последнего сегмента с первым
+            last = n - 1 if i else n - 2
+            hits = line_intersections_batch(
+                repeat(points[i]), repeat(ends[i]), points[i + 2:last + 1], ends[i + 2:last + 1]
+            )
+            if any(hits):
+                return True
         
         return False
     
-    def _calculate_complexity(self, points: List[Tuple[float, float]]) -> float:
+    def _calculate_complexity(self, points: Union[List[Tuple[float, float]], PolygonBuffer]) -> float:
         """
         Вычисление коэффициента сложности геометрии
         
@@ -224,11 +411,12 @@ class GeometryValidator:
         if len(points) < 3:
             return 0.0
         
-        area = abs(polygon_area(points))
+        buffer = _as_buffer(points)
+        area = abs(buffer.signed_area())
         if area == 0:
             return 0.0
         
-        perimeter = self._calculate_perimeter(points)
+        perimeter = buffer.perimeter()
         if perimeter == 0:
             return 0.0
         
@@ -236,38 +424,27 @@ class GeometryValidator:
         circle_area = (perimeter ** 2) / (4 * math.pi)
         complexity = area / circle_area if circle_area > 0 else 0.0
         
-        return min(1.0, complexity)
+        return 1.0 if complexity > 1.0 else complexity
     
-    def _calculate_perimeter(self, points: List[Tuple[float, float]]) -> float:
+    def _calculate_perimeter(self, points: Union[List[Tuple[float, float]], PolygonBuffer]) -> float:
         """Вычисление периметра полигона"""
-        if len(points) < 2:
-            return 0.0
-        
-        perimeter = 0.0
-        n = len(points)
-        
-        for i in range(n):
-            p1 = points[i]
-            p2 = points[(i + 1) % n]
-            
-            dx = p2[0] - p1[0]
-            dy = p2[1] - p1[1]
-            perimeter += math.sqrt(dx * dx + dy * dy)
-        
-        return perimeter
+        return _as_buffer(points).perimeter()
     
-    def _find_degenerate_segments(self, points: List[Tuple[float, float]]) -> List[int]:
+    def _find_degenerate_segments(self, points: Union[List[Tuple[float, float]], PolygonBuffer]) -> List[int]:
         """Поиск вырожденных сегментов (слишком коротких или коллинеарных)"""
         degenerate = []
-        n = len(points)
+        buffer = _as_buffer(points)
+        xs, ys = buffer.xs, buffer.ys
+        n = len(xs)
+        tolerance_sq = self.tolerance * self.tolerance
         
         for i in range(n):
-            p1 = points[i]
-            p2 = points[(i + 1) % n]
+            j = (i + 1) % n
             
-            # Проверка на слишком короткий сегмент
-            distance = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-            if distance < self.tolerance:
+            # Проверка на слишком короткий сегмент (сравнение квадратов, без sqrt)
+            dx = xs[j] - xs[i]
+            dy = ys[j] - ys[i]
+            if dx * dx + dy * dy < tolerance_sq:
                 degenerate.append(i)
         
         return degenerate
@@ -281,45 +458,53 @@ class SpatialCalculator:
     включая площади, объемы, расстояния и пространственные отношения.
     """
     
-    def __init__(self, default_height: float = 3.0):
+    def __init__(self, default_height: float = 3.0, max_cache_size: int = 8192):
         """
         Инициализация калькулятора
         
         Args:
             default_height: Высота помещений по умолчанию (в метрах)
+            max_cache_size: Максимальное количество записей в кэше расчетов
         """
         self.default_height = default_height
-        self.calculation_cache = {}
+        self.calculation_cache = LRUCache(max_cache_size)
+        # Геометрия контуров (не зависит от высоты), ключ - координаты контура
+        self.geometry_cache = LRUCache(max_cache_size)
     
     @performance_monitor("calculate_properties")
     def calculate_geometric_properties(self, points: List[Tuple[float, float]], 
-                                     height: Optional[float] = None) -> GeometricProperties:
+                                     height: Optional[float] = None,
+                                     buffer: Optional[PolygonBuffer] = None) -> GeometricProperties:
         """
         Расчет всех геометрических свойств элемента
         
         Args:
             points: Точки контура элемента
             height: Высота элемента (если не указана, используется значение по умолчанию)
+            buffer: Готовый PolygonBuffer для points (строится при отсутствии)
             
         Returns:
             Объект с полным набором геометрических характеристик
         """
         # Создаем ключ для кэширования
-        cache_key = (tuple(tuple(p) for p in points), height)
+        contour_key = tuple(tuple(p) for p in points)
+        cache_key = (contour_key, height)
         if cache_key in self.calculation_cache:
             return self.calculation_cache[cache_key]
         
-        # Основные вычисления
-        area = abs(polygon_area(points))
-        perimeter = self._calculate_perimeter(points)
-        centroid = centroid_xy(points) or (0.0, 0.0)
-        bounding_box = bounds(points) or (0.0, 0.0, 0.0, 0.0)
+        rectangle = self._axis_aligned_rectangle(points)
+        if rectangle is not None:
+            # Быстрый путь: прямоугольник, выровненный по осям (типичное помещение)
+            signed_area, perimeter, centroid, bounding_box = rectangle
+            area = abs(signed_area)
+            is_self_intersecting = False
+        else:
+            signed_area, perimeter, centroid, bounding_box, is_self_intersecting = \
+                self._contour_geometry(points, buffer, contour_key)
+            area = abs(signed_area)
         
         # Направление обхода
-        is_clockwise = polygon_area(points) < 0
-        
-        # Проверка на самопересечения (упрощенная)
-        is_self_intersecting = self._quick_self_intersection_check(points)
+        is_clockwise = signed_area < 0
         
         # Коэффициент сложности
         complexity_factor = self._calculate_complexity_factor(points, area, perimeter)
@@ -329,16 +514,15 @@ class SpatialCalculator:
         volume = area * element_height if area > 0 else None
         
         properties = GeometricProperties(
-            area_m2=r2(area),
-            perimeter_m=r2(perimeter),
-            centroid=(r2(centroid[0]), r2(centroid[1])),
-            bounding_box=(r2(bounding_box[0]), r2(bounding_box[1]), 
-                         r2(bounding_box[2]), r2(bounding_box[3])),
+            area_m2=area,
+            perimeter_m=perimeter,
+            centroid=centroid,
+            bounding_box=bounding_box,
             is_clockwise=is_clockwise,
             is_self_intersecting=is_self_intersecting,
-            complexity_factor=r2(complexity_factor),
-            volume_m3=r2(volume) if volume else None,
-            height_m=r2(element_height) if height else None
+            complexity_factor=complexity_factor,
+            volume_m3=volume if volume else None,
+            height_m=element_height if height else None
         )
         
         # Кэшируем результат
@@ -346,80 +530,180 @@ class SpatialCalculator:
         
         return properties
     
-    def calculate_adjacency(self, element1_points: List[Tuple[float, float]],
-                           element2_points: List[Tuple[float, float]],
+    def _contour_geometry(self, points: List[Tuple[float, float]],
+                          buffer: Optional[PolygonBuffer] = None,
+                          contour_key: Optional[tuple] = None) -> Tuple[float, float, Tuple[float, float],
+                                                                        Tuple[float, float, float, float], bool]:
+        """
+        Площадь со знаком, периметр, центроид, габарит и признак самопересечения контура
+        
+        Результат запоминается по координатам контура (contour_key - кортеж
+        точек), поэтому тот же контур с другой высотой не пересчитывается,
+        а измененный на месте список точек дает новый ключ.
+        """
+        if contour_key is None:
+            contour_key = tuple(tuple(p) for p in points)
+        geometry = self.geometry_cache.get(contour_key)
+        if geometry is not None:
+            return geometry
+        
+        if buffer is None:
+            buffer = PolygonBuffer.from_points(points)
+        
+        # Основные вычисления - напрямую по буферам координат, без повторного
+        # обхода списка кортежей
+        geometry = (
+            buffer.signed_area(),
+            self._calculate_perimeter(buffer),
+            buffer.centroid() or (0.0, 0.0),
+            buffer.bounds() or (0.0, 0.0, 0.0, 0.0),
+            # Проверка на самопересечения (упрощенная)
+            self._quick_self_intersection_check(points)
+        )
+        
+        self.geometry_cache[contour_key] = geometry
+        return geometry
+    
+    def calculate_adjacency(self, element1_points: Union[List[Tuple[float, float]], PolygonBuffer],
+                           element2_points: Union[List[Tuple[float, float]], PolygonBuffer],
                            tolerance: float = 0.1) -> Optional[SpatialRelationship]:
         """
         Анализ смежности между двумя элементами
         
         Args:
-            element1_points: Точки первого элемента
-            element2_points: Точки второго элемента  
+            element1_points: Точки (или PolygonBuffer) первого элемента
+            element2_points: Точки (или PolygonBuffer) второго элемента  
             tolerance: Допуск для определения смежности (в метрах)
             
         Returns:
             Объект с описанием пространственного отношения или None
         """
+        buffer1 = _as_buffer(element1_points)
+        buffer2 = _as_buffer(element2_points)
+        
         # Вычисляем центроиды элементов
-        centroid1 = centroid_xy(element1_points)
-        centroid2 = centroid_xy(element2_points)
+        return self._classify_adjacency(
+            buffer1, buffer2, buffer1.centroid(), buffer2.centroid(), tolerance
+        )
+    
+    def calculate_adjacency_batch(self, polygons: List[Union[List[Tuple[float, float]], PolygonBuffer]],
+                                  pairs: List[Tuple[int, int]],
+                                  tolerance: float = 0.1) -> List[Tuple[int, int, SpatialRelationship]]:
+        """
+        Пакетный анализ смежности для списка пар-кандидатов
+        
+        В отличие от вызова calculate_adjacency для каждой пары, центроид
+        каждого полигона вычисляется один раз, а не для каждой пары заново.
+        
+        Args:
+            polygons: Контуры элементов (точки или PolygonBuffer)
+            pairs: Пары индексов (i, j) в списке polygons
+            tolerance: Допуск для определения смежности (в метрах)
+            
+        Returns:
+            Список (i, j, отношение) только для смежных пар, в порядке pairs
+        """
+        buffers = [_as_buffer(polygon) for polygon in polygons]
+        centroids = [buffer.centroid() for buffer in buffers]
+        
+        results = []
+        for i, j in pairs:
+            relationship = self._classify_adjacency(
+                buffers[i], buffers[j], centroids[i], centroids[j], tolerance
+            )
+            if relationship:
+                results.append((i, j, relationship))
         
+        return results
+    
+    def _classify_adjacency(self, buffer1: PolygonBuffer, buffer2: PolygonBuffer,
+                            centroid1: Optional[Tuple[float, float]],
+                            centroid2: Optional[Tuple[float, float]],
+                            tolerance: float) -> Optional[SpatialRelationship]:
+        """Определение типа смежности по готовым центроидам"""
         if not centroid1 or not centroid2:
             return None
         
         # Расстояние между центроидами
-        distance = math.sqrt((centroid2[0] - centroid1[0])**2 + 
-                           (centroid2[1] - centroid1[1])**2)
+        distance = math.hypot(centroid2[0] - centroid1[0],
+                              centroid2[1] - centroid1[1])
         
         # Поиск общих границ
         shared_boundary_length = self._calculate_shared_boundary(
-            element1_points, element2_points, tolerance
+            buffer1, buffer2, tolerance
         )
         
         # Определяем тип смежности
         if shared_boundary_length > tolerance:
             relationship_type = AdjacencyType.DIRECT
-            confidence = min(1.0, shared_boundary_length / tolerance)
+            confidence = shared_boundary_length / tolerance
+            confidence = 1.0 if confidence > 1.0 else confidence
         else:
             # Проверяем близость элементов
             if distance <= tolerance * 2:
                 relationship_type = AdjacencyType.INDIRECT
-                confidence = max(0.1, 1.0 - (distance / (tolerance * 2)))
+                confidence = 1.0 - (distance / (tolerance * 2))
+                confidence = 0.1 if confidence < 0.1 else confidence
             else:
                 return None  # Элементы не смежны
         
         # Поиск точек контакта
         contact_points = self._find_contact_points(
-            element1_points, element2_points, tolerance
+            buffer1, buffer2, tolerance
         )
         
         return SpatialRelationship(
             element1_id="",  # Будет заполнено вызывающим кодом
             element2_id="",  # Будет заполнено вызывающим кодом
             relationship_type=relationship_type,
-            shared_boundary_length_m=r2(shared_boundary_length),
-            distance_m=r2(distance),
-            contact_points=[(r2(x), r2(y)) for x, y in contact_points],
-            confidence=r2(confidence)
+            shared_boundary_length_m=shared_boundary_length,
+            distance_m=distance,
+            contact_points=contact_points,
+            confidence=confidence
         )
     
-    def _calculate_perimeter(self, points: List[Tuple[float, float]]) -> float:
+    def _calculate_perimeter(self, points: Union[List[Tuple[float, float]], PolygonBuffer]) -> float:
         """Вычисление периметра полигона"""
-        if len(points) < 2:
-            return 0.0
+        return _as_buffer(points).perimeter()
+    
+    def _axis_aligned_rectangle(self, points: List[Tuple[float, float]]
+                                ) -> Optional[Tuple[float, float, Tuple[float, float],
+                                                    Tuple[float, float, float, float]]]:
+        """
+        Распознавание прямоугольника, выровненного по осям, за O(1)
         
-        perimeter = 0.0
-        n = len(points)
+        Returns:
+            Кортеж (площадь со знаком, периметр, центроид, габариты)
+            или None, если контур не является таким прямоугольником
+        """
+        if len(points) != 4:
+            return None
         
-        for i in range(n):
-            p1 = points[i]
-            p2 = points[(i + 1) % n]
-            
-            dx = p2[0] - p1[0]
-            dy = p2[1] - p1[1]
-            perimeter += math.sqrt(dx * dx + dy * dy)
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points
         
-        return perimeter
+        if x0 == x3 and x1 == x2 and y0 == y1 and y2 == y3:
+            # Первое ребро горизонтальное
+            signed_area = (x1 - x0) * (y2 - y1)
+        elif x0 == x1 and x2 == x3 and y1 == y2 and y3 == y0:
+            # Первое ребро вертикальное
+            signed_area = -(y1 - y0) * (x2 - x1)
+        else:
+            return None
+        
+        if signed_area == 0:
+            return None  # Вырожденный контур - обрабатывается общим алгоритмом
+        
+        width = abs(x2 - x0)
+        height = abs(y2 - y0)
+        min_x, max_x = (x0, x2) if x0 < x2 else (x2, x0)
+        min_y, max_y = (y0, y2) if y0 < y2 else (y2, y0)
+        
+        return (
+            float(signed_area),
+            2.0 * (width + height),
+            ((x0 + x2) / 2, (y0 + y2) / 2),
+            (float(min_x), float(min_y), float(max_x), float(max_y))
+        )
     
     def _quick_self_intersection_check(self, points: List[Tuple[float, float]]) -> bool:
         """Быстрая проверка на самопересечения (упрощенная версия)"""
@@ -428,19 +712,22 @@ class SpatialCalculator:
         if n < 4:
             return False
         
+        if SHAPELY_AVAILABLE:
+            try:
+                return not ShapelyPolygon(points).is_valid
+            except Exception:
+                pass  # Некорректные для GEOS данные - проверяем собственным алгоритмом
+        
         # Проверяем только несколько ключевых сегментов
-        for i in range(0, n, max(1, n // 10)):  # Проверяем каждый 10-й сегмент
-            for j in range(i + 2, n, max(1, n // 10)):
-                if i == 0 and j == n - 1:
-                    continue
-                
-                p1 = points[i]
-                p2 = points[(i + 1) % n]
-                p3 = points[j]
-                p4 = points[(j + 1) % n]
-                
-                if line_intersection(p1, p2, p3, p4):
-                    return True
+        step = max(1, n // 10)  # Проверяем каждый 10-й сегмент
+        ends = points[1:] + points[:1]
+        for i in range(0, n, step):
+            js = [j for j in range(i + 2, n, step) if not (i == 0 and j == n - 1)]
+            hits = line_intersections_batch(
+                repeat(points[i]), repeat(ends[i]), [points[j] for j in js], [ends[j] for j in js]
+            )
+            if any(hits):
+                return True
         
         return False
     
@@ -454,68 +741,50 @@ class SpatialCalculator:
         circle_area = (perimeter ** 2) / (4 * math.pi)
         complexity = area / circle_area if circle_area > 0 else 0.0
         
-        return min(1.0, max(0.0, complexity))
+        return 0.0 if complexity < 0.0 else (1.0 if complexity > 1.0 else complexity)
     
-    def _calculate_shared_boundary(self, points1: List[Tuple[float, float]],
-                                 points2: List[Tuple[float, float]], 
+    def _calculate_shared_boundary(self, points1: Union[List[Tuple[float, float]], PolygonBuffer],
+                                 points2: Union[List[Tuple[float, float]], PolygonBuffer], 
                                  tolerance: float) -> float:
-        """Вычисление длины общей границы между двумя полигонами"""
-        shared_length = 0.0
+        """
+        Вычисление длины общей границы между двумя полигонами
         
-        # Простой алгоритм: ищем близкие сегменты
-        n1, n2 = len(points1), len(points2)
+        При наличии shapely длина общей границы считается средствами GEOS.
+        Иначе сегменты считаются общими, если их центры ближе tolerance,
+        вклад пары - средняя длина сегментов; перебор пар выполняет
+        _shared_boundary_kernel напрямую по буферам координат.
+        """
+        buffer1 = _as_buffer(points1)
+        buffer2 = _as_buffer(points2)
         
-        for i in range(n1):
-            seg1_start = points1[i]
-            seg1_end = points1[(i + 1) % n1]
-            
-            for j in range(n2):
-                seg2_start = points2[j]
-                seg2_end = points2[(j + 1) % n2]
-                
-                # Проверяем близость сегментов
-                if self._segments_are_close(seg1_start, seg1_end, 
-                                          seg2_start, seg2_end, tolerance):
-                    # Вычисляем длину перекрытия
-                    overlap_length = self._calculate_segment_overlap(
-                        seg1_start, seg1_end, seg2_start, seg2_end
-                    )
-                    shared_length += overlap_length
-        
-        return shared_length
-    
-    def _segments_are_close(self, seg1_start: Tuple[float, float], seg1_end: Tuple[float, float],
-                           seg2_start: Tuple[float, float], seg2_end: Tuple[float, float],
-                           tolerance: float) -> bool:
-        """Проверка близости двух сегментов"""
-        # Упрощенная проверка: расстояние между центрами сегментов
-        center1 = ((seg1_start[0] + seg1_end[0]) / 2, (seg1_start[1] + seg1_end[1]) / 2)
-        center2 = ((seg2_start[0] + seg2_end[0]) / 2, (seg2_start[1] + seg2_end[1]) / 2)
-        
-        distance = math.sqrt((center2[0] - center1[0])**2 + (center2[1] - center1[1])**2)
-        
-        return distance <= tolerance
-    
-    def _calculate_segment_overlap(self, seg1_start: Tuple[float, float], seg1_end: Tuple[float, float],
-                                 seg2_start: Tuple[float, float], seg2_end: Tuple[float, float]) -> float:
-        """Вычисление длины перекрытия двух сегментов"""
-        # Упрощенная реализация - возвращаем среднюю длину сегментов
-        len1 = math.sqrt((seg1_end[0] - seg1_start[0])**2 + (seg1_end[1] - seg1_start[1])**2)
-        len2 = math.sqrt((seg2_end[0] - seg2_start[0])**2 + (seg2_end[1] - seg2_start[1])**2)
-        
-        return (len1 + len2) / 2
-    
-    def _find_contact_points(self, points1: List[Tuple[float, float]],
-                           points2: List[Tuple[float, float]], 
+        if SHAPELY_AVAILABLE:
+            # Длина совпадающих участков границ; вершины первого контура
+            # предварительно притягиваются к второму в пределах tolerance
+            try:
+                boundary2 = buffer2.to_shapely().boundary
+                boundary1 = shapely_snap(buffer1.to_shapely().boundary, boundary2, tolerance)
+                return boundary1.intersection(boundary2).length
+            except Exception:
+                pass  # Некорректные для GEOS данные - считаем собственным алгоритмом
+        
+        return _shared_boundary_kernel(buffer1, buffer2, tolerance)
+    
+    def _find_contact_points(self, points1: Union[List[Tuple[float, float]], PolygonBuffer],
+                           points2: Union[List[Tuple[float, float]], PolygonBuffer], 
                            tolerance: float) -> List[Tuple[float, float]]:
         """Поиск точек контакта между двумя полигонами"""
         contact_points = []
+        buffer1 = _as_buffer(points1)
+        buffer2 = _as_buffer(points2)
+        points2 = list(zip(buffer2.xs, buffer2.ys))
+        tolerance_sq = tolerance * tolerance
         
-        # Простой алгоритм: ищем близкие точки
-        for p1 in points1:
+        # Простой алгоритм: ищем близкие точки (сравнение квадратов расстояний)
+        for p1 in zip(buffer1.xs, buffer1.ys):
             for p2 in points2:
-                distance = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-                if distance <= tolerance:
+                dx = p2[0] - p1[0]
+                dy = p2[1] - p1[1]
+                if dx * dx + dy * dy <= tolerance_sq:
                     # Добавляем среднюю точку как точку контакта
                     contact_point = ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
                     contact_points.append(contact_point)
@@ -523,6 +792,117 @@ class SpatialCalculator:
         return contact_points[:10]  # Ограничиваем количество точек
 
 
+def _process_element(validator: GeometryValidator, calculator: SpatialCalculator,
+                     element: Dict, index: int) -> Dict[str, Any]:
+    """
+    Обработка одного элемента здания
+    
+    Функция уровня модуля (а не метод), чтобы ее можно было передавать
+    в пул процессов: результат зависит только от элемента и настроек
+    валидатора/калькулятора.
+    """
+    element_id = element.get('id', f'element_{index}')
+    element_type_str = element.get('element_type', 'room')
+    
+    # Преобразуем строку в enum
+    try:
+        element_type = ElementType(element_type_str)
+    except ValueError:
+        element_type = ElementType.ROOM
+    
+    # Получаем геометрию
+    outer_points = element.get('outer_xy_m', [])
+    height = element.get('height_m') or element.get('params', {}).get('height')
+    
+    processed_element = {
+        'id': element_id,
+        'element_type': element_type.value,
+        'original_data': element,
+        'geometry': {
+            'outer_points': outer_points,
+            'inner_loops': element.get('inner_loops_xy_m', [])
+        }
+    }
+    
+    if outer_points:
+        # Единый SoA-буфер контура для всех последующих расчетов
+        try:
+            buffer = PolygonBuffer.from_points(outer_points)
+        except (TypeError, ValueError, IndexError):
+            buffer = None  # Некорректные координаты - их отклонит валидатор
+        processed_element['geometry']['buffer'] = buffer
+        
+        # Валидация геометрии
+        validation_result = validator.validate_polygon(outer_points, element_type, buffer)
+        processed_element['validation'] = validation_result
+        
+        # Расчет геометрических свойств
+        if validation_result['is_valid']:
+            properties = calculator.calculate_geometric_properties(
+                outer_points, height, buffer
+            )
+            processed_element['properties'] = properties
+        else:
+            processed_element['properties'] = None
+    else:
+        processed_element['validation'] = {
+            'is_valid': False,
+            'errors': ['Отсутствует геометрия'],
+            'warnings': [],
+            'recommendations': []
+        }
+        processed_element['properties'] = None
+    
+    return processed_element
+
+
+# Границы классов сложности геометрии для статистики здания (complex | medium | simple)
+COMPLEXITY_THRESHOLDS = (0.4, 0.7)
+
+# Минимальное количество элементов, начиная с которого обработка
+# распараллеливается (на меньших объемах запуск пула дороже самой работы)
+PARALLEL_MIN_ELEMENTS = 50
+
+# Минимальное суммарное число вершин, при котором упрощение контуров
+# выносится в пул процессов (иначе пересылка данных дороже самого расчета)
+PARALLEL_MIN_SIMPLIFY_POINTS = 200000
+
+# Валидатор и калькулятор рабочего процесса (создаются в _init_worker)
+_worker_validator: Optional[GeometryValidator] = None
+_worker_calculator: Optional[SpatialCalculator] = None
+
+
+def _init_worker(tolerance: float, default_height: float) -> None:
+    """Инициализация рабочего процесса пула"""
+    global _worker_validator, _worker_calculator
+    _worker_validator = GeometryValidator(tolerance)
+    _worker_calculator = SpatialCalculator(default_height)
+
+
+def _process_element_task(task: Tuple[int, Dict]) -> Tuple[int, Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Задача пула процессов: обработка одного элемента
+    
+    Returns:
+        Кортеж (индекс, обработанный элемент или None, сообщение об ошибке или None)
+    """
+    index, element = task
+    try:
+        processed_element = _process_element(_worker_validator, _worker_calculator, element, index)
+    except Exception as e:
+        return index, None, str(e)
+    
+    # Исходные данные не передаем обратно - родительский процесс восстановит ссылки
+    processed_element['original_data'] = None
+    return index, processed_element, None
+
+
+def _simplify_contours_task(task: Tuple[List[List[Tuple[float, float]]], float]) -> List[List[Tuple[float, float]]]:
+    """Задача пула процессов: упрощение пакета контуров"""
+    contours, tolerance = task
+    return simplify_polygons(contours, tolerance)
+
+
 class SpatialProcessor:
     """
     Основной геометрический процессор системы BESS_Geometry
@@ -532,22 +912,27 @@ class SpatialProcessor:
     предоставляя высокоуровневый интерфейс для пространственного анализа.
     """
     
-    def __init__(self, tolerance: float = 0.01, default_height: float = 3.0):
+    def __init__(self, tolerance: float = 0.01, default_height: float = 3.0,
+                 max_workers: Optional[int] = None, max_cache_size: int = 8192):
         """
         Инициализация пространственного процессора
         
         Args:
             tolerance: Геометрический допуск (в метрах)
             default_height: Высота помещений по умолчанию (в метрах)
+            max_workers: Число процессов для обработки элементов
+                         (None - по числу ядер, 1 - без распараллеливания)
+            max_cache_size: Максимальное количество записей в каждом из кэшей
         """
         self.tolerance = tolerance
+        self.max_workers = max_workers
         self.validator = GeometryValidator(tolerance)
-        self.calculator = SpatialCalculator(default_height)
+        self.calculator = SpatialCalculator(default_height, max_cache_size)
         self.performance_monitor = PerformanceMonitor()
         
-        # Кэш для результатов обработки
-        self.processing_cache = {}
-        self.adjacency_cache = {}
+        # Кэш для результатов обработки (ограничен по размеру, вытеснение LRU)
+        self.processing_cache = LRUCache(max_cache_size)
+        self.adjacency_cache = LRUCache(max_cache_size)
         
         print(f"✅ SpatialProcessor инициализирован (допуск: {tolerance}м, высота: {default_height}м)")
     
@@ -574,24 +959,23 @@ class SpatialProcessor:
         print(f"🔄 Обработка {len(elements)} элементов здания...")
         
         # Обрабатываем каждый элемент
-        for i, element in enumerate(elements):
-            try:
-                processed_element = self._process_single_element(element, i)
-                processing_result['processed_elements'].append(processed_element)
-                
-                # Обновляем статистику валидации
-                if processed_element['validation']['is_valid']:
-                    processing_result['validation_summary']['valid'] += 1
-                else:
-                    processing_result['validation_summary']['invalid'] += 1
-                
-                if processed_element['validation']['warnings']:
-                    processing_result['validation_summary']['warnings'] += 1
-                    
-            except Exception as e:
-                error_msg = f"Ошибка обработки элемента {i}: {str(e)}"
+        for i, processed_element, error in self._process_elements(elements):
+            if error is not None:
+                error_msg = f"Ошибка обработки элемента {i}: {error}"
                 processing_result['processing_errors'].append(error_msg)
                 print(f"❌ {error_msg}")
+                continue
+            
+            processing_result['processed_elements'].append(processed_element)
+            
+            # Обновляем статистику валидации
+            if processed_element['validation']['is_valid']:
+                processing_result['validation_summary']['valid'] += 1
+            else:
+                processing_result['validation_summary']['invalid'] += 1
+            
+            if processed_element['validation']['warnings']:
+                processing_result['validation_summary']['warnings'] += 1
         
         # Анализируем пространственные отношения
         if len(processing_result['processed_elements']) > 1:
@@ -609,54 +993,45 @@ class SpatialProcessor:
         
         return processing_result
     
-    def _process_single_element(self, element: Dict, index: int) -> Dict[str, Any]:
-        """Обработка одного элемента здания"""
-        element_id = element.get('id', f'element_{index}')
-        element_type_str = element.get('element_type', 'room')
+    def _process_elements(self, elements: List[Dict]) -> List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Обработка всех элементов, при большом объеме - в пуле процессов
         
-        # Преобразуем строку в enum
-        try:
-            element_type = ElementType(element_type_str)
-        except ValueError:
-            element_type = ElementType.ROOM
-        
-        # Получаем геометрию
-        outer_points = element.get('outer_xy_m', [])
-        height = element.get('height_m') or element.get('params', {}).get('height')
-        
-        processed_element = {
-            'id': element_id,
-            'element_type': element_type.value,
-            'original_data': element,
-            'geometry': {
-                'outer_points': outer_points,
-                'inner_loops': element.get('inner_loops_xy_m', [])
-            }
-        }
+        Returns:
+            Список кортежей (индекс, обработанный элемент, ошибка) в исходном порядке
+        """
+        workers = self.max_workers or os.cpu_count() or 1
         
-        if outer_points:
-            # Валидация геометрии
-            validation_result = self.validator.validate_polygon(outer_points, element_type)
-            processed_element['validation'] = validation_result
-            
-            # Расчет геометрических свойств
-            if validation_result['is_valid']:
-                properties = self.calculator.calculate_geometric_properties(
-                    outer_points, height
-                )
-                processed_element['properties'] = properties
+        if len(elements) >= PARALLEL_MIN_ELEMENTS and workers > 1:
+            chunksize = max(1, len(elements) // (4 * workers))
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(self.tolerance, self.calculator.default_height)) as executor:
+                    results = list(executor.map(_process_element_task, enumerate(elements),
+                                                chunksize=chunksize))
+            except (OSError, RuntimeError, pickle.PicklingError) as e:
+                print(f"⚠️ Параллельная обработка недоступна ({e}), выполняется последовательно")
             else:
-                processed_element['properties'] = None
-        else:
-            processed_element['validation'] = {
-                'is_valid': False,
-                'errors': ['Отсутствует геометрия'],
-                'warnings': [],
-                'recommendations': []
-            }
-            processed_element['properties'] = None
-        
-        return processed_element
+                # Восстанавливаем ссылки на исходные данные вместо копий из других процессов
+                for index, processed_element, _ in results:
+                    if processed_element is not None:
+                        element = elements[index]
+                        processed_element['original_data'] = element
+                        processed_element['geometry']['outer_points'] = element.get('outer_xy_m', [])
+                        processed_element['geometry']['inner_loops'] = element.get('inner_loops_xy_m', [])
+                return results
+        
+        results = []
+        for i, element in enumerate(elements):
+            try:
+                results.append((i, self._process_single_element(element, i), None))
+            except Exception as e:
+                results.append((i, None, str(e)))
+        return results
+    
+    def _process_single_element(self, element: Dict, index: int) -> Dict[str, Any]:
+        """Обработка одного элемента здания"""
+        return _process_element(self.validator, self.calculator, element, index)
     
     @performance_monitor("analyze_adjacency")
     def _analyze_spatial_relationships(self, processed_elements: List[Dict]) -> List[Dict]:
@@ -666,38 +1041,36 @@ class SpatialProcessor:
         
         print(f"🔍 Анализ смежности между {n} элементами...")
         
-        for i in range(n):
-            for j in range(i + 1, n):
-                element1 = processed_elements[i]
-                element2 = processed_elements[j]
-                
-                # Пропускаем элементы без валидной геометрии
-                if (not element1.get('properties') or 
-                    not element2.get('properties')):
+        # Запас для сравнения габаритов: смежность INDIRECT допускает расстояние
+        # до 2 * tolerance (bounding_box хранится без округления)
+        margin = 2 * self.tolerance
+        
+        # Пропускаем элементы без валидной геометрии
+        valid_elements = [e for e in processed_elements if e.get('properties')]
+        boxes = [e['properties'].bounding_box for e in valid_elements]
+        
+        # Пары-кандидаты: быстрое отсечение по габаритам, уже рассчитанным в GeometricProperties
+        candidate_pairs = []
+        for i, bb1 in enumerate(boxes):
+            for j in range(i + 1, len(boxes)):
+                bb2 = boxes[j]
+                if (bb1[2] + margin < bb2[0] or bb2[2] + margin < bb1[0] or
+                    bb1[3] + margin < bb2[1] or bb2[3] + margin < bb1[1]):
                     continue
-                
-                points1 = element1['geometry']['outer_points']
-                points2 = element2['geometry']['outer_points']
-                
-                # Вычисляем пространственное отношение
-                relationship = self.calculator.calculate_adjacency(
-                    points1, points2, self.tolerance
-                )
-                
-                if relationship:
-                    relationship.element1_id = element1['id']
-                    relationship.element2_id = element2['id']
-                    
-                    # Конвертируем в словарь для JSON-сериализации
-                    relationships.append({
-                        'element1_id': relationship.element1_id,
-                        'element2_id': relationship.element2_id,
-                        'relationship_type': relationship.relationship_type.value,
-                        'shared_boundary_length_m': relationship.shared_boundary_length_m,
-                        'distance_m': relationship.distance_m,
-                        'contact_points': relationship.contact_points,
-                        'confidence': relationship.confidence
-                    })
+                candidate_pairs.append((i, j))
+        
+        # Вычисляем пространственные отношения для всех кандидатов одним пакетом
+        adjacent_pairs = self.calculator.calculate_adjacency_batch(
+            [e['geometry']['buffer'] for e in valid_elements], candidate_pairs, self.tolerance
+        )
+        
+        for i, j, relationship in adjacent_pairs:
+            relationship = replace(relationship,
+                                   element1_id=valid_elements[i]['id'],
+                                   element2_id=valid_elements[j]['id'])
+            
+            # Конвертируем в словарь для JSON-сериализации (здесь же округление)
+            relationships.append(relationship.to_dict())
         
         print(f"✅ Найдено {len(relationships)} пространственных связей")
         return relationships
@@ -706,7 +1079,7 @@ class SpatialProcessor:
         """Вычисление общей статистики здания"""
         stats = {
             'total_elements': len(processed_elements),
-            'elements_by_type': defaultdict(int),
+            'elements_by_type': {},
             'total_area_m2': 0.0,
             'total_volume_m3': 0.0,
             'average_room_area_m2': 0.0,
@@ -715,58 +1088,51 @@ class SpatialProcessor:
         }
         
         valid_elements = [e for e in processed_elements if e.get('properties')]
-        room_areas = []
-        all_points = []
+        properties_list = [e['properties'] for e in valid_elements]
         
-        for element in valid_elements:
-            element_type = element['element_type']
-            properties = element['properties']
-            
-            stats['elements_by_type'][element_type] += 1
-            stats['total_area_m2'] += properties.area_m2
-            
-            if properties.volume_m3:
-                stats['total_volume_m3'] += properties.volume_m3
-            
-            if element_type == 'room':
-                room_areas.append(properties.area_m2)
-            
-            # Собираем все точки для общих границ здания
-            outer_points = element['geometry']['outer_points']
-            all_points.extend(outer_points)
-            
-            # Анализ сложности
-            complexity = properties.complexity_factor
-            if complexity > 0.7:
-                stats['complexity_distribution']['simple'] += 1
-            elif complexity > 0.4:
-                stats['complexity_distribution']['medium'] += 1
-            else:
-                stats['complexity_distribution']['complex'] += 1
+        # Агрегаты считаются встроенными функциями, без поэлементных инкрементов
+        stats['elements_by_type'] = dict(Counter(e['element_type'] for e in valid_elements))
+        stats['total_area_m2'] = sum(p.area_m2 for p in properties_list)
+        stats['total_volume_m3'] = sum(p.volume_m3 for p in properties_list if p.volume_m3)
+        room_areas = [e['properties'].area_m2 for e in valid_elements if e['element_type'] == 'room']
+        
+        # Распределение по сложности: (-inf, 0.4] - complex, (0.4, 0.7] - medium, (0.7, +inf) - simple
+        complexity_buckets = Counter(
+            bisect_left(COMPLEXITY_THRESHOLDS, p.complexity_factor) for p in properties_list
+        )
+        stats['complexity_distribution'] = {
+            'simple': complexity_buckets[2],
+            'medium': complexity_buckets[1],
+            'complex': complexity_buckets[0]
+        }
         
         # Средняя площадь помещений
         if room_areas:
             stats['average_room_area_m2'] = sum(room_areas) / len(room_areas)
         
-        # Общие границы здания
-        if all_points:
-            building_bounds = bounds(all_points)
-            if building_bounds:
-                stats['building_bounds'] = {
-                    'min_x': building_bounds[0],
-                    'min_y': building_bounds[1], 
-                    'max_x': building_bounds[2],
-                    'max_y': building_bounds[3],
-                    'width_m': building_bounds[2] - building_bounds[0],
-                    'height_m': building_bounds[3] - building_bounds[1]
-                }
+        # Общие границы здания: свертка габаритов элементов, посчитанных при их
+        # обработке (GeometricProperties.bounding_box), - O(элементов), а не O(точек)
+        if properties_list:
+            # Транспонируем габариты в четыре столбца и сворачиваем каждый
+            # встроенной редукцией min/max
+            min_xs, min_ys, max_xs, max_ys = zip(*(p.bounding_box for p in properties_list))
+            min_x, min_y = r2(min(min_xs)), r2(min(min_ys))
+            max_x, max_y = r2(max(max_xs)), r2(max(max_ys))
+            stats['building_bounds'] = {
+                'min_x': min_x,
+                'min_y': min_y, 
+                'max_x': max_x,
+                'max_y': max_y,
+                'width_m': max_x - min_x,
+                'height_m': max_y - min_y
+            }
         
         # Округляем числовые значения
         stats['total_area_m2'] = r2(stats['total_area_m2'])
         stats['total_volume_m3'] = r2(stats['total_volume_m3'])
         stats['average_room_area_m2'] = r2(stats['average_room_area_m2'])
         
-        return dict(stats)  # Преобразуем defaultdict в обычный dict
+        return stats
     
     def optimize_geometry(self, elements: List[Dict], 
                          simplification_tolerance: float = 0.05) -> List[Dict]:
@@ -780,41 +1146,77 @@ class SpatialProcessor:
         Returns:
             Список элементов с оптимизированной геометрией
         """
-        optimized_elements = []
+        # Собираем все упрощаемые контуры в один пакет, чтобы их координаты
+        # легли в общие плоские массивы, и запоминаем, кому они принадлежат
+        contours = []
+        layout = []  # (индекс элемента, позиция внешнего контура, позиции внутренних контуров)
         
-        for element in elements:
+        for index, element in enumerate(elements):
             outer_points = element.get('outer_xy_m', [])
             
             if len(outer_points) > 4:  # Оптимизируем только сложную геометрию
-                # Упрощаем основной контур
-                simplified_points = simplify_polygon(outer_points, simplification_tolerance)
-                
-                optimized_element = element.copy()
-                optimized_element['outer_xy_m'] = simplified_points
+                outer_position = len(contours)
+                contours.append(outer_points)
                 
-                # Оптимизируем внутренние контуры
-                inner_loops = element.get('inner_loops_xy_m', [])
-                optimized_loops = []
-                
-                for loop in inner_loops:
+                # Внутренние контуры упрощаются только если они сложные
+                loop_positions = []
+                for loop in element.get('inner_loops_xy_m', []):
                     if len(loop) > 4:
-                        simplified_loop = simplify_polygon(loop, simplification_tolerance)
-                        optimized_loops.append(simplified_loop)
+                        loop_positions.append(len(contours))
+                        contours.append(loop)
                     else:
-                        optimized_loops.append(loop)
+                        loop_positions.append(None)
                 
-                optimized_element['inner_loops_xy_m'] = optimized_loops
-                optimized_elements.append(optimized_element)
-            else:
-                optimized_elements.append(element)
+                layout.append((index, outer_position, loop_positions))
+        
+        simplified = self._simplify_contours(contours, simplification_tolerance)
+        
+        optimized_elements = list(elements)
+        for index, outer_position, loop_positions in layout:
+            element = elements[index]
+            # Новый словарь собирается за один раз: общие поля переносятся
+            # распаковкой, меняются только контуры (без copy() и двух присваиваний)
+            optimized_elements[index] = {
+                **element,
+                'outer_xy_m': simplified[outer_position],
+                'inner_loops_xy_m': [
+                    loop if position is None else simplified[position]
+                    for position, loop in zip(loop_positions, element.get('inner_loops_xy_m', []))
+                ]
+            }
         
         return optimized_elements
     
+    def _simplify_contours(self, contours: List[List[Tuple[float, float]]],
+                           tolerance: float) -> List[List[Tuple[float, float]]]:
+        """
+        Упрощение пакета контуров, при большом объеме - в пуле процессов
+        
+        Контуры независимы, поэтому пакет делится на части, которые упрощаются
+        параллельно и склеиваются в исходном порядке.
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        
+        if workers > 1 and len(contours) > 1 and \
+                sum(len(contour) for contour in contours) >= PARALLEL_MIN_SIMPLIFY_POINTS:
+            chunk_size = max(1, -(-len(contours) // (4 * workers)))
+            tasks = [(contours[i:i + chunk_size], tolerance) for i in range(0, len(contours), chunk_size)]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parts = list(executor.map(_simplify_contours_task, tasks))
+            except (OSError, RuntimeError, pickle.PicklingError) as e:
+                print(f"⚠️ Параллельное упрощение недоступно ({e}), выполняется последовательно")
+            else:
+                return [contour for part in parts for contour in part]
+        
+        return simplify_polygons(contours, tolerance)
+    
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Получение статистики работы процессора"""
         return {
             'cache_size': len(self.processing_cache),
             'adjacency_cache_size': len(self.adjacency_cache),
+            'geometry_cache_size': len(self.calculator.geometry_cache),
             'tolerance': self.tolerance,
             'performance_stats': self.performance_monitor.get_performance_report()
         }
@@ -824,6 +1226,7 @@ class SpatialProcessor:
         self.processing_cache.clear()
         self.adjacency_cache.clear()
         self.calculator.calculation_cache.clear()
+        self.calculator.geometry_cache.clear()
         print("🧹 Кэш SpatialProcessor очищен")
 
 
@@ -14,12 +14,227 @@ Geometry Utils - базовые геометрические функции дл
 """
 
 import math
-from typing import List, Tuple, Optional, Union
+from array import array
+from typing import Iterable, List, Tuple, Optional, Sequence, Union
 
 # Константы для геометрических расчетов
 TOLERANCE = 1e-10  # Допуск для сравнения чисел с плавающей точкой
 MIN_POLYGON_AREA = 1e-6  # Минимальная площадь полигона (1 мм²)
 
+# Опциональная JIT-компиляция горячих примитивов (numba + numpy)
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+# Минимальный объем работы (вершин или вершин x точек), начиная с которого
+# преобразование списков в массивы окупается скоростью JIT-ядра
+JIT_MIN_WORK = 256
+
+# Опциональное C-расширение (Cython, см. _geomc.pyx) - используется для
+# любых размеров данных, так как накладные расходы на вызов минимальны
+try:
+    from . import _geomc
+    GEOMC_AVAILABLE = True
+except ImportError:
+    try:
+        import _geomc
+        GEOMC_AVAILABLE = True
+    except ImportError:
+        _geomc = None
+        GEOMC_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _jit_shoelace_moments(xs, ys):
+        """Удвоенная площадь и моменты первого порядка за один проход"""
+        n = xs.shape[0]
+        double_area = 0.0
+        mx = 0.0
+        my = 0.0
+        for i in range(n):
+            j = i + 1 if i + 1 < n else 0
+            cross = xs[i] * ys[j] - xs[j] * ys[i]
+            double_area += cross
+            mx += (xs[i] + xs[j]) * cross
+            my += (ys[i] + ys[j]) * cross
+        return double_area, mx, my
+
+    @njit(cache=True, parallel=True)
+    def _jit_points_in_polygon(pxs, pys, xi, yi, yj, dx, dy):
+        """Ray casting для пакета точек по подготовленной таблице ребер"""
+        m = pxs.shape[0]
+        inside = np.zeros(m, dtype=np.bool_)
+        for k in prange(m):
+            px = pxs[k]
+            py = pys[k]
+            flag = False
+            for e in range(xi.shape[0]):
+                if ((yi[e] > py) != (yj[e] > py)) and (px < dx[e] * (py - yi[e]) / dy[e] + xi[e]):
+                    flag = not flag
+            inside[k] = flag
+        return inside
+
+    @njit(cache=True)
+    def _jit_douglas_peucker(xs, ys, start, end, epsilon2):
+        """Итеративный алгоритм Дугласа-Пёкера: маска сохраняемых вершин диапазона [start, end]"""
+        keep = np.zeros(end - start + 1, dtype=np.bool_)
+        keep[0] = True
+        keep[end - start] = True
+        
+        # Ожидающие диапазоны не пересекаются, поэтому их не больше числа вершин
+        stack = np.empty(2 * (end - start + 1), dtype=np.int64)
+        stack[0] = start
+        stack[1] = end
+        top = 2
+        
+        while top > 0:
+            top -= 2
+            lo = stack[top]
+            hi = stack[top + 1]
+            if hi - lo < 2:
+                continue
+            
+            # Координаты могут храниться во float32 - арифметика ведется во float64
+            x1 = float(xs[lo])
+            y1 = float(ys[lo])
+            dx = float(xs[hi]) - x1
+            dy = float(ys[hi]) - y1
+            degenerate = abs(dx) < TOLERANCE and abs(dy) < TOLERANCE
+            length2 = dx * dx + dy * dy
+            
+            max_distance2 = 0.0
+            max_index = lo
+            for i in range(lo + 1, hi):
+                # Та же арифметика, что и в _dist2_point_to_line()
+                px = float(xs[i])
+                py = float(ys[i])
+                ex = px - x1
+                ey = py - y1
+                if not degenerate:
+                    t = (ex * dx + ey * dy) / length2
+                    t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+                    ex = px - (x1 + t * dx)
+                    ey = py - (y1 + t * dy)
+                distance2 = ex * ex + ey * ey
+                if distance2 != distance2:
+                    distance2 = np.inf
+                if distance2 > max_distance2:
+                    max_distance2 = distance2
+                    max_index = i
+            
+            if max_distance2 > epsilon2 and max_index > lo:
+                keep[max_index - start] = True
+                stack[top] = max_index
+                stack[top + 1] = hi
+                stack[top + 2] = lo
+                stack[top + 3] = max_index
+                top += 4
+        
+        return keep
+
+
+def _split_coordinates(points: List[Tuple[float, float]]) -> Optional[Tuple[List[float], List[float]]]:
+    """
+    Проверка точек и разделение координат по осям
+    
+    Returns:
+        Кортеж (xs, ys) или None, если хотя бы одна точка некорректна
+    """
+    xs = []
+    ys = []
+    isfinite = math.isfinite
+    try:
+        for x, y in points:
+            if not (isinstance(x, (int, float)) and isinstance(y, (int, float)) and
+                    isfinite(x) and isfinite(y)):
+                return None
+            xs.append(float(x))
+            ys.append(float(y))
+    except (TypeError, ValueError):
+        return None
+    return xs, ys
+
+
+# Варианты примитивов без проверок входных данных (*_fast). Принимают раздельные
+# последовательности координат (списки, array('d')), уже проверенные при загрузке
+# элемента, - например, буферы PolygonBuffer. Безопасные функции ниже проверяют
+# точки один раз и делегируют вычисления этим вариантам.
+
+def _double_array(values: Sequence[float]) -> array:
+    """Буфер array('d') для C-ядер (существующий буфер возвращается без копирования)"""
+    if isinstance(values, array) and values.typecode == 'd':
+        return values
+    return array('d', values)
+
+
+def polygon_area_fast(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Площадь со знаком по формуле шнурков (без проверок, без округления)"""
+    n = len(xs)
+    if n < 3:
+        return 0.0
+    
+    if GEOMC_AVAILABLE:
+        double_area, _, _ = _geomc.shoelace_moments(_double_array(xs), _double_array(ys))
+        return double_area / 2.0
+    
+    if NUMBA_AVAILABLE and n >= JIT_MIN_WORK:
+        double_area, _, _ = _jit_shoelace_moments(np.asarray(xs, dtype=np.float64),
+                                                  np.asarray(ys, dtype=np.float64))
+        return double_area / 2.0
+    
+    # x_i * y_(i+1) - x_(i+1) * y_i по всем ребрам, начиная с замыкающего
+    # (предыдущая вершина берется из сдвинутых копий осей)
+    xs_prev = xs[-1:] + xs[:-1]
+    ys_prev = ys[-1:] + ys[:-1]
+    return sum([x0 * y1 - x1 * y0 for x0, y0, x1, y1 in zip(xs_prev, ys_prev, xs, ys)]) / 2.0
+
+
+def centroid_fast(xs: Sequence[float], ys: Sequence[float]) -> Optional[Tuple[float, float]]:
+    """Центроид контура за один проход по ребрам (без проверок, без округления)"""
+    n = len(xs)
+    if n < 3:
+        return None
+    
+    if GEOMC_AVAILABLE:
+        double_area, cx, cy = _geomc.shoelace_moments(_double_array(xs), _double_array(ys))
+    elif NUMBA_AVAILABLE and n >= JIT_MIN_WORK:
+        double_area, cx, cy = _jit_shoelace_moments(np.asarray(xs, dtype=np.float64),
+                                                    np.asarray(ys, dtype=np.float64))
+    else:
+        # Удвоенная площадь и моменты первого порядка
+        double_area = 0.0
+        cx = 0.0
+        cy = 0.0
+        x0, y0 = xs[-1], ys[-1]
+        for x1, y1 in zip(xs, ys):
+            cross = x0 * y1 - x1 * y0
+            double_area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+            x0, y0 = x1, y1
+    
+    if not math.isfinite(double_area) or abs(double_area) < 2.0 * MIN_POLYGON_AREA:
+        # Для вырожденного полигона - среднее арифметическое точек
+        return (sum(xs) / n, sum(ys) / n)
+    
+    # Нормировка вне цикла: 6 * A = 3 * (2A)
+    area_factor = 3.0 * double_area
+    return (cx / area_factor, cy / area_factor)
+
+
+def bounds_fast(xs: Sequence[float], ys: Sequence[float]) -> Optional[Tuple[float, float, float, float]]:
+    """Габариты (min_x, min_y, max_x, max_y) встроенными редукциями (без проверок, без округления)"""
+    if not xs:
+        return None
+    return (min(xs), min(ys), max(xs), max(ys))
+
 
 def r2(value: float) -> float:
     """
@@ -41,10 +256,14 @@ def r2(value: float) -> float:
         >>> r2(0.009)
         0.01
     """
-    if not isinstance(value, (int, float)):
-        raise TypeError(f"Ожидается числовое значение, получено {type(value)}")
+    # Одна проверка isfinite заменяет isinstance + isnan + isinf:
+    # для нечисловых значений она сама возбуждает TypeError
+    try:
+        finite = math.isfinite(value)
+    except TypeError:
+        raise TypeError(f"Ожидается числовое значение, получено {type(value)}") from None
     
-    if math.isnan(value) or math.isinf(value):
+    if not finite:
         raise ValueError(f"Некорректное значение: {value}")
     
     return round(float(value), 2)
@@ -72,55 +291,16 @@ def centroid_xy(points: List[Tuple[float, float]]) -> Optional[Tuple[float, floa
     if not points or len(points) < 3:
         return None
     
-    # Проверяем корректность входных данных
-    try:
-        validated_points = []
-        for x, y in points:
-            if not (isinstance(x, (int, float)) and isinstance(y, (int, float))):
-                return None
-            if math.isnan(x) or math.isnan(y) or math.isinf(x) or math.isinf(y):
-                return None
-            validated_points.append((float(x), float(y)))
-        points = validated_points
-    except (TypeError, ValueError):
+    # Проверяем корректность входных данных (один раз для обоих вычислений)
+    coordinates = _split_coordinates(points)
+    if coordinates is None:
         return None
+    xs, ys = coordinates
     
-    # Вычисляем площадь полигона для проверки ориентации
-    area = polygon_area(points)
-    if abs(area) < MIN_POLYGON_AREA:
-        # Для вырожденного полигона возвращаем среднее арифметическое точек
-        n = len(points)
-        cx = sum(x for x, y in points) / n
-        cy = sum(y for x, y in points) / n
-        return (r2(cx), r2(cy))
-    
-    # Алгоритм вычисления центроида через интеграл
-    cx = 0.0
-    cy = 0.0
-    
-    # Добавляем замыкающую точку если её нет
-    if points[0] != points[-1]:
-        points = points + [points[0]]
-    
-    for i in range(len(points) - 1):
-        x_i, y_i = points[i]
-        x_next, y_next = points[i + 1]
-        
-        # Кросс-произведение для формулы центроида
-        cross = x_i * y_next - x_next * y_i
-        cx += (x_i + x_next) * cross
-        cy += (y_i + y_next) * cross
-    
-    # Нормализуем результат
-    area_factor = 6.0 * area
-    if abs(area_factor) < TOLERANCE:
-        # Избегаем деления на ноль
-        n = len(points) - 1  # Исключаем дублированную точку
-        cx = sum(x for x, y in points[:-1]) / n
-        cy = sum(y for x, y in points[:-1]) / n
-    else:
-        cx /= area_factor
-        cy /= area_factor
+    # Единый проход по ребрам: удвоенная площадь и моменты первого порядка.
+    # Ребра замыкаются по кругу, поэтому явная замыкающая точка не нужна
+    # (если она уже есть, соответствующее ребро вырождено и дает нулевой вклад)
+    cx, cy = centroid_fast(xs, ys)
     
     return (r2(cx), r2(cy))
 
@@ -147,32 +327,25 @@ def bounds(points: List[Tuple[float, float]]) -> Optional[Tuple[float, float, fl
     if not points:
         return None
     
-    # Проверяем и валидируем входные данные
-    valid_points = []
+    # Проверяем входные данные и раскладываем координаты по осям
+    xs = []
+    ys = []
+    isfinite = math.isfinite
     for point in points:
         try:
             x, y = point
-            if not (isinstance(x, (int, float)) and isinstance(y, (int, float))):
-                continue
-            if math.isnan(x) or math.isnan(y) or math.isinf(x) or math.isinf(y):
-                continue
-            valid_points.append((float(x), float(y)))
         except (TypeError, ValueError):
             continue
+        if (isinstance(x, (int, float)) and isinstance(y, (int, float)) and
+                isfinite(x) and isfinite(y)):
+            xs.append(x)
+            ys.append(y)
     
-    if not valid_points:
+    if not xs:
         return None
     
-    # Находим минимальные и максимальные координаты
-    min_x = min_y = float('inf')
-    max_x = max_y = float('-inf')
-    
-    for x, y in valid_points:
-        min_x = min(min_x, x)
-        max_x = max(max_x, x)
-        min_y = min(min_y, y)
-        max_y = max(max_y, y)
-    
+    # Минимумы и максимумы - встроенными редукциями по каждой оси
+    min_x, min_y, max_x, max_y = bounds_fast(xs, ys)
     return (r2(min_x), r2(min_y), r2(max_x), r2(max_y))
 
 
@@ -199,28 +372,13 @@ def polygon_area(points: List[Tuple[float, float]]) -> float:
         return 0.0
     
     # Проверяем корректность входных данных
-    try:
-        validated_points = []
-        for x, y in points:
-            if not (isinstance(x, (int, float)) and isinstance(y, (int, float))):
-                return 0.0
-            if math.isnan(x) or math.isnan(y) or math.isinf(x) or math.isinf(y):
-                return 0.0
-            validated_points.append((float(x), float(y)))
-        points = validated_points
-    except (TypeError, ValueError):
+    coordinates = _split_coordinates(points)
+    if coordinates is None:
         return 0.0
+    xs, ys = coordinates
     
-    # Применяем формулу шнурков
-    area = 0.0
-    n = len(points)
-    
-    for i in range(n):
-        j = (i + 1) % n  # Следующая точка с замыканием
-        area += points[i][0] * points[j][1]  # x_i * y_(i+1)
-        area -= points[j][0] * points[i][1]  # x_(i+1) * y_i
-    
-    return area / 2.0
+    # Применяем формулу шнурков к уже проверенным координатам
+    return polygon_area_fast(xs, ys)
 
 
 def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
@@ -245,38 +403,166 @@ def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, floa
         >>> point_in_polygon((3, 1), square)
         False
     """
+    return points_in_polygon([point], polygon)[0]
+
+
+def _ray_casting_edges(polygon: List[Tuple[float, float]]) -> List[Tuple[float, float, float, float, float]]:
+    """
+    Подготовка таблицы ребер полигона для алгоритма ray casting
+    
+    Некорректные вершины пропускаются, горизонтальные ребра отбрасываются
+    сразу: луч вдоль оси X их никогда не пересекает.
+    
+    Returns:
+        Список кортежей (xi, yi, yj, xj - xi, yj - yi) для каждого ребра
+    """
+    vertices = []
+    for vertex in polygon:
+        try:
+            x, y = vertex
+        except (TypeError, ValueError):
+            continue
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            vertices.append((x, y))
+    
+    edges = []
+    if len(vertices) < 3:
+        return edges
+    
+    xj, yj = vertices[-1]
+    for xi, yi in vertices:
+        if yi != yj:
+            edges.append((xi, yi, yj, xj - xi, yj - yi))
+        xj, yj = xi, yi
+    return edges
+
+
+def points_in_polygon(points: List[Tuple[float, float]], 
+                      polygon: List[Tuple[float, float]]) -> List[bool]:
+    """
+    Пакетная проверка принадлежности точек полигону (ray casting algorithm)
+    
+    Таблица ребер и габарит полигона по Y строятся один раз на весь пакет,
+    поэтому для множества точек это заметно быстрее повторных вызовов
+    point_in_polygon().
+    
+    Args:
+        points: Список проверяемых точек [(x, y), ...]
+        polygon: Список точек полигона [(x, y), ...]
+        
+    Returns:
+        Список флагов (True - точка внутри) в порядке входных точек
+        
+    Example:
+        >>> square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+        >>> points_in_polygon([(1, 1), (3, 1)], square)
+        [True, False]
+    """
+    if not points:
+        return []
     if not polygon or len(polygon) < 3:
-        return False
+        return [False] * len(points)
     
-    try:
-        px, py = point
-        if math.isnan(px) or math.isnan(py) or math.isinf(px) or math.isinf(py):
-            return False
-    except (TypeError, ValueError):
-        return False
+    edges = _ray_casting_edges(polygon)
+    if not edges:
+        return [False] * len(points)
+    
+    # Габарит по Y: точки вне него не пересекают ни одного ребра
+    y_min = min(min(yi, yj) for _, yi, yj, _, _ in edges)
+    y_max = max(max(yi, yj) for _, yi, yj, _, _ in edges)
     
-    # Алгоритм ray casting
-    inside = False
-    n = len(polygon)
+    if GEOMC_AVAILABLE:
+        return _points_in_polygon_c(points, edges, y_min, y_max)
     
-    # Предыдущая точка для начала алгоритма
-    j = n - 1
+    if NUMBA_AVAILABLE and len(points) * len(edges) >= JIT_MIN_WORK:
+        return _points_in_polygon_jit(points, edges, y_min, y_max)
     
-    for i in range(n):
+    results = []
+    isfinite = math.isfinite
+    for point in points:
         try:
-            xi, yi = polygon[i]
-            xj, yj = polygon[j]
-            
-            # Проверяем пересечение луча с ребром полигона
-            if ((yi > py) != (yj > py)) and \
-               (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
-                inside = not inside
-            
-            j = i
-        except (TypeError, ValueError, ZeroDivisionError):
+            px, py = point
+            if not (isfinite(px) and isfinite(py)):
+                results.append(False)
+                continue
+        except (TypeError, ValueError):
+            results.append(False)
+            continue
+        
+        if py < y_min or py > y_max:
+            results.append(False)
             continue
+        
+        # Подсчет пересечений луча вправо от точки с ребрами полигона
+        inside = False
+        for xi, yi, yj, dx, dy in edges:
+            if ((yi > py) != (yj > py)) and (px < dx * (py - yi) / dy + xi):
+                inside = not inside
+        results.append(inside)
+    
+    return results
+
+
+def _ray_casting_candidates(points: List[Tuple[float, float]],
+                            y_min: float, y_max: float) -> Tuple[List[int], List[float], List[float]]:
+    """
+    Отбор точек для передачи в ядро ray casting
+    
+    Некорректные точки и точки вне габарита по Y отсекаются на стороне Python,
+    в ядро передаются только кандидаты.
     
-    return inside
+    Returns:
+        Кортеж (индексы кандидатов, их X-координаты, их Y-координаты)
+    """
+    indices = []
+    pxs = []
+    pys = []
+    isfinite = math.isfinite
+    for index, point in enumerate(points):
+        try:
+            px, py = point
+            if not (isfinite(px) and isfinite(py)) or py < y_min or py > y_max:
+                continue
+        except (TypeError, ValueError):
+            continue
+        indices.append(index)
+        pxs.append(px)
+        pys.append(py)
+    return indices, pxs, pys
+
+
+def _points_in_polygon_c(points: List[Tuple[float, float]],
+                         edges: List[Tuple[float, float, float, float, float]],
+                         y_min: float, y_max: float) -> List[bool]:
+    """Пакетный ray casting через C-ядро (используется при наличии _geomc)"""
+    results = [False] * len(points)
+    indices, pxs, pys = _ray_casting_candidates(points, y_min, y_max)
+    
+    if indices:
+        columns = [array('d', column) for column in zip(*edges)]
+        inside = bytearray(len(indices))
+        _geomc.points_in_polygon(array('d', pxs), array('d', pys), *columns, inside)
+        for index, flag in zip(indices, inside):
+            results[index] = bool(flag)
+    
+    return results
+
+
+def _points_in_polygon_jit(points: List[Tuple[float, float]],
+                           edges: List[Tuple[float, float, float, float, float]],
+                           y_min: float, y_max: float) -> List[bool]:
+    """Пакетный ray casting через JIT-ядро (используется при наличии numba)"""
+    results = [False] * len(points)
+    indices, pxs, pys = _ray_casting_candidates(points, y_min, y_max)
+    
+    if indices:
+        xi, yi, yj, dx, dy = (np.array(column, dtype=np.float64) for column in zip(*edges))
+        inside = _jit_points_in_polygon(np.array(pxs, dtype=np.float64), np.array(pys, dtype=np.float64),
+                                        xi, yi, yj, dx, dy)
+        for index, flag in zip(indices, inside.tolist()):
+            results[index] = flag
+    
+    return results
 
 
 def distance_point_to_line(point: Tuple[float, float], 
@@ -313,7 +599,7 @@ def distance_point_to_line(point: Tuple[float, float],
         
         # Если отрезок вырожден в точку
         if abs(x2 - x1) < TOLERANCE and abs(y2 - y1) < TOLERANCE:
-            return math.sqrt((px - x1)**2 + (py - y1)**2)
+            return math.hypot(px - x1, py - y1)
         
         # Вычисляем параметр t для ближайшей точки на прямой
         dx = x2 - x1
@@ -321,14 +607,14 @@ def distance_point_to_line(point: Tuple[float, float],
         t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
         
         # Ограничиваем t отрезком [0, 1]
-        t = max(0, min(1, t))
+        t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
         
         # Находим ближайшую точку на отрезке
         closest_x = x1 + t * dx
         closest_y = y1 + t * dy
         
         # Вычисляем расстояние
-        return math.sqrt((px - closest_x)**2 + (py - closest_y)**2)
+        return math.hypot(px - closest_x, py - closest_y)
         
     except (TypeError, ValueError, ZeroDivisionError):
         return float('inf')
@@ -352,32 +638,212 @@ def line_intersection(line1_start: Tuple[float, float], line1_end: Tuple[float,
     Returns:
         Координаты точки пересечения (x, y) или None если отрезки не пересекаются
     """
-    try:
-        x1, y1 = line1_start
-        x2, y2 = line1_end
-        x3, y3 = line2_start
-        x4, y4 = line2_end
+    return line_intersections_batch((line1_start,), (line1_end,), (line2_start,), (line2_end,))[0]
+
+
+def line_intersections_batch(starts1: Iterable[Tuple[float, float]], ends1: Iterable[Tuple[float, float]],
+                             starts2: Iterable[Tuple[float, float]], 
+                             ends2: Iterable[Tuple[float, float]]) -> List[Optional[Tuple[float, float]]]:
+    """
+    Пакетный поиск точек пересечения пар отрезков
+    
+    i-я пара образована отрезками (starts1[i], ends1[i]) и (starts2[i], ends2[i]).
+    Последовательности обходятся одним циклом без вызова функции на каждую пару;
+    обход останавливается на самой короткой из них, поэтому для проверки одного
+    отрезка против многих можно передать itertools.repeat().
+    
+    Returns:
+        Список точек пересечения (x, y) или None для каждой пары
+    """
+    results = []
+    append = results.append
+    
+    for line1_start, line1_end, line2_start, line2_end in zip(starts1, ends1, starts2, ends2):
+        try:
+            x1, y1 = line1_start
+            x2, y2 = line1_end
+            x3, y3 = line2_start
+            x4, y4 = line2_end
+            
+            # Вычисляем определитель системы
+            dx12 = x1 - x2
+            dy12 = y1 - y2
+            dx34 = x3 - x4
+            dy34 = y3 - y4
+            denom = dx12 * dy34 - dy12 * dx34
+            
+            if abs(denom) < TOLERANCE:
+                append(None)  # Прямые параллельны или совпадают
+                continue
+            
+            # Вычисляем параметры пересечения
+            dx13 = x1 - x3
+            dy13 = y1 - y3
+            t = (dx13 * dy34 - dy13 * dx34) / denom
+            u = -(dx12 * dy13 - dy12 * dx13) / denom
+            
+            # Проверяем, что пересечение внутри обоих отрезков
+            if 0 <= t <= 1 and 0 <= u <= 1:
+                append((r2(x1 + t * (x2 - x1)), r2(y1 + t * (y2 - y1))))
+            else:
+                append(None)
+                
+        except (TypeError, ValueError, ZeroDivisionError):
+            append(None)
+    
+    return results
+
+
+def _dist2_point_to_line(px: float, py: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Квадрат расстояния от точки до отрезка
+    
+    Вариант distance_point_to_line() без извлечения корня и проверок входных
+    данных - для внутренних циклов, где расстояние только сравнивается с допуском.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    
+    # Если отрезок вырожден в точку
+    if abs(dx) < TOLERANCE and abs(dy) < TOLERANCE:
+        ex = px - x1
+        ey = py - y1
+        return ex * ex + ey * ey
+    
+    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
+    t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+    
+    ex = px - (x1 + t * dx)
+    ey = py - (y1 + t * dy)
+    return ex * ex + ey * ey
+
+
+def _douglas_peucker_indices(xs: Sequence[float], ys: Sequence[float],
+                             start: int, end: int, epsilon: float) -> List[int]:
+    """
+    Итеративный алгоритм Дугласа-Пёкера на плоских массивах координат
+    
+    Обрабатывает диапазон вершин [start, end] общего буфера координат,
+    используя стек диапазонов индексов и флаги сохраняемых вершин.
+    
+    Returns:
+        Отсортированные абсолютные индексы сохраняемых вершин
+    """
+    if end - start < 2:
+        return list(range(start, end + 1))
+    
+    keep = bytearray(end - start + 1)
+    keep[0] = keep[-1] = 1
+    stack = [(start, end)]
+    
+    # Сравниваем квадраты расстояний (отрицательный допуск оставляем как есть)
+    epsilon2 = epsilon * epsilon if epsilon > 0 else epsilon
+    inf = float('inf')
+    
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
         
-        # Вычисляем определитель системы
-        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+        # Находим точку с максимальным расстоянием до отрезка между концами диапазона
+        x1 = xs[lo]
+        y1 = ys[lo]
+        x2 = xs[hi]
+        y2 = ys[hi]
+        max_distance2 = 0
+        max_index = lo
+        
+        for i in range(lo + 1, hi):
+            distance2 = _dist2_point_to_line(xs[i], ys[i], x1, y1, x2, y2)
+            if distance2 != distance2:
+                # NaN-координаты, как и в distance_point_to_line(), дают бесконечность
+                distance2 = inf
+            if distance2 > max_distance2:
+                max_distance2 = distance2
+                max_index = i
         
-        if abs(denom) < TOLERANCE:
-            return None  # Прямые параллельны или совпадают
+        # Если максимальное расстояние больше допуска, разбиваем диапазон
+        if max_distance2 > epsilon2 and max_index > lo:
+            keep[max_index - start] = 1
+            stack.append((max_index, hi))
+            stack.append((lo, max_index))
+    
+    return [start + offset for offset, kept in enumerate(keep) if kept]
+
+
+def simplify_polygons(contours: List[List[Tuple[float, float]]], 
+                      tolerance: float = 0.01) -> List[List[Tuple[float, float]]]:
+    """
+    Пакетное упрощение контуров алгоритмом Дугласа-Пёкера
+    
+    Координаты всех контуров собираются в общие плоские массивы xs/ys
+    со смещениями, после чего каждый контур упрощается на своем диапазоне.
+    Результат составляется из исходных объектов точек.
+    
+    Массивы хранятся во float32 (вдвое меньше памяти), а координаты в них
+    отсчитываются от первой вершины своего контура: для помещений размером
+    до сотен метров это сохраняет точность порядка микрометров даже при
+    больших абсолютных координатах. Расстояния вычисляются во float64.
+    
+    Args:
+        contours: Список контуров [[(x, y), ...], ...]
+        tolerance: Допустимое отклонение от исходной формы (в метрах)
         
-        # Вычисляем параметры пересечения
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-        u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denom
+    Returns:
+        Список упрощенных замкнутых контуров в порядке входных данных
+    """
+    results = []
+    pending = []  # (позиция результата, замкнутый контур, смещение в буфере)
+    xs = array('f')
+    ys = array('f')
+    epsilon2 = tolerance * tolerance if tolerance > 0 else tolerance
+    
+    for points in contours:
+        if len(points) <= 2:
+            results.append(list(points))
+            continue
         
-        # Проверяем, что пересечение внутри обоих отрезков
-        if 0 <= t <= 1 and 0 <= u <= 1:
-            intersection_x = x1 + t * (x2 - x1)
-            intersection_y = y1 + t * (y2 - y1)
-            return (r2(intersection_x), r2(intersection_y))
+        # Замыкаем полигон перед упрощением
+        ring = points if points[0] == points[-1] else list(points) + [points[0]]
         
-        return None
+        offset = len(xs)
+        try:
+            origin_x = ring[0][0]
+            origin_y = ring[0][1]
+            xs.extend([point[0] - origin_x for point in ring])
+            ys.extend([point[1] - origin_y for point in ring])
+        except (TypeError, ValueError, IndexError):
+            # Нечисловые координаты: контур возвращается без упрощения
+            del xs[offset:]
+            del ys[offset:]
+            results.append(list(ring))
+            continue
         
-    except (TypeError, ValueError, ZeroDivisionError):
-        return None
+        pending.append((len(results), ring, offset))
+        results.append(None)
+    
+    if GEOMC_AVAILABLE:
+        # C-ядро работает с буферами array('f') напрямую
+        for position, ring, offset in pending:
+            keep = bytearray(len(ring))
+            _geomc.douglas_peucker(xs, ys, offset, offset + len(ring) - 1, epsilon2, TOLERANCE, keep)
+            results[position] = [point for point, kept in zip(ring, keep) if kept]
+        return results
+    
+    if NUMBA_AVAILABLE and len(xs) >= JIT_MIN_WORK:
+        # Буферы array('f') передаются в JIT-ядро без копирования
+        xs_view = np.frombuffer(xs, dtype=np.float32)
+        ys_view = np.frombuffer(ys, dtype=np.float32)
+        for position, ring, offset in pending:
+            keep = _jit_douglas_peucker(xs_view, ys_view, offset, offset + len(ring) - 1, epsilon2)
+            results[position] = [point for point, kept in zip(ring, keep.tolist()) if kept]
+        return results
+    
+    for position, ring, offset in pending:
+        kept = _douglas_peucker_indices(xs, ys, offset, offset + len(ring) - 1, tolerance)
+        results[position] = [ring[index - offset] for index in kept]
+    
+    return results
 
 
 def simplify_polygon(points: List[Tuple[float, float]], tolerance: float = 0.01) -> List[Tuple[float, float]]:
@@ -395,45 +861,4 @@ def simplify_polygon(points: List[Tuple[float, float]], tolerance: float = 0.01)
     Returns:
         Упрощенный список точек
     """
-    if len(points) <= 2:
-        return points.copy()
-    
-    def douglas_peucker(points_segment: List[Tuple[float, float]], epsilon: float) -> List[Tuple[float, float]]:
-        """Рекурсивная реализация алгоритма Дугласа-Пёкера"""
-        if len(points_segment) <= 2:
-            return points_segment
-        
-        # Находим точку с максимальным расстоянием до прямой между первой и последней точками
-        max_distance = 0
-        max_index = 0
-        
-        for i in range(1, len(points_segment) - 1):
-            distance = distance_point_to_line(points_segment[i], points_segment[0], points_segment[-1])
-            if distance > max_distance:
-                max_distance = distance
-                max_index = i
-        
-        # Если максимальное расстояние больше допуска, разбиваем сегмент
-        if max_distance > epsilon:
-            # Рекурсивно упрощаем левую и правую части
-            left_result = douglas_peucker(points_segment[:max_index + 1], epsilon)
-            right_result = douglas_peucker(points_segment[max_index:], epsilon)
-            
-            # Объединяем результаты, избегая дублирования средней точки
-            return left_result[:-1] + right_result
-        else:
-            # Возвращаем только концевые точки
-            return [points_segment[0], points_segment[-1]]
-    
-    # Применяем алгоритм к замкнутому полигону
-    if points[0] == points[-1]:
-        # Полигон уже замкнут
-        simplified = douglas_peucker(points, tolerance)
-        if simplified[0] != simplified[-1]:
-            simplified.append(simplified[0])  # Замыкаем полигон
-    else:
-        # Замыкаем полигон перед упрощением
-        closed_points = points + [points[0]]
-        simplified = douglas_peucker(closed_points, tolerance)
-        
-    return simplified
\ No newline at end of file
+    return simplify_polygons([points], tolerance)[0]
\ No newline at end of file
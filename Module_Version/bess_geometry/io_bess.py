@@ -9,7 +9,56 @@ io_bess.py - Базовый модуль для чтения/записи BESS 
 """
 
 import json
-from typing import Dict, List, Tuple, Any
+import mmap
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, List, Tuple, Any, Union, Iterator, Optional, TypedDict
+
+# orjson - необязательный быстрый (C/Rust) кодек JSON; без него работает stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# msgspec - необязательный типизированный декодер: разбор и проверка схемы за один проход в C
+try:
+    import msgspec
+    from msgspec import UNSET, UnsetType
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+# ijson - необязательный потоковый парсер для очень больших файлов
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+# simdjson (pysimdjson) - необязательный SIMD-парсер с ленивым доступом к полям
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    simdjson = None
+    SIMDJSON_AVAILABLE = False
+
+# Файлы от этого размера разбираются потоково: в памяти одновременно
+# находится только один исходный элемент, а не все дерево JSON
+STREAMING_MIN_BYTES = 512 * 1024 * 1024
+
+# Разделы rooms/areas/openings/shafts разбираются в отдельных потоках только
+# в сборках CPython без GIL: под GIL построение словарей в потоках идет по очереди
+PARALLEL_EXTRACT = not getattr(sys, "_is_gil_enabled", lambda: True)()
+PARALLEL_EXTRACT_MIN_ELEMENTS = 5000
 
 # Константы для преобразования единиц
 FT_TO_M = 0.3048
@@ -18,12 +67,126 @@ FT2_TO_M2 = FT_TO_M * FT_TO_M
 
 def r2(x):
     """Округление до 2 знаков после запятой"""
+    # Координаты из JSON почти всегда уже float - обходимся без float()
+    if type(x) is float:
+        return round(x, 2)
     try:
         return round(float(x), 2)
     except (TypeError, ValueError):
         return 0.0
 
 
+# Дополнительные свойства элемента, переносимые в нормализованный формат
+ELEMENT_EXTRA_KEYS = ("area", "area_m2", "volume", "height", "category", "type", "function")
+
+# Поля верхнего уровня, нужные для метаданных и уровней
+HEADER_KEYS = ("version", "timestamp", "source", "project", "filters", "levels")
+
+# Разделы файла с элементами
+ELEMENT_SECTIONS = ("rooms", "areas", "openings", "shafts")
+
+# Поля исходного элемента, которые читает _normalize_element
+ELEMENT_SOURCE_KEYS = ("id", "name", "outer_xy_m", "contour", "geometry", "inner_loops_xy_m", "holes",
+                       "params", "level", "BESS_level") + ELEMENT_EXTRA_KEYS
+
+# Разделы с элементами: префикс ijson -> (раздел, имя по умолчанию, тип, подпись в сообщениях)
+STREAM_SECTIONS = {
+    "rooms.item": ("rooms", "Room", "room", "помещения"),
+    "areas.item": ("areas", "Area", "area", "области"),
+    "openings.item": ("openings", "Opening", "opening", "отверстия"),
+    "shafts.item": ("shafts", "Shaft", "shaft", "шахты"),
+}
+
+# JSON Lines: первая строка - заголовок, далее по одному элементу на строку,
+# раздел элемента определяется его element_type
+JSONL_SUFFIX = ".jsonl"
+JSONL_HEADER_TYPE = "header"
+JSONL_SECTIONS = {element_type: (section, name_prefix, label)
+                  for section, name_prefix, element_type, label in STREAM_SECTIONS.values()}
+
+
+class Element(TypedDict, total=False):
+    """
+    Нормализованный элемент BESS
+    
+    Остается обычным dict: элементы копируются AppState, дополняются
+    контроллерами и сериализуются при сохранении по ключам.
+    """
+    id: Any
+    name: Any
+    element_type: str                           # room / area / opening / shaft
+    outer_xy_m: List[List[float]]               # Внешний контур [[x, y], ...] в метрах
+    inner_loops_xy_m: List[List[List[float]]]   # Внутренние контуры (отверстия)
+    params: Dict[str, Any]                      # Параметры Revit, включая BESS_level
+    area: Any
+    area_m2: Any
+    volume: Any
+    height: Any
+    category: Any
+    type: Any
+    function: Any
+
+
+class RoundedPolygon(list):
+    """
+    Контур [[x, y], ...], координаты которого уже округлены до 2 знаков
+    
+    Так помечаются контуры, созданные при загрузке: при сохранении они
+    записываются без повторного округления. Пометка привязана к самому
+    списку, поэтому замена контура элемента новым списком (или срез)
+    ее снимает, а deepcopy в AppState сохраняет.
+    """
+    __slots__ = ()
+
+
+if MSGSPEC_AVAILABLE:
+    XYPolygon = List[List[float]]
+    # Уровень служит ключом группировки шахт, поэтому допускаются только скаляры
+    LevelName = Union[str, int, float, bool, None, UnsetType]
+
+    class BessElement(msgspec.Struct):
+        """Элемент BESS в каноническом формате (неизвестные поля пропускаются декодером)"""
+        id: Any = UNSET
+        name: Any = UNSET
+        outer_xy_m: Union[XYPolygon, UnsetType] = UNSET
+        contour: Union[XYPolygon, UnsetType] = UNSET
+        geometry: Union[XYPolygon, UnsetType] = UNSET
+        inner_loops_xy_m: Union[List[XYPolygon], UnsetType] = UNSET
+        holes: Union[List[XYPolygon], UnsetType] = UNSET
+        params: Dict[str, Any] = {}
+        level: LevelName = UNSET
+        BESS_level: LevelName = UNSET
+        area: Any = UNSET
+        area_m2: Any = UNSET
+        volume: Any = UNSET
+        height: Any = UNSET
+        category: Any = UNSET
+        type: Any = UNSET
+        function: Any = UNSET
+
+    class BessFile(msgspec.Struct):
+        """Файл BESS экспорта в каноническом формате"""
+        version: Any = UNSET
+        timestamp: Any = UNSET
+        source: Any = UNSET
+        project: Any = UNSET
+        filters: Any = UNSET
+        levels: Any = UNSET
+        rooms: List[BessElement] = []
+        areas: List[BessElement] = []
+        openings: List[BessElement] = []
+        shafts: List[BessElement] = []
+
+    _BESS_DECODER = msgspec.json.Decoder(BessFile)
+
+# Парсер simdjson переиспользует внутренние буферы между файлами
+if SIMDJSON_AVAILABLE:
+    _SIMDJSON_PARSER = simdjson.Parser()
+
+# Кодировщик stdlib для сохранения (json.dump создает новый на каждый вызов)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
 def load_bess_export(path: str) -> Tuple[Dict, Dict, List, List, List, Dict]:
     """
     Загрузка BESS экспорта из JSON файла
@@ -39,22 +202,54 @@ def load_bess_export(path: str) -> Tuple[Dict, Dict, List, List, List, Dict]:
     print(f"📥 Загрузка BESS файла: {path}")
     
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        file_size = os.path.getsize(path)
         
-        print(f"✅ JSON файл загружен, размер: {len(str(data))} символов")
+        if path.endswith(JSONL_SUFFIX):
+            meta, levels, rooms, areas, openings, shafts = _load_jsonl(path)
+            print(f"📊 Извлечено: {len(rooms)} помещений, {len(areas)} областей, {len(openings)} отверстий")
+            return meta, levels, rooms, areas, openings, shafts
         
-        # Извлекаем метаданные
-        meta = _extract_metadata(data)
+        if IJSON_AVAILABLE and file_size >= STREAMING_MIN_BYTES:
+            print(f"🌊 Потоковый разбор большого файла: {file_size} байт")
+            try:
+                meta, levels, rooms, areas, openings, shafts = _stream_bess_export(path)
+                print(f"📊 Извлечено: {len(rooms)} помещений, {len(areas)} областей, {len(openings)} отверстий")
+                return meta, levels, rooms, areas, openings, shafts
+            except ijson.JSONError as e:
+                # ijson не принимает NaN/Infinity - разбираем файл целиком
+                print(f"⚠️ Потоковый разбор не удался ({e}), файл читается целиком")
         
-        # Извлекаем уровни
-        levels = _extract_levels(data)
+        # Разбор идет прямо по отображенному в память файлу, без копии в bytes
+        with _map_file(path) as raw:
+            document = _decode_bess_document(raw) if MSGSPEC_AVAILABLE else None
+            
+            # Основной объем файла - params, которые нужны целиком, поэтому
+            # orjson быстрее ленивого simdjson; simdjson заменяет только stdlib json
+            data = None
+            if document is None and SIMDJSON_AVAILABLE and not ORJSON_AVAILABLE:
+                data = _parse_lazy(raw)
+            lazy = data is not None
+            
+            if document is None and data is None:
+                data = _decode_json(raw)
         
-        # Извлекаем элементы
-        rooms = _extract_rooms(data)
-        areas = _extract_areas(data)
-        openings = _extract_openings(data)
-        shafts = _extract_shafts(data)
+        if document is not None:
+            print(f"✅ JSON файл загружен по схеме BESS, размер: {file_size} байт")
+            meta, levels, rooms, areas, openings, shafts = _extract_document(document)
+        else:
+            if lazy:
+                print(f"✅ JSON файл загружен (simdjson), размер: {file_size} байт")
+            else:
+                print(f"✅ JSON файл загружен, размер: {file_size} байт")
+            
+            # Извлекаем метаданные
+            meta = _extract_metadata(data)
+            
+            # Извлекаем уровни
+            levels = _extract_levels(data)
+            
+            # Извлекаем элементы
+            rooms, areas, openings, shafts = _extract_sections(data)
         
         print(f"📊 Извлечено: {len(rooms)} помещений, {len(areas)} областей, {len(openings)} отверстий")
         
@@ -68,6 +263,306 @@ def load_bess_export(path: str) -> Tuple[Dict, Dict, List, List, List, Dict]:
         raise Exception(f"Ошибка загрузки BESS файла: {e}")
 
 
+@contextmanager
+def _map_file(path: str) -> Iterator[Union[bytes, memoryview]]:
+    """
+    Содержимое файла только для чтения
+    
+    Обычные файлы отображаются в память (mmap): страницы подгружаются ядром по
+    мере разбора, без копирования всего файла в bytes. Пустые файлы и файлы,
+    которые нельзя отобразить (каналы, некоторые ФС), читаются целиком.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mapped = None
+        if mapped is None:
+            yield f.read()
+            return
+    
+    with mapped:
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            # Отображение закрывается только после освобождения всех буферов
+            view.release()
+
+
+def _decode_json(raw: Union[bytes, memoryview]) -> Any:
+    """Универсальный разбор JSON (orjson, если доступен, иначе stdlib json)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson строже stdlib (NaN/Infinity, BOM) - повторяем разбор через json
+            pass
+    # json.loads принимает только str/bytes
+    return json.loads(raw if isinstance(raw, bytes) else bytes(raw))
+
+
+def _parse_lazy(raw: Union[bytes, memoryview]):
+    """
+    Разбор через simdjson с материализацией только используемых полей
+    
+    simdjson строит документ без создания Python-объектов; в dict/list
+    превращаются лишь HEADER_KEYS и ELEMENT_SOURCE_KEYS элементов, а
+    остальное (контуры в футах, loops, unique_id и т.п.) не создается.
+    
+    Returns:
+        Облегченный dict того же формата для _extract_* или None
+        (некорректный JSON, NaN/Infinity или корень не объект)
+    """
+    try:
+        document = _SIMDJSON_PARSER.parse(bytes(raw))
+    except ValueError:
+        return None
+    
+    if not isinstance(document, simdjson.Object):
+        return None
+    
+    data = {key: _materialize(document[key]) for key in HEADER_KEYS if key in document}
+    
+    for section in ELEMENT_SECTIONS:
+        if section not in document:
+            continue
+        items = document[section]
+        if isinstance(items, simdjson.Array):
+            data[section] = [
+                {key: _materialize(item[key]) for key in ELEMENT_SOURCE_KEYS if key in item}
+                if isinstance(item, simdjson.Object) else _materialize(item)
+                for item in items
+            ]
+        else:
+            data[section] = _materialize(items)
+    
+    return data
+
+
+def _materialize(value):
+    """Преобразование значения simdjson в обычные dict/list"""
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _decode_bess_document(raw: bytes):
+    """
+    Типизированный разбор файла по схеме BessFile
+    
+    Returns:
+        BessFile или None, если файл не соответствует канонической схеме
+        (тогда используется универсальный разбор с поэлементной нормализацией)
+    """
+    try:
+        return _BESS_DECODER.decode(raw)
+    except msgspec.DecodeError:
+        return None
+
+
+def _extract_document(document) -> Tuple[Dict, Dict, List, List, List, Dict]:
+    """Извлечение данных из провалидированного BessFile"""
+    header = {}
+    for key in HEADER_KEYS:
+        value = getattr(document, key)
+        if value is not UNSET:
+            header[key] = value
+    
+    meta = _extract_metadata(header)
+    levels = _extract_levels(header)
+    
+    rooms = [room for i, item in enumerate(document.rooms)
+             if (room := _element_from_struct(item, f"Room_{i+1}", "room"))]
+    areas = [area for i, item in enumerate(document.areas)
+             if (area := _element_from_struct(item, f"Area_{i+1}", "area"))]
+    openings = [opening for i, item in enumerate(document.openings)
+                if (opening := _element_from_struct(item, f"Opening_{i+1}", "opening"))]
+    
+    shafts = [shaft for i, item in enumerate(document.shafts)
+              if (shaft := _element_from_struct(item, f"Shaft_{i+1}", "shaft"))]
+    
+    return meta, levels, rooms, areas, openings, _group_shafts(shafts)
+
+
+def _element_from_struct(item, default_name: str, element_type: str) -> Optional[Element]:
+    """
+    Нормализация элемента BessElement (аналог _normalize_element для типизированных данных)
+    
+    Координаты уже проверены декодером как числа, поэтому округляются напрямую.
+    """
+    outer = item.outer_xy_m
+    if outer is UNSET:
+        outer = item.contour if item.contour is not UNSET else item.geometry
+    inner_loops = item.inner_loops_xy_m if item.inner_loops_xy_m is not UNSET else item.holes
+    
+    level = item.level
+    if level is UNSET:
+        level = item.BESS_level if item.BESS_level is not UNSET else "Level 1"
+    
+    element = {
+        "id": default_name if item.id is UNSET else item.id,
+        "name": default_name if item.name is UNSET else item.name,
+        "element_type": element_type,
+        "outer_xy_m": _round_xy_polygon(outer) if outer is not UNSET else [],
+        "inner_loops_xy_m": [_round_xy_polygon(loop) for loop in inner_loops]
+                            if inner_loops is not UNSET else [],
+        "params": item.params
+    }
+    element["params"]["BESS_level"] = level
+    
+    for key in ELEMENT_EXTRA_KEYS:
+        value = getattr(item, key)
+        if value is not UNSET:
+            element[key] = value
+    
+    if len(element["outer_xy_m"]) < 3:
+        print(f"⚠️ Элемент {element['id']} имеет недостаточно точек для отрисовки")
+        return None
+    
+    return element
+
+
+def _round_xy_polygon(polygon: List[List[float]]) -> List[List[float]]:
+    """Округление проверенного полигона из чисел (точки короче 2 координат пропускаются)"""
+    return RoundedPolygon([[round(point[0], 2), round(point[1], 2)] for point in polygon if len(point) >= 2])
+
+
+def _stream_bess_export(path: str) -> Tuple[Dict, Dict, List, List, List, Dict]:
+    """
+    Потоковое чтение BESS файла через ijson за один проход
+    
+    Каждый элемент rooms/areas/openings/shafts собирается из событий парсера,
+    сразу нормализуется и освобождается; из остальных полей верхнего уровня
+    строятся только HEADER_KEYS. Пиковая память - O(одного элемента).
+    """
+    header = {}
+    sections = {"rooms": [], "areas": [], "openings": [], "shafts": []}
+    counters = dict.fromkeys(sections, 0)
+    header_prefixes = set(HEADER_KEYS)
+    
+    def handle(prefix, value):
+        if prefix in header_prefixes:
+            header[prefix] = value
+            return
+        
+        section, name_prefix, element_type, label = STREAM_SECTIONS[prefix]
+        index = counters[section]
+        counters[section] = index + 1
+        try:
+            element = _normalize_element(value, f"{name_prefix}_{index+1}", element_type)
+            if element:
+                sections[section].append(element)
+        except Exception as e:
+            print(f"⚠️ Ошибка обработки {label} {index}: {e}")
+    
+    builder = None
+    current = None
+    
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                # Собственные start/end события значения имеют ровно его префикс
+                if prefix == current and event in ("end_map", "end_array"):
+                    handle(current, builder.value)
+                    builder = None
+                continue
+            
+            if prefix not in STREAM_SECTIONS and prefix not in header_prefixes:
+                continue
+            
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                current = prefix
+            elif event != "map_key":
+                handle(prefix, value)
+    
+    meta = _extract_metadata(header)
+    levels = _extract_levels(header)
+    
+    return (meta, levels, sections["rooms"], sections["areas"], sections["openings"],
+            _group_shafts(sections["shafts"]))
+
+
+def load_bess_export_stream(path: str) -> Iterator[Element]:
+    """
+    Поэлементное чтение файла JSON Lines, записанного save_work_geometry
+    
+    Элементы нормализуются и выдаются по одному, поэтому пиковая память -
+    O(одной строки) независимо от размера файла. Строка-заголовок пропускается.
+    
+    Args:
+        path: Путь к файлу .jsonl
+        
+    Yields:
+        Нормализованные элементы всех разделов в порядке записи
+    """
+    yield from _normalize_jsonl_records(_read_jsonl(path))
+
+
+def _read_jsonl(path: str) -> Iterator[Any]:
+    """Разбор файла JSON Lines / JSON Text Sequences (RFC 7464) построчно"""
+    with open(path, "rb") as f:
+        for line in f:
+            # Разделитель записей RFC 7464 (0x1E) и перевод строки отбрасываются
+            line = line.strip(b"\x1e \t\r\n")
+            if line:
+                yield _decode_json(line)
+
+
+def _normalize_jsonl_records(records, header: Dict = None) -> Iterator[Element]:
+    """
+    Нормализация записей JSON Lines
+    
+    Args:
+        records: Разобранные строки файла
+        header: Словарь, в который копируются поля строки-заголовка (опционально)
+    """
+    counters = dict.fromkeys(JSONL_SECTIONS, 0)
+    
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        
+        element_type = record.get("element_type")
+        if element_type == JSONL_HEADER_TYPE:
+            if header is not None:
+                header.update((key, record[key]) for key in HEADER_KEYS if key in record)
+            continue
+        if element_type not in JSONL_SECTIONS:
+            continue
+        
+        _, name_prefix, label = JSONL_SECTIONS[element_type]
+        index = counters[element_type]
+        counters[element_type] = index + 1
+        try:
+            element = _normalize_element(record, f"{name_prefix}_{index+1}", element_type)
+        except Exception as e:
+            print(f"⚠️ Ошибка обработки {label} {index}: {e}")
+            continue
+        if element:
+            yield element
+
+
+def _load_jsonl(path: str) -> Tuple[Dict, Dict, List, List, List, Dict]:
+    """Загрузка файла JSON Lines целиком в формате load_bess_export"""
+    header = {}
+    sections = {"rooms": [], "areas": [], "openings": [], "shafts": []}
+    
+    for element in _normalize_jsonl_records(_read_jsonl(path), header):
+        sections[JSONL_SECTIONS[element["element_type"]][0]].append(element)
+    
+    meta = _extract_metadata(header)
+    levels = _extract_levels(header)
+    
+    return (meta, levels, sections["rooms"], sections["areas"], sections["openings"],
+            _group_shafts(sections["shafts"]))
+
+
 def _extract_metadata(data: Dict) -> Dict:
     """Извлечение метаданных"""
     meta = {
@@ -122,139 +617,150 @@ def _extract_levels(data: Dict) -> Dict:
     return levels
 
 
-def _extract_rooms(data: Dict) -> List[Dict]:
-    """Извлечение помещений"""
-    rooms = []
+def _extract_sections(data: Dict) -> Tuple[List, List, List, Dict]:
+    """
+    Извлечение помещений, областей, отверстий и шахт
+    
+    Разделы независимы, поэтому в сборках без GIL большие файлы разбираются
+    четырьмя потоками; иначе разделы обрабатываются последовательно.
+    """
+    extractors = (_extract_rooms, _extract_areas, _extract_openings, _extract_shafts)
+    
+    if PARALLEL_EXTRACT:
+        total = sum(len(items) for key in ELEMENT_SECTIONS
+                    if isinstance(items := data.get(key), list))
+        if total >= PARALLEL_EXTRACT_MIN_ELEMENTS:
+            with ThreadPoolExecutor(max_workers=len(extractors)) as executor:
+                futures = [executor.submit(extract, data) for extract in extractors]
+                return tuple(future.result() for future in futures)
     
+    return tuple(extract(data) for extract in extractors)
+
+
+def _extract_rooms(data: Dict) -> List[Element]:
+    """Извлечение помещений"""
     raw_rooms = data.get("rooms", [])
     if not isinstance(raw_rooms, list):
-        return rooms
-    
-    for i, room_data in enumerate(raw_rooms):
-        try:
-            room = _normalize_element(room_data, f"Room_{i+1}", "room")
-            if room:
-                rooms.append(room)
-        except Exception as e:
-            print(f"⚠️ Ошибка обработки помещения {i}: {e}")
+        return []
     
-    return rooms
+    return _normalize_items(raw_rooms, "Room", "room", "помещения")
 
 
-def _extract_areas(data: Dict) -> List[Dict]:
+def _extract_areas(data: Dict) -> List[Element]:
     """Извлечение областей"""
-    areas = []
-    
     raw_areas = data.get("areas", [])
     if not isinstance(raw_areas, list):
-        return areas
-    
-    for i, area_data in enumerate(raw_areas):
-        try:
-            area = _normalize_element(area_data, f"Area_{i+1}", "area")
-            if area:
-                areas.append(area)
-        except Exception as e:
-            print(f"⚠️ Ошибка обработки области {i}: {e}")
+        return []
     
-    return areas
+    return _normalize_items(raw_areas, "Area", "area", "области")
 
 
-def _extract_openings(data: Dict) -> List[Dict]:
+def _extract_openings(data: Dict) -> List[Element]:
     """Извлечение отверстий"""
-    openings = []
-    
     raw_openings = data.get("openings", [])
     if not isinstance(raw_openings, list):
-        return openings
-    
-    for i, opening_data in enumerate(raw_openings):
-        try:
-            opening = _normalize_element(opening_data, f"Opening_{i+1}", "opening")
-            if opening:
-                openings.append(opening)
-        except Exception as e:
-            print(f"⚠️ Ошибка обработки отверстия {i}: {e}")
+        return []
     
-    return openings
+    return _normalize_items(raw_openings, "Opening", "opening", "отверстия")
 
 
-def _extract_shafts(data: Dict) -> Dict:
+def _extract_shafts(data: Dict) -> Dict[Any, List[Element]]:
     """Извлечение шахт (по уровням)"""
-    shafts_by_level = {}
-    
     raw_shafts = data.get("shafts", [])
     if not isinstance(raw_shafts, list):
-        return shafts_by_level
+        return {}
     
-    for i, shaft_data in enumerate(raw_shafts):
-        try:
-            shaft = _normalize_element(shaft_data, f"Shaft_{i+1}", "shaft")
-            if shaft:
-                level = shaft.get("params", {}).get("BESS_level", "Level 1")
-                if level not in shafts_by_level:
-                    shafts_by_level[level] = []
-                shafts_by_level[level].append(shaft)
-        except Exception as e:
-            print(f"⚠️ Ошибка обработки шахты {i}: {e}")
+    return _group_shafts(_normalize_items(raw_shafts, "Shaft", "shaft", "шахты"))
+
+
+def _group_shafts(shafts: List[Element]) -> Dict[Any, List[Element]]:
+    """Группировка нормализованных шахт по params["BESS_level"]"""
+    shafts_by_level = defaultdict(list)
+    
+    for shaft in shafts:
+        level = shaft["params"]["BESS_level"]
+        # Уровень - ключ группировки: объект или массив из JSON ключом быть не может
+        if isinstance(level, (dict, list)):
+            print(f"⚠️ Ошибка обработки шахты {shaft['id']}: некорректный уровень {level!r}")
+            continue
+        shafts_by_level[level].append(shaft)
     
-    return shafts_by_level
+    # Наружу отдается обычный dict: отсутствующий уровень не должен создавать ключ
+    return dict(shafts_by_level)
 
 
-def _normalize_element(element_data: Dict, default_name: str, element_type: str) -> Dict:
+def _normalize_items(raw_items: List, name_prefix: str, element_type: str, label: str) -> List[Element]:
+    """
+    Нормализация элементов раздела одним генератором списка
+    
+    Не-объекты пропускаются, элементы с ошибками и без геометрии отбрасываются.
+    """
+    return [element for i, item in enumerate(raw_items)
+            if isinstance(item, dict)
+            and (element := _normalize_or_report(item, i, name_prefix, element_type, label))]
+
+
+def _normalize_or_report(element_data: Dict, index: int, name_prefix: str, element_type: str,
+                         label: str) -> Optional[Element]:
+    """_normalize_element с выводом ошибки вместо исключения"""
+    try:
+        return _normalize_element(element_data, f"{name_prefix}_{index+1}", element_type)
+    except Exception as e:
+        print(f"⚠️ Ошибка обработки {label} {index}: {e}")
+        return None
+
+
+def _normalize_element(element_data: Dict, default_name: str, element_type: str) -> Optional[Element]:
     """
     Нормализация элемента для единообразного формата
     
     Args:
-        element_data: Исходные данные элемента
+        element_data: Исходные данные элемента (его params переходят в результат)
         default_name: Имя по умолчанию
         element_type: Тип элемента
         
     Returns:
-        Нормализованный элемент
+        Нормализованный элемент или None (нет данных или меньше 3 точек контура)
     """
     if not isinstance(element_data, dict):
         return None
     
-    # Базовая структура
-    element = {
-        "id": element_data.get("id", default_name),
-        "name": element_data.get("name", default_name),
-        "element_type": element_type,
-        "outer_xy_m": [],
-        "inner_loops_xy_m": [],
-        "params": {}
-    }
+    element_id = element_data.get("id", default_name)
     
-    # Извлекаем геометрию
-    element["outer_xy_m"] = _normalize_polygon(element_data.get("outer_xy_m", 
-                                                              element_data.get("contour", 
-                                                                              element_data.get("geometry", []))))
+    # Извлекаем геометрию и сразу отбрасываем элементы, которые нельзя отрисовать
+    outer = _normalize_polygon(element_data.get("outer_xy_m", 
+                                                element_data.get("contour", 
+                                                                 element_data.get("geometry", []))))
+    if len(outer) < 3:
+        print(f"⚠️ Элемент {element_id} имеет недостаточно точек для отрисовки")
+        return None
     
     # Извлекаем внутренние контуры
     inner_loops = element_data.get("inner_loops_xy_m", element_data.get("holes", []))
-    if isinstance(inner_loops, list):
-        element["inner_loops_xy_m"] = [_normalize_polygon(loop) for loop in inner_loops]
     
-    # Извлекаем параметры
+    # Извлекаем параметры. Словарь берется без копии: element_data - свежий
+    # результат разбора файла, который после нормализации больше не используется
     params = element_data.get("params", {})
-    if isinstance(params, dict):
-        element["params"] = params.copy()
+    
+    # Итоговая структура собирается один раз из готовых значений
+    element = {
+        "id": element_id,
+        "name": element_data.get("name", default_name),
+        "element_type": element_type,
+        "outer_xy_m": outer,
+        "inner_loops_xy_m": [_normalize_polygon(loop) for loop in inner_loops]
+                            if isinstance(inner_loops, list) else [],
+        "params": params if isinstance(params, dict) else {}
+    }
     
     # Добавляем уровень
-    level = element_data.get("level", element_data.get("BESS_level", "Level 1"))
-    element["params"]["BESS_level"] = level
+    element["params"]["BESS_level"] = element_data.get("level", element_data.get("BESS_level", "Level 1"))
     
     # Добавляем дополнительные свойства
-    for key in ["area", "area_m2", "volume", "height", "category", "type", "function"]:
+    for key in ELEMENT_EXTRA_KEYS:
         if key in element_data:
             element[key] = element_data[key]
     
-    # Проверяем валидность геометрии
-    if len(element["outer_xy_m"]) < 3:
-        print(f"⚠️ Элемент {element['id']} имеет недостаточно точек для отрисовки")
-        return None
-    
     return element
 
 
@@ -274,6 +780,16 @@ def _normalize_polygon(raw_polygon) -> List[List[float]]:
     if not isinstance(raw_polygon, list):
         return []
     
+    # Основной формат [[x, y], ...] округляется одним генератором списка без
+    # проверок типов: формат определяется по первой вершине, а x * 1.0 дает float
+    # для чисел и TypeError для строк (в т.ч. вершин-строк и ключей вершин-словарей)
+    if type(raw_polygon[0]) is not dict:
+        try:
+            return RoundedPolygon([[round(x * 1.0, 2), round(y * 1.0, 2)] for x, y in raw_polygon])
+        except (TypeError, ValueError):
+            # Смешанный формат или нечисловые координаты: поточечный разбор ниже
+            pass
+    
     normalized = []
     
     for point in raw_polygon:
@@ -292,11 +808,12 @@ def _normalize_polygon(raw_polygon) -> List[List[float]]:
             except (TypeError, ValueError):
                 continue
     
-    return normalized
+    return RoundedPolygon(normalized)
 
 
 def save_work_geometry(path: str, meta: Dict, work_levels: Dict, work_rooms: List, 
-                      work_areas: List, work_openings: List = None, work_shafts: Dict = None):
+                      work_areas: List, work_openings: List = None, work_shafts: Dict = None,
+                      jsonl: bool = False):
     """
     Сохранение рабочей геометрии в JSON файл
     
@@ -310,6 +827,8 @@ def save_work_geometry(path: str, meta: Dict, work_levels: Dict, work_rooms: Lis
         work_areas: Области
         work_openings: Отверстия (опционально)
         work_shafts: Шахты (опционально)
+        jsonl: Записать JSON Lines - заголовок и по одному элементу на строку
+               (включается автоматически для путей *.jsonl)
     """
     print(f"💾 Сохранение рабочей геометрии: {path}")
     
@@ -339,8 +858,15 @@ def save_work_geometry(path: str, meta: Dict, work_levels: Dict, work_rooms: Lis
             output["shafts"] = _round_elements(shafts_list)
         
         # Сохраняем файл
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        if jsonl or path.endswith(JSONL_SUFFIX):
+            _write_jsonl(path, output)
+        elif ORJSON_AVAILABLE:
+            payload = orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with open(path, "wb") as f:
+                f.write(payload)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(_JSON_ENCODER.iterencode(output))
         
         print(f"✅ Файл сохранен: {path}")
         
@@ -348,34 +874,93 @@ def save_work_geometry(path: str, meta: Dict, work_levels: Dict, work_rooms: Lis
         raise Exception(f"Ошибка сохранения файла: {e}")
 
 
+def _write_jsonl(path: str, output: Dict):
+    """
+    Запись структуры save_work_geometry в формате JSON Lines
+    
+    Первая строка - заголовок (element_type "header") с полями верхнего уровня,
+    далее элементы разделов по одному на строку с element_type раздела.
+    """
+    if ORJSON_AVAILABLE:
+        def dumps(record):
+            return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    else:
+        def dumps(record):
+            return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    
+    header = {"element_type": JSONL_HEADER_TYPE}
+    header.update((key, value) for key, value in output.items() if key not in ELEMENT_SECTIONS)
+    
+    with open(path, "wb") as f:
+        f.write(dumps(header))
+        for element_type, (section, _, _) in JSONL_SECTIONS.items():
+            for element in output.get(section, ()):
+                f.write(dumps({**element, "element_type": element_type}))
+
+
 def _round_elements(elements: List[Dict]) -> List[Dict]:
-    """Округление координат элементов для сохранения"""
-    rounded = []
+    """
+    Округление координат элементов для сохранения
     
-    for element in elements:
-        if not isinstance(element, dict):
-            continue
-        
-        element_copy = element.copy()
-        
+    Контуры всех элементов раздела собираются в один список, округляются
+    одним проходом _round_rings() и раскладываются обратно по копиям.
+    """
+    copies = [element.copy() for element in elements if isinstance(element, dict)]
+    
+    rings = []
+    for element_copy in copies:
+        if "outer_xy_m" in element_copy:
+            rings.append(element_copy["outer_xy_m"])
+        if "inner_loops_xy_m" in element_copy:
+            rings.extend(element_copy["inner_loops_xy_m"])
+    
+    rounded = iter(_round_rings(rings))
+    
+    for element_copy in copies:
         # Округляем внешний контур
         if "outer_xy_m" in element_copy:
-            element_copy["outer_xy_m"] = [[r2(x), r2(y)] for x, y in element_copy["outer_xy_m"]]
+            element_copy["outer_xy_m"] = next(rounded)
         
         # Округляем внутренние контуры
         if "inner_loops_xy_m" in element_copy:
-            element_copy["inner_loops_xy_m"] = [
-                [[r2(x), r2(y)] for x, y in loop] 
-                for loop in element_copy["inner_loops_xy_m"]
-            ]
+            element_copy["inner_loops_xy_m"] = list(islice(rounded, len(element_copy["inner_loops_xy_m"])))
         
         # Извлекаем уровень в корень
         if "params" in element_copy and "BESS_level" in element_copy["params"]:
             element_copy["level"] = element_copy["params"]["BESS_level"]
-        
-        rounded.append(element_copy)
     
-    return rounded
+    return copies
+
+
+def _round_rings(rings: List) -> List[List[List[float]]]:
+    """
+    Пакетное округление списка контуров [[x, y], ...] до 2 знаков
+    
+    Все контуры округляются одним вложенным генератором списка; контуры
+    RoundedPolygon, уже округленные при загрузке, передаются как есть. Если
+    в каком-то контуре встречается нечисловое значение, контуры округляются
+    по одному через _round_polygon().
+    """
+    try:
+        return [ring if type(ring) is RoundedPolygon
+                else [[round(float(x), 2), round(float(y), 2)] for x, y in ring]
+                for ring in rings]
+    except (TypeError, ValueError):
+        return [ring if type(ring) is RoundedPolygon else _round_polygon(ring) for ring in rings]
+
+
+def _round_polygon(points) -> List[List[float]]:
+    """
+    Пакетное округление полигона [[x, y], ...] до 2 знаков
+    
+    Весь полигон округляется одним генератором списка без вызова r2() на каждую
+    координату. Если встречается нечисловое значение, полигон повторно
+    округляется через r2() (нечисловые координаты становятся 0.0).
+    """
+    try:
+        return [[round(float(x), 2), round(float(y), 2)] for x, y in points]
+    except (TypeError, ValueError):
+        return [[r2(x), r2(y)] for x, y in points]
 
 
 # Дополнительные функции для совместимости
@@ -15,12 +15,20 @@ main_app.py - Основное приложение BESS_Geometry с интег
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import sys
+import math
+import importlib.util
 import logging
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Union, Tuple
 import traceback
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
 # Настройка логирования
 logging.basicConfig(
@@ -59,16 +67,111 @@ except ImportError as e:
     logger.warning(f"⚠️ Компоненты геометрии недоступны: {e}")
     GEOMETRY_COMPONENTS_AVAILABLE = False
 
-# Импорт дополнительных модулей
+# Площадь контура для помещений без поля area; geometry_utils сам выбирает
+# ядро (Cython, numba JIT для длинных контуров или чистый Python)
 try:
-    import io_bess
-    import state
+    from geometry_utils import polygon_area_fast
+    GEOMETRY_UTILS_AVAILABLE = True
+except ImportError as e:
+    logger.warning(f"⚠️ Геометрические утилиты недоступны: {e}")
+    GEOMETRY_UTILS_AVAILABLE = False
+
+# ijson - необязательный потоковый парсер для больших файлов в fallback-загрузке
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+# orjson - необязательный быстрый разбор JSON в fallback-загрузке
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Файлы от этого размера fallback-загрузка разбирает потоково, собирая
+# только разделы для отрисовки, а не все дерево JSON
+FALLBACK_STREAMING_MIN_BYTES = 64 * 1024 * 1024
+
+# Разделы файла, которые использует fallback-загрузка
+RENDER_SECTIONS = ('levels', 'rooms', 'areas', 'openings')
+
+# Fallback-загрузка читает файл в фоновом потоке; главный цикл Tk
+# проверяет готовность результата с этим интервалом, мс
+FALLBACK_POLL_MS = 50
+
+# Разделы rooms/areas/openings разбираются для отрисовки в отдельных потоках
+# только в сборках CPython без GIL: под GIL потоки выполнялись бы по очереди
+PARALLEL_PARSE = not getattr(sys, "_is_gil_enabled", lambda: True)()
+PARALLEL_PARSE_MIN_ELEMENTS = 5000
+
+# Отрисовываются только элементы в видимой области, расширенной на эту долю
+# ее размера с каждой стороны: небольшие панорамирование и масштабирование
+# обходятся без перерисовки (см. InteractiveGeometryCanvas._ensure_viewport_rendered)
+VIEWPORT_CULL_MARGIN = 0.5
+
+# Перерисовка запрашивается заранее, когда видимая область, расширенная на эту
+# долю, выходит за отрисованную - до появления пустых краев при навигации
+VIEWPORT_PREFETCH_MARGIN = 0.25
+
+# Теги объектов отрисовки, которые получают тег 'selectable' (см. _flush_draw_plan)
+SELECTABLE_TAGS = ('room', 'area', 'opening')
+
+# Информационные панели выводят длинные списки страницами по столько строк;
+# следующая страница добавляется при прокрутке до конца (см. LazyPager)
+TEXT_PAGE_ROWS = 200
+
+# Строка статуса обновляется не чаще одного раза за этот интервал, мс:
+# промежуточные сообщения одной операции заменяются последним
+STATUS_FLUSH_MS = 16
+
+# Цвет индикатора функциональности в заголовке области canvas
+CAPABILITY_COLORS = {
+    "Полная функциональность": "#00aa00",
+    "Расширенная функциональность": "#aa6600",
+    "Базовая функциональность": "#aa6600",
+    "Ограниченная функциональность": "#aa0000",
+}
+
+# Строка статуса при клике по элементу: тип элемента -> форматтер (name, properties)
+STATUS_FORMATTERS = {
+    'room': lambda name, properties: f"Помещение: {name} ({properties.get('area', 0):.1f} м²)",
+    'area': lambda name, properties: f"Зона: {name} (тип: {properties.get('type', 'Неизвестно')})",
+    'opening': lambda name, properties: f"Проем: {name} (ширина: {properties.get('width', 0):.1f} м)",
+}
+
+# Строки свойств во вкладке "Выделение": ключ свойства -> форматтер
+# (value, element_type); None - строка свойства не выводится
+SELECTION_PROPERTY_FORMATTERS = {
+    'name': lambda value, element_type: f"   Название: {value}\n",
+    'area': lambda value, element_type: f"   Площадь: {value:.2f} м²\n" if value > 0 else None,
+    'level': lambda value, element_type: f"   Уровень: {value}\n",
+    'type': lambda value, element_type: f"   Тип: {value}\n" if value != element_type else None,
+    'width': lambda value, element_type: f"   Ширина: {value:.2f} м\n" if value > 0 else None,
+}
+
+# Дополнительные модули: при старте только проверяем их наличие, сам импорт
+# (io_bess подтягивает orjson/msgspec/ijson) откладывается до загрузки файла
+IO_MODULES = ('io_bess', 'state')
+IO_MODULES_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in IO_MODULES)
+if not IO_MODULES_AVAILABLE:
+    logger.warning(f"⚠️ IO модули недоступны: не найдены {', '.join(IO_MODULES)}")
+
+
+@lru_cache(maxsize=None)
+def _io_modules():
+    """
+    Отложенный импорт IO модулей при первой загрузке файла
+    
+    Returns:
+        Кортеж (load_bess_export, AppState)
+    """
     from io_bess import load_bess_export
     from state import AppState
-    IO_MODULES_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"⚠️ IO модули недоступны: {e}")
-    IO_MODULES_AVAILABLE = False
+    return load_bess_export, AppState
 
 
 class ComponentAvailabilityChecker:
@@ -79,44 +182,64 @@ class ComponentAvailabilityChecker:
         self._check_all()
     
     def _check_all(self):
-        """Проверка всех компонентов"""
+        """
+        Проверка всех компонентов
+        
+        Доступность компонентов не меняется после импорта, поэтому статус и
+        уровень возможностей вычисляются здесь один раз.
+        """
         self.components = {
             'interaction_controller': INTERACTION_CONTROLLER_AVAILABLE,
             'geometry_components': GEOMETRY_COMPONENTS_AVAILABLE,
             'io_modules': IO_MODULES_AVAILABLE,
             'tkinter_available': True  # Предполагаем что tkinter есть
         }
-    
-    def check_all_components(self):
-        """Возвращает статус всех компонентов"""
-        return {
-            'overall_status': {
+        
+        self._status_cache = MappingProxyType({
+            'overall_status': MappingProxyType({
                 'can_render_geometry': self.components['geometry_components'],
                 'can_interact': self.components['interaction_controller'],
                 'can_load_files': self.components['io_modules']
-            },
-            'components': self.components.copy()
-        }
-    
-    def get_capability_level(self):
-        """Определяет уровень возможностей системы"""
+            }),
+            'components': MappingProxyType(self.components)
+        })
+        
         available = sum(self.components.values())
         total = len(self.components)
         
         if available == total:
-            return "Полная функциональность"
+            self._capability_level = "Полная функциональность"
         elif available >= total * 0.75:
-            return "Расширенная функциональность"
+            self._capability_level = "Расширенная функциональность"
         elif available >= total * 0.5:
-            return "Базовая функциональность" 
+            self._capability_level = "Базовая функциональность"
         else:
-            return "Ограниченная функциональность"
+            self._capability_level = "Ограниченная функциональность"
+    
+    def invalidate_status(self):
+        """
+        Пересчет статуса после изменения доступности компонентов
+        
+        Ранее полученные словари статуса не обновляются: их нужно запросить заново.
+        """
+        self._check_all()
+    
+    def check_all_components(self):
+        """Возвращает статус всех компонентов (только для чтения)"""
+        return self._status_cache
+    
+    def get_capability_level(self):
+        """Определяет уровень возможностей системы"""
+        return self._capability_level
 
 
 def safe_get(obj: Any, key: str, default: Any = None) -> Any:
     """
     Безопасное получение значения из объекта
     Решает проблему "'float' object has no attribute 'get'"
+    
+    Нужна для непроверенных входных данных; для результатов
+    normalize_data_structure достаточно dict.get
     """
     if isinstance(obj, dict):
         return obj.get(key, default)
@@ -124,28 +247,57 @@ def safe_get(obj: Any, key: str, default: Any = None) -> Any:
         return obj[key]
     else:
         # Если объект не dict и не поддерживает индексацию, возвращаем default
-        logger.warning(f"safe_get: Объект типа {type(obj)} не поддерживает получение ключа '{key}'")
+        logger.warning("safe_get: Объект типа %s не поддерживает получение ключа '%s'", type(obj), key)
         return default
 
 
-def normalize_data_structure(data: Any) -> Dict:
-    """
-    Нормализация структуры данных для универсальной обработки
-    Преобразует различные форматы в стандартный словарь
-    """
+def _normalize_dict(data: Dict) -> Dict:
+    """Словарь уже в нужном формате"""
+    return data
+
+
+def _normalize_list(data: List) -> Dict:
+    """Если список, пытаемся создать словарь с индексами"""
+    return {str(i): item for i, item in enumerate(data)}
+
+
+def _normalize_scalar(data: Any) -> Dict:
+    """Скалярные значения оборачиваем в словарь"""
+    return {"value": data}
+
+
+def _normalize_fallback(data: Any) -> Dict:
+    """Подклассы базовых типов и неизвестные типы данных"""
     if isinstance(data, dict):
-        return data
+        return _normalize_dict(data)
     elif isinstance(data, list):
-        # Если список, пытаемся создать словарь с индексами
-        return {str(i): item for i, item in enumerate(data)}
+        return _normalize_list(data)
     elif isinstance(data, (str, int, float, bool)):
-        # Скалярные значения оборачиваем в словарь
-        return {"value": data}
+        return _normalize_scalar(data)
     else:
-        logger.warning(f"Неизвестный тип данных: {type(data)}")
+        logger.warning("Неизвестный тип данных: %s", type(data))
         return {}
 
 
+# Диспетчеризация по точному типу: один поиск в словаре вместо цепочки isinstance
+_NORMALIZE_DISPATCH = {
+    dict: _normalize_dict,
+    list: _normalize_list,
+    str: _normalize_scalar,
+    int: _normalize_scalar,
+    float: _normalize_scalar,
+    bool: _normalize_scalar,
+}
+
+
+def normalize_data_structure(data: Any) -> Dict:
+    """
+    Нормализация структуры данных для универсальной обработки
+    Преобразует различные форматы в стандартный словарь
+    """
+    return _NORMALIZE_DISPATCH.get(type(data), _normalize_fallback)(data)
+
+
 def extract_contour_points(item: Any) -> List[List[float]]:
     """
     Извлечение контурных точек из элемента с обработкой различных форматов
@@ -164,6 +316,14 @@ def extract_contour_points(item: Any) -> List[List[float]]:
     
     # Нормализуем точки контура
     if isinstance(contour_data, list):
+        # Основной формат [[x, y], ...]: весь контур одним генератором списка.
+        # v * 1.0 дает float для чисел и TypeError для строк, поэтому строки,
+        # словари и короткие точки уходят в поточечный разбор ниже
+        try:
+            return _reject_non_finite([[point[0] * 1.0, point[1] * 1.0] for point in contour_data])
+        except (TypeError, IndexError, KeyError):
+            pass
+        
         for point in contour_data:
             try:
                 if isinstance(point, (list, tuple)) and len(point) >= 2:
@@ -178,10 +338,173 @@ def extract_contour_points(item: Any) -> List[List[float]]:
                     # Обрабатываем в другом месте
                     pass
             except (ValueError, TypeError) as e:
-                logger.warning(f"Ошибка обработки точки контура {point}: {e}")
+                logger.warning("Ошибка обработки точки контура %s: %s", point, e)
+                continue
+    
+    return _reject_non_finite(contour)
+
+
+def _reject_non_finite(contour: List[List[float]]) -> List[List[float]]:
+    """
+    Проверка контура на NaN/inf (Tk не принимает такие координаты)
+    
+    Сумма координат конечна только если конечны все слагаемые, поэтому
+    обычный контур проверяется одним проходом sum() без isfinite на точку.
+    
+    Returns:
+        Исходный контур или [], если в нем есть нечисловые координаты
+    """
+    if math.isfinite(sum(x + y for x, y in contour)):
+        return contour
+    
+    # Сумма может переполниться и на конечных значениях - проверяем поточечно
+    isfinite = math.isfinite
+    if all(isfinite(x) and isfinite(y) for x, y in contour):
+        return contour
+    
+    logger.warning("Контур содержит NaN/бесконечные координаты и не будет отрисован")
+    return []
+
+
+def room_area(room: Dict, contour: Optional[List[List[float]]] = None) -> float:
+    """
+    Площадь помещения: поле area или, если его нет, площадь контура
+    
+    Словарь помещения не изменяется: вычисленная площадь попадает только в
+    подпись и свойства элемента отрисовки (RenderElements) и в строку списка.
+    """
+    area = room.get('area')
+    if area is not None:
+        return float(area)
+    
+    if not GEOMETRY_UTILS_AVAILABLE:
+        return 0.0
+    
+    if contour is None:
+        contour = extract_contour_points(room)
+    if len(contour) < 3:
+        return 0.0
+    
+    return abs(polygon_area_fast([point[0] for point in contour], [point[1] for point in contour]))
+
+
+def stream_json_sections(path: str, keys=RENDER_SECTIONS) -> Dict:
+    """
+    Потоковое чтение только указанных разделов верхнего уровня JSON файла
+    
+    Остальные поля пропускаются на уровне событий ijson без создания
+    Python-объектов; файл читается блоками по 64 КиБ.
+    """
+    sections = {}
+    wanted = set(keys)
+    builder = None
+    current = None
+    
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, buf_size=64 * 1024, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                # Собственные start/end события значения имеют ровно его префикс
+                if prefix == current and event in ('end_map', 'end_array'):
+                    sections[current] = builder.value
+                    builder = None
+                continue
+            
+            if prefix not in wanted:
                 continue
+            
+            if event in ('start_map', 'start_array'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                current = prefix
+            elif event != 'map_key':
+                sections[prefix] = value
+    
+    return sections
+
+
+@dataclass
+class RenderElements:
+    """
+    Разобранные для отрисовки элементы в виде колонок (Structure-of-Arrays)
+    
+    Мировые координаты всех фигур лежат в двух непрерывных буферах double,
+    границы фигур - в offsets (CSR): точки элемента i занимают
+    xs[offsets[i]:offsets[i+1]]. Для прямоугольников хранятся два угла.
+    Габариты (AABB) фигур в мировых координатах хранятся колонками
+    min_xs/min_ys/max_xs/max_ys и используются для отсечения по видимой области.
+    """
+    xs: array = field(default_factory=lambda: array('d'))
+    ys: array = field(default_factory=lambda: array('d'))
+    offsets: array = field(default_factory=lambda: array('q', [0]))
+    kinds: List[str] = field(default_factory=list)
+    options: List[Dict] = field(default_factory=list)
+    text_options: List[Optional[Dict]] = field(default_factory=list)
+    registrations: List[Optional[tuple]] = field(default_factory=list)
+    min_xs: array = field(default_factory=lambda: array('d'))
+    min_ys: array = field(default_factory=lambda: array('d'))
+    max_xs: array = field(default_factory=lambda: array('d'))
+    max_ys: array = field(default_factory=lambda: array('d'))
+    
+    def append(self, kind: str, points, options: Dict,
+               text_options: Optional[Dict], registration: Optional[tuple]):
+        """Добавление элемента: kind - 'polygon' или 'rectangle'"""
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        self.xs.extend(xs)
+        self.ys.extend(ys)
+        self.offsets.append(len(self.xs))
+        self.min_xs.append(min(xs))
+        self.min_ys.append(min(ys))
+        self.max_xs.append(max(xs))
+        self.max_ys.append(max(ys))
+        self.kinds.append(kind)
+        self.options.append(options)
+        self.text_options.append(text_options)
+        self.registrations.append(registration)
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def visible(self, rect: Optional[Tuple[float, float, float, float]]) -> List[bool]:
+        """
+        Маска элементов, габариты которых пересекают прямоугольник
+        
+        Args:
+            rect: (min_x, min_y, max_x, max_y) в мировых координатах или None (все видимы)
+        """
+        if rect is None:
+            return [True] * len(self)
+        
+        min_x, min_y, max_x, max_y = rect
+        return [x0 <= max_x and x1 >= min_x and y0 <= max_y and y1 >= min_y
+                for x0, y0, x1, y1 in zip(self.min_xs, self.min_ys, self.max_xs, self.max_ys)]
+
+
+def read_json_file(filepath: str) -> Any:
+    """
+    Чтение JSON файла для fallback-загрузки
+    
+    Большие файлы разбираются потоково (только RENDER_SECTIONS), остальные -
+    целиком через orjson, если он доступен. Выполняется в фоновом потоке.
+    """
+    if IJSON_AVAILABLE and Path(filepath).stat().st_size >= FALLBACK_STREAMING_MIN_BYTES:
+        try:
+            return stream_json_sections(filepath)
+        except ijson.JSONError as e:
+            # ijson не принимает NaN/Infinity - разбираем файл целиком
+            logger.warning("Потоковый разбор не удался (%s), файл читается целиком", e)
     
-    return contour
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson строже stdlib (NaN/Infinity, BOM) - повторяем разбор через json
+            pass
+    return json.loads(raw.decode('utf-8'))
 
 
 class InteractiveGeometryCanvas:
@@ -194,6 +517,15 @@ class InteractiveGeometryCanvas:
         self.renderer = renderer
         self.coordinate_system = coord_system
         self._last_render_data = None
+        self._render_job = None
+        # Обработчик завершения ближайшей отрисовки (см. render_data)
+        self._render_complete = None
+        # Кэш разбора последних данных (см. _compute_draw_plan)
+        self._parsed_data = None
+        self._parsed_elements = RenderElements()
+        self._screen_buffer = []
+        # Мировой прямоугольник последней отрисовки (None - отрисовано все)
+        self._rendered_rect = None
         self._pan_start = None
         
         # КЛЮЧЕВАЯ ИНТЕГРАЦИЯ: Создаем InteractionController
@@ -247,8 +579,10 @@ class InteractiveGeometryCanvas:
         selected_count = data['selection_count']
         selected_ids = data['selected_ids']
         
-        logger.info(f"🎯 Выделение изменено: {selected_count} элементов")
-        logger.debug(f"   ID элементов: {list(selected_ids)}")
+        logger.info("🎯 Выделение изменено: %d элементов", selected_count)
+        # Список ID строится только если DEBUG действительно включен
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("   ID элементов: %s", list(selected_ids))
         
         # Уведомляем основное приложение
         if self.on_selection_changed:
@@ -259,7 +593,7 @@ class InteractiveGeometryCanvas:
             if selected_count == 0:
                 self.on_status_update("Ничего не выделено")
             elif selected_count == 1:
-                element_id = list(selected_ids)[0]
+                element_id = next(iter(selected_ids))
                 self.on_status_update(f"Выделен: {element_id}")
             else:
                 self.on_status_update(f"Выделено {selected_count} элементов")
@@ -270,7 +604,7 @@ class InteractiveGeometryCanvas:
         element_type = data['element_type']
         properties = data.get('properties', {})
         
-        logger.info(f"🖱️ Клик по элементу: {element_id} ({element_type})")
+        logger.info("🖱️ Клик по элементу: %s (%s)", element_id, element_type)
         
         # Уведомляем основное приложение
         if self.on_element_clicked:
@@ -278,25 +612,23 @@ class InteractiveGeometryCanvas:
         
         # Обновляем статус с информацией об элементе
         if self.on_status_update:
-            element_name = safe_get(properties, 'name', element_id)
-            if element_type == 'room':
-                area = safe_get(properties, 'area', 0)
-                self.on_status_update(f"Помещение: {element_name} ({area:.1f} м²)")
-            elif element_type == 'area':
-                area_type = safe_get(properties, 'type', 'Неизвестно')
-                self.on_status_update(f"Зона: {element_name} (тип: {area_type})")
-            elif element_type == 'opening':
-                width = safe_get(properties, 'width', 0)
-                self.on_status_update(f"Проем: {element_name} (ширина: {width:.1f} м)")
+            element_name = properties.get('name', element_id)
+            formatter = STATUS_FORMATTERS.get(element_type)
+            if formatter:
+                self.on_status_update(formatter(element_name, properties))
             else:
                 self.on_status_update(f"Элемент: {element_name} ({element_type})")
     
     def _handle_element_hover(self, data):
         """Обработка hover по элементу"""
+        # Hover приходит на каждое движение мыши - без DEBUG не делаем ничего
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
         element_id = data.get('element_id')
         
         if element_id:
-            logger.debug(f"👆 Hover: {element_id}")
+            logger.debug("👆 Hover: %s", element_id)
         
     def _handle_mode_changed(self, data):
         """Обработка изменения режима взаимодействия"""
@@ -337,13 +669,20 @@ class InteractiveGeometryCanvas:
             else:
                 factor = 1.0 / 1.1
             
+            # Фактический коэффициент может отличаться из-за ограничений масштаба
+            old_scale = self.coordinate_system.scale
             self.coordinate_system.zoom_at_point(event.x, event.y, factor)
-            
-            if self._last_render_data:
-                self.render_data(self._last_render_data)
+            applied = self.coordinate_system.scale / old_scale
+            
+            # Преобразование аффинное относительно курсора: масштабируем
+            # существующие объекты внутри Tk вместо полной перерисовки.
+            # Шрифты и толщины линий фиксированы и при перерисовке не менялись
+            if applied != 1.0:
+                self.canvas.scale("all", event.x, event.y, applied, applied)
+                self._ensure_viewport_rendered()
                 
         except Exception as e:
-            logger.error(f"Ошибка масштабирования: {e}")
+            logger.error("Ошибка масштабирования: %s", e)
     
     def _on_pan_start(self, event):
         """Начало панорамирования"""
@@ -360,337 +699,534 @@ class InteractiveGeometryCanvas:
                 self.coordinate_system.offset_x += dx
                 self.coordinate_system.offset_y += dy
                 
-                if self._last_render_data:
-                    self.render_data(self._last_render_data)
+                # Сдвигаем существующие объекты одной командой Tk
+                self.canvas.move("all", dx, dy)
+                self._ensure_viewport_rendered()
                 
                 self._pan_start = (event.x, event.y)
         except Exception as e:
-            logger.error(f"Ошибка панорамирования: {e}")
+            logger.error("Ошибка панорамирования: %s", e)
     
     def _on_pan_end(self, event):
         """Завершение панорамирования"""
         self._pan_start = None
         self.canvas.config(cursor="")
     
-    def render_data(self, data):
+    def render_data(self, data, on_complete=None):
         """
-        Отрисовка данных с улучшенной обработкой ошибок
+        Запрос отрисовки данных
+        
+        Сама отрисовка откладывается через after_idle: несколько запросов в
+        пределах одного кадра (панорамирование, масштабирование) объединяются
+        в одну перерисовку последних данных.
+        
+        Args:
+            data: Словарь разделов levels/rooms/areas/openings или уже
+                  подготовленный RenderElements (см. prepare_render_data)
+            on_complete: Функция (elements_count), вызываемая один раз после
+                         выполнения отложенной отрисовки
         """
+        self._last_render_data = data
+        if on_complete is not None:
+            self._render_complete = on_complete
+        
+        if self._render_job is None:
+            self._render_job = self.canvas.after_idle(self._render_pending)
+    
+    def _render_pending(self):
+        """Отложенная отрисовка: расчет плана, затем пакет вызовов Tk"""
+        self._render_job = None
+        on_complete, self._render_complete = self._render_complete, None
+        
         try:
-            self._last_render_data = data
+            plan = self._compute_draw_plan(self._last_render_data)
+            elements_count = self._flush_draw_plan(plan)
             
-            # Очищаем canvas
-            self.canvas.delete("all")
+            if on_complete is not None:
+                on_complete(elements_count)
             
-            # Очищаем старые элементы в InteractionController
-            if self.interaction_controller:
-                self.interaction_controller.clear_all_elements()
+        except Exception as e:
+            logger.exception("❌ Критическая ошибка отрисовки данных: %s", e)
+            if self.on_status_update:
+                self.on_status_update(f"Критическая ошибка отрисовки: {e}")
+    
+    def _compute_draw_plan(self, data) -> List[tuple]:
+        """
+        Расчет плана отрисовки без обращений к Tk
+        
+        Разбор элементов (нормализация, контуры, подписи, свойства) кэшируется
+        для последнего объекта data: при панорамировании и масштабировании
+        пересчитываются только экранные координаты.
+        
+        Returns:
+            Список (shapes, registration): shapes - операции (kind, coords, options)
+            для create_<kind>, registration - (element_id, element_type, properties)
+            или None, если элемент не удалось подготовить к регистрации
+        """
+        if data is not self._parsed_data:
+            if isinstance(data, RenderElements):
+                self._parsed_elements = data
+            else:
+                self._parsed_elements = self._parse_render_data(data)
+            self._parsed_data = data
+        
+        elements = self._parsed_elements
+        offsets = elements.offsets
+        
+        # Все точки всех фигур преобразуются одним проходом по колонкам
+        screen_xs, screen_ys = self.coordinate_system.world_to_screen_columns(
+            elements.xs, elements.ys
+        )
+        
+        # Буфер плоских экранных координат переиспользуется между перерисовками:
+        # размер меняется только при смене данных, срезы для фигур - копии.
+        # Координаты округляются до пикселя: Tk получает короткие целые
+        # вместо repr float, а сдвиг до 0.5 px на экране незаметен
+        screen = self._screen_buffer
+        size = 2 * len(screen_xs)
+        if len(screen) != size:
+            del screen[size:]
+            screen.extend([0] * (size - len(screen)))
+        try:
+            screen[0::2] = map(round, screen_xs)
+            screen[1::2] = map(round, screen_ys)
+            has_invalid = False
+        except (ValueError, OverflowError):
+            # Координата вышла за пределы float после масштабирования:
+            # фигуры с такими точками пропускаются, остальные отрисовываются
+            isfinite = math.isfinite
+            screen[0::2] = [round(x) if isfinite(x) else None for x in screen_xs]
+            screen[1::2] = [round(y) if isfinite(y) else None for y in screen_ys]
+            has_invalid = True
+        
+        # Отсечение по видимой области: объекты Tk создаются только для
+        # элементов, габариты которых попадают в расширенную область экрана
+        self._rendered_rect = self._visible_world_rect(VIEWPORT_CULL_MARGIN)
+        visible = elements.visible(self._rendered_rect)
+        
+        # Локальные имена вместо обращений к атрибутам на каждой итерации
+        plan = []
+        append = plan.append
+        
+        for kind, start, end, options, text_options, registration, is_visible in zip(
+                elements.kinds, offsets, offsets[1:],
+                elements.options, elements.text_options, elements.registrations, visible):
+            if not is_visible:
+                # Объекты Tk не создаются, но элемент регистрируется: выделение
+                # всех элементов и информация о них не зависят от видимой области
+                append(((), registration))
+                continue
             
-            # ИСПРАВЛЕНИЕ: Безопасно извлекаем данные с проверкой типов
-            data_normalized = normalize_data_structure(data)
+            coords = screen[2 * start:2 * end]
+            if has_invalid and None in coords:
+                logger.warning("Элемент %s не отрисован: некорректные экранные координаты",
+                               registration[0] if registration else start)
+                append(((), registration))
+                continue
             
-            levels = safe_get(data_normalized, 'levels', {})
-            rooms = safe_get(data_normalized, 'rooms', [])
-            areas = safe_get(data_normalized, 'areas', [])
-            openings = safe_get(data_normalized, 'openings', [])
+            shapes = [(kind, coords, options)]
             
-            # Убеждаемся что списки действительно списки
-            if not isinstance(rooms, list):
-                rooms = []
-            if not isinstance(areas, list):
-                areas = []
-            if not isinstance(openings, list):
-                openings = []
+            if text_options is not None:
+                # Центр считаем по экранным точкам:
+                # преобразование аффинное, центр переходит в центр
+                count = end - start
+                text_x = round(sum(screen_xs[start:end]) / count)
+                text_y = round(sum(screen_ys[start:end]) / count)
+                shapes.append(('text', (text_x, text_y), text_options))
             
-            elements_count = 0
+            append((shapes, registration))
+        
+        return plan
+    
+    def _visible_world_rect(self, margin: float = 0.0) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Видимая область canvas в мировых координатах
+        
+        Args:
+            margin: Расширение области на эту долю ее размера с каждой стороны
             
-            # Отрисовываем помещения
-            for i, room_data in enumerate(rooms):
-                try:
-                    canvas_ids = self._draw_room(room_data, i)
-                    
-                    if canvas_ids:
-                        # ИСПРАВЛЕНИЕ: Безопасное получение свойств
-                        room_normalized = normalize_data_structure(room_data)
-                        
-                        room_id = safe_get(room_normalized, 'id', f'room_{i}')
-                        properties = {
-                            'name': safe_get(room_normalized, 'name', f'Помещение {i+1}'),
-                            'area': float(safe_get(room_normalized, 'area', 0)),
-                            'level': str(safe_get(room_normalized, 'level', 'Неизвестно')),
-                            'type': safe_get(room_normalized, 'type', 'room')
-                        }
-                        
-                        # РЕГИСТРИРУЕМ в InteractionController
-                        if self.interaction_controller:
-                            self.interaction_controller.register_element(
-                                canvas_ids, str(room_id), 'room', properties
-                            )
-                        
-                        elements_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Ошибка обработки помещения {i}: {e}")
-                    continue
+        Returns:
+            (min_x, min_y, max_x, max_y) или None, если размер canvas еще неизвестен
+        """
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return None
+        
+        dx = width * margin
+        dy = height * margin
+        x0, y0 = self.coordinate_system.screen_to_world(-dx, height + dy)
+        x1, y1 = self.coordinate_system.screen_to_world(width + dx, -dy)
+        return (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+    
+    def _ensure_viewport_rendered(self):
+        """
+        Перерисовка после навигации, если видимая область приблизилась к краю отрисованной
+        
+        Объекты внутри отрисованной области двигаются canvas.move/scale; элементы,
+        отсеченные при отрисовке, появляются только после новой отрисовки. Область
+        проверяется с запасом VIEWPORT_PREFETCH_MARGIN, поэтому отложенная
+        перерисовка успевает выполниться раньше, чем край станет виден
+        """
+        rendered = self._rendered_rect
+        if rendered is None or not self._last_render_data:
+            return
+        
+        current = self._visible_world_rect(VIEWPORT_PREFETCH_MARGIN)
+        if current is None:
+            return
+        
+        if (current[0] < rendered[0] or current[1] < rendered[1] or
+                current[2] > rendered[2] or current[3] > rendered[3]):
+            self.render_data(self._last_render_data)
+    
+    def prepare_render_data(self, data) -> RenderElements:
+        """
+        Разбор данных в пакет RenderElements для render_data
+        
+        Не обращается к Tk и к состоянию вида, поэтому может выполняться в
+        фоновом потоке загрузки: главному потоку передаются готовые колонки
+        координат вместо словарей элементов.
+        """
+        return self._parse_render_data(data)
+    
+    def _parse_render_data(self, data) -> RenderElements:
+        """
+        Разбор данных для отрисовки в независимые от вида элементы
+        
+        Разделы независимы; в сборках без GIL большие сцены разбираются
+        в отдельных потоках (вызовы Tk здесь не выполняются).
+        """
+        # ИСПРАВЛЕНИЕ: Безопасно извлекаем данные с проверкой типов
+        data_normalized = normalize_data_structure(data)
+        
+        # normalize_data_structure всегда возвращает dict, поэтому на горячем
+        # пути используем dict.get напрямую вместо safe_get
+        levels = data_normalized.get('levels', {})
+        rooms = data_normalized.get('rooms', [])
+        areas = data_normalized.get('areas', [])
+        openings = data_normalized.get('openings', [])
+        
+        # Убеждаемся что списки действительно списки
+        if not isinstance(rooms, list):
+            rooms = []
+        if not isinstance(areas, list):
+            areas = []
+        if not isinstance(openings, list):
+            openings = []
+        
+        parsers = (
+            (self._parse_rooms, rooms),
+            (self._parse_areas, areas),
+            (self._parse_openings, openings)
+        )
+        
+        if PARALLEL_PARSE and len(rooms) + len(areas) + len(openings) >= PARALLEL_PARSE_MIN_ELEMENTS:
+            with ThreadPoolExecutor(max_workers=len(parsers)) as executor:
+                futures = [executor.submit(parse, items) for parse, items in parsers]
+                results = [future.result() for future in futures]
+        else:
+            results = [parse(items) for parse, items in parsers]
+        
+        # Таблица заполняется в главном потоке в исходном порядке разделов
+        parsed = RenderElements()
+        for entries in results:
+            for entry in entries:
+                parsed.append(*entry)
+        
+        logger.info("✅ Подготовлено к отрисовке: %d помещений, %d зон, %d проемов",
+                    len(rooms), len(areas), len(openings))
+        
+        return parsed
+    
+    def _parse_rooms(self, rooms: List) -> List[tuple]:
+        """Разбор помещений в записи RenderElements.append"""
+        entries = []
+        
+        for i, room_data in enumerate(rooms):
+            element, room_normalized = self._parse_room(room_data, i)
+            if element is None:
+                continue
             
-            # Отрисовываем зоны
-            for i, area_data in enumerate(areas):
-                try:
-                    canvas_ids = self._draw_area(area_data, i)
-                    
-                    if canvas_ids:
-                        area_normalized = normalize_data_structure(area_data)
-                        
-                        area_id = safe_get(area_normalized, 'id', f'area_{i}')
-                        properties = {
-                            'name': safe_get(area_normalized, 'name', f'Зона {i+1}'),
-                            'area': float(safe_get(area_normalized, 'area', 0)),
-                            'type': safe_get(area_normalized, 'type', 'Неизвестно')
-                        }
-                        
-                        if self.interaction_controller:
-                            self.interaction_controller.register_element(
-                                canvas_ids, str(area_id), 'area', properties
-                            )
-                        
-                        elements_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Ошибка обработки зоны {i}: {e}")
-                    continue
+            registration = None
+            try:
+                room_id = room_normalized.get('id', f'room_{i}')
+                properties = {
+                    'name': room_normalized.get('name', f'Помещение {i+1}'),
+                    # Контур уже извлечен при разборе: element = (kind, points, ...)
+                    'area': room_area(room_normalized, element[1]),
+                    'level': str(room_normalized.get('level', 'Неизвестно')),
+                    'type': room_normalized.get('type', 'room')
+                }
+                registration = (str(room_id), 'room', properties)
+            except Exception as e:
+                logger.error("Ошибка обработки помещения %d: %s", i, e)
             
-            # Отрисовываем проемы
-            for i, opening_data in enumerate(openings):
-                try:
-                    canvas_ids = self._draw_opening(opening_data, i)
-                    
-                    if canvas_ids:
-                        opening_normalized = normalize_data_structure(opening_data)
-                        
-                        opening_id = safe_get(opening_normalized, 'id', f'opening_{i}')
-                        properties = {
-                            'name': safe_get(opening_normalized, 'name', f'Проем {i+1}'),
-                            'category': safe_get(opening_normalized, 'category', 'Неизвестно'),
-                            'width': float(safe_get(opening_normalized, 'width', 0.9)),
-                            'level': str(safe_get(opening_normalized, 'level', 'Неизвестно'))
-                        }
-                        
-                        if self.interaction_controller:
-                            self.interaction_controller.register_element(
-                                canvas_ids, str(opening_id), 'opening', properties
-                            )
-                        
-                        elements_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Ошибка обработки проема {i}: {e}")
-                    continue
+            entries.append(element + (registration,))
+        
+        return entries
+    
+    def _parse_areas(self, areas: List) -> List[tuple]:
+        """Разбор зон в записи RenderElements.append"""
+        entries = []
+        
+        for i, area_data in enumerate(areas):
+            element, area_normalized = self._parse_area(area_data, i)
+            if element is None:
+                continue
             
-            logger.info(f"✅ Отрисовка завершена: {len(rooms)} помещений, {len(areas)} зон, {len(openings)} проемов")
-            logger.info(f"📊 Всего элементов зарегистрировано: {elements_count}")
+            registration = None
+            try:
+                area_id = area_normalized.get('id', f'area_{i}')
+                properties = {
+                    'name': area_normalized.get('name', f'Зона {i+1}'),
+                    'area': float(area_normalized.get('area', 0)),
+                    'type': area_normalized.get('type', 'Неизвестно')
+                }
+                registration = (str(area_id), 'area', properties)
+            except Exception as e:
+                logger.error("Ошибка обработки зоны %d: %s", i, e)
             
-            # Обновляем статус
-            if self.on_status_update:
-                self.on_status_update(f"Загружено: {elements_count} элементов")
+            entries.append(element + (registration,))
+        
+        return entries
+    
+    def _parse_openings(self, openings: List) -> List[tuple]:
+        """Разбор проемов в записи RenderElements.append"""
+        entries = []
+        
+        for i, opening_data in enumerate(openings):
+            element, opening_normalized = self._parse_opening(opening_data, i)
+            if element is None:
+                continue
             
-        except Exception as e:
-            logger.error(f"❌ Критическая ошибка отрисовки данных: {e}")
-            logger.error(traceback.format_exc())
-            if self.on_status_update:
-                self.on_status_update(f"Критическая ошибка отрисовки: {e}")
+            registration = None
+            try:
+                opening_id = opening_normalized.get('id', f'opening_{i}')
+                properties = {
+                    'name': opening_normalized.get('name', f'Проем {i+1}'),
+                    'category': opening_normalized.get('category', 'Неизвестно'),
+                    'width': float(opening_normalized.get('width', 0.9)),
+                    'level': str(opening_normalized.get('level', 'Неизвестно'))
+                }
+                registration = (str(opening_id), 'opening', properties)
+            except Exception as e:
+                logger.error("Ошибка обработки проема %d: %s", i, e)
+            
+            entries.append(element + (registration,))
+        
+        return entries
     
-    def _draw_room(self, room_data: Any, index: int) -> List[int]:
-        """Отрисовка помещения с улучшенной обработкой ошибок"""
-        canvas_ids = []
+    def _flush_draw_plan(self, plan: List[tuple]) -> int:
+        """
+        Выполнение плана отрисовки: только вызовы Tk и регистрация элементов
         
-        try:
-            room_normalized = normalize_data_structure(room_data)
+        Вызовы create_* идут подряд, без промежуточных вычислений на Python.
+        Элемент, который Tk не принял, пропускается, остальные отрисовываются.
+        
+        Returns:
+            Количество зарегистрированных элементов
+        """
+        canvas = self.canvas
+        create = {
+            'polygon': canvas.create_polygon,
+            'rectangle': canvas.create_rectangle,
+            'text': canvas.create_text
+        }
+        
+        # Очищаем canvas
+        canvas.delete("all")
+        
+        # Очищаем старые элементы в InteractionController
+        if self.interaction_controller:
+            self.interaction_controller.clear_all_elements()
+        
+        # Элементы для пакетной регистрации в InteractionController
+        pending_elements = []
+        append = pending_elements.append
+        
+        for shapes, registration in plan:
+            canvas_ids = []
+            try:
+                for kind, coords, options in shapes:
+                    canvas_ids.append(create[kind](coords, **options))
+            except Exception as e:
+                logger.error("Ошибка отрисовки элемента %s: %s",
+                             registration[0] if registration else '?', e)
+                if canvas_ids:
+                    canvas.delete(*canvas_ids)
+                continue
             
-            # Извлекаем контур
+            if registration:
+                append((canvas_ids,) + registration)
+        
+        # Общий тег назначается каждой группе одной командой Tk, а не каждому объекту
+        for tag in SELECTABLE_TAGS:
+            canvas.addtag_withtag('selectable', tag)
+        
+        # РЕГИСТРИРУЕМ все элементы в InteractionController одним вызовом
+        if self.interaction_controller and pending_elements:
+            self.interaction_controller.register_elements_bulk(pending_elements)
+        
+        elements_count = len(pending_elements)
+        logger.info("📊 Всего элементов зарегистрировано: %d", elements_count)
+        
+        # Обновляем статус
+        if self.on_status_update:
+            self.on_status_update(f"Загружено: {elements_count} элементов")
+        
+        return elements_count
+    
+    def _parse_room(self, room_data: Any, index: int) -> tuple:
+        """
+        Разбор помещения: (kind, points, options, text_options) или None,
+        плюс нормализованные данные
+        """
+        room_normalized = None
+        
+        try:
+            # Извлекаем контур (сам разбирает dict/list) до нормализации:
+            # элементы без контура отбрасываются без лишней работы
             contour = extract_contour_points(room_data)
             
             if len(contour) < 3:
-                logger.warning(f"Помещение {index}: недостаточно точек контура ({len(contour)})")
-                return canvas_ids
+                logger.warning("Помещение %d: недостаточно точек контура (%d)", index, len(contour))
+                return None, room_normalized
             
-            # Конвертируем в экранные координаты
-            screen_points = []
-            for point in contour:
-                try:
-                    sx, sy = self.coordinate_system.world_to_screen(float(point[0]), float(point[1]))
-                    screen_points.extend([sx, sy])
-                except (ValueError, TypeError, IndexError) as e:
-                    logger.warning(f"Ошибка конвертации точки {point}: {e}")
-                    continue
-            
-            if len(screen_points) < 6:  # Минимум 3 точки * 2 координаты
-                logger.warning(f"Помещение {index}: недостаточно корректных точек для отрисовки")
-                return canvas_ids
+            room_normalized = normalize_data_structure(room_data)
             
             # Полигон помещения
             fill_color = '#e6f3ff'  # Светло-голубой
             outline_color = '#0066cc'  # Синий
             
-            poly_id = self.canvas.create_polygon(
-                screen_points,
-                fill=fill_color,
-                outline=outline_color,
-                width=2,
-                tags=['room', 'selectable']
-            )
-            canvas_ids.append(poly_id)
+            options = {
+                'fill': fill_color,
+                'outline': outline_color,
+                'width': 2,
+                'tags': ['room']  # 'selectable' добавляется всей группе в _flush_draw_plan
+            }
             
             # Текст с названием и площадью
+            text_options = None
             try:
-                # Вычисляем центр помещения
-                center_x = sum(p[0] for p in contour) / len(contour)
-                center_y = sum(p[1] for p in contour) / len(contour)
+                room_name = room_normalized.get('name', f'Помещение {index+1}')
+                area = room_area(room_normalized, contour)
+                text = f"{room_name}\n{area:.1f} м²"
                 
-                text_x, text_y = self.coordinate_system.world_to_screen(center_x, center_y)
-                
-                room_name = safe_get(room_normalized, 'name', f'Помещение {index+1}')
-                room_area = float(safe_get(room_normalized, 'area', 0))
-                text = f"{room_name}\n{room_area:.1f} м²"
-                
-                text_id = self.canvas.create_text(
-                    text_x, text_y,
-                    text=text,
-                    font=('Arial', 9),
-                    fill='black',
-                    tags=['room_text']
-                )
-                canvas_ids.append(text_id)
+                text_options = {
+                    'text': text,
+                    'font': ('Arial', 9),
+                    'fill': 'black',
+                    'tags': ['room_text']
+                }
                 
             except Exception as e:
-                logger.warning(f"Ошибка создания текста для помещения {index}: {e}")
+                logger.warning("Ошибка создания текста для помещения %d: %s", index, e)
+            
+            return ('polygon', contour, options, text_options), room_normalized
             
         except Exception as e:
-            logger.error(f"Критическая ошибка отрисовки помещения {index}: {e}")
+            logger.error("Критическая ошибка отрисовки помещения %d: %s", index, e)
         
-        return canvas_ids
+        return None, room_normalized
     
-    def _draw_area(self, area_data: Any, index: int) -> List[int]:
-        """Отрисовка зоны с улучшенной обработкой ошибок"""
-        canvas_ids = []
+    def _parse_area(self, area_data: Any, index: int) -> tuple:
+        """
+        Разбор зоны: (kind, points, options, text_options) или None,
+        плюс нормализованные данные
+        """
+        area_normalized = None
         
         try:
-            area_normalized = normalize_data_structure(area_data)
             contour = extract_contour_points(area_data)
             
             if len(contour) < 3:
-                logger.warning(f"Зона {index}: недостаточно точек контура ({len(contour)})")
-                return canvas_ids
+                logger.warning("Зона %d: недостаточно точек контура (%d)", index, len(contour))
+                return None, area_normalized
             
-            # Конвертируем в экранные координаты
-            screen_points = []
-            for point in contour:
-                try:
-                    sx, sy = self.coordinate_system.world_to_screen(float(point[0]), float(point[1]))
-                    screen_points.extend([sx, sy])
-                except (ValueError, TypeError, IndexError):
-                    continue
-            
-            if len(screen_points) < 6:
-                return canvas_ids
+            area_normalized = normalize_data_structure(area_data)
             
             # Полигон зоны
             fill_color = '#ffe6e6'  # Светло-розовый
             outline_color = '#cc0000'  # Красный
             
-            poly_id = self.canvas.create_polygon(
-                screen_points,
-                fill=fill_color,
-                outline=outline_color,
-                width=2,
-                stipple='gray25',  # Штриховка для зон
-                tags=['area', 'selectable']
-            )
-            canvas_ids.append(poly_id)
+            options = {
+                'fill': fill_color,
+                'outline': outline_color,
+                'width': 2,
+                'stipple': 'gray25',  # Штриховка для зон
+                'tags': ['area']
+            }
             
             # Текст с названием
+            text_options = None
             try:
-                center_x = sum(p[0] for p in contour) / len(contour)
-                center_y = sum(p[1] for p in contour) / len(contour)
-                
-                text_x, text_y = self.coordinate_system.world_to_screen(center_x, center_y)
-                
-                area_name = safe_get(area_normalized, 'name', f'Зона {index+1}')
-                area_type = safe_get(area_normalized, 'type', '')
+                area_name = area_normalized.get('name', f'Зона {index+1}')
+                area_type = area_normalized.get('type', '')
                 text = f"{area_name}" + (f"\n({area_type})" if area_type else "")
                 
-                text_id = self.canvas.create_text(
-                    text_x, text_y,
-                    text=text,
-                    font=('Arial', 8),
-                    fill='darkred',
-                    tags=['area_text']
-                )
-                canvas_ids.append(text_id)
+                text_options = {
+                    'text': text,
+                    'font': ('Arial', 8),
+                    'fill': 'darkred',
+                    'tags': ['area_text']
+                }
                 
             except Exception as e:
-                logger.warning(f"Ошибка создания текста для зоны {index}: {e}")
+                logger.warning("Ошибка создания текста для зоны %d: %s", index, e)
+            
+            return ('polygon', contour, options, text_options), area_normalized
             
         except Exception as e:
-            logger.error(f"Критическая ошибка отрисовки зоны {index}: {e}")
+            logger.error("Критическая ошибка отрисовки зоны %d: %s", index, e)
         
-        return canvas_ids
+        return None, area_normalized
     
-    def _draw_opening(self, opening_data: Any, index: int) -> List[int]:
-        """Отрисовка проема с улучшенной обработкой ошибок"""
-        canvas_ids = []
+    def _parse_opening(self, opening_data: Any, index: int) -> tuple:
+        """
+        Разбор проема: (kind, points, options, None) или None,
+        плюс нормализованные данные
+        """
+        opening_normalized = None
         
         try:
             opening_normalized = normalize_data_structure(opening_data)
             
+            options = {
+                'fill': 'yellow',
+                'outline': 'orange',
+                'width': 2,
+                'tags': ['opening']
+            }
+            
             # Пробуем извлечь контур
             contour = extract_contour_points(opening_data)
             
             if contour and len(contour) >= 3:
-                # Рисуем по контуру
-                screen_points = []
-                for point in contour:
-                    try:
-                        sx, sy = self.coordinate_system.world_to_screen(float(point[0]), float(point[1]))
-                        screen_points.extend([sx, sy])
-                    except (ValueError, TypeError, IndexError):
-                        continue
-                
-                if len(screen_points) >= 6:
-                    poly_id = self.canvas.create_polygon(
-                        screen_points,
-                        fill='yellow',
-                        outline='orange',
-                        width=2,
-                        tags=['opening', 'selectable']
-                    )
-                    canvas_ids.append(poly_id)
-            else:
-                # Простой прямоугольник для проема
-                position = safe_get(opening_normalized, 'position', [0, 0])
-                if not isinstance(position, (list, tuple)) or len(position) < 2:
-                    position = [0, 0]
-                
-                width = float(safe_get(opening_normalized, 'width', 0.9))
-                height = float(safe_get(opening_normalized, 'height', 0.2))
-                
-                x, y = float(position[0]), float(position[1])
-                
-                x1, y1 = self.coordinate_system.world_to_screen(x - width/2, y - height/2)
-                x2, y2 = self.coordinate_system.world_to_screen(x + width/2, y + height/2)
-                
-                rect_id = self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill='yellow',
-                    outline='orange',
-                    width=2,
-                    tags=['opening', 'selectable']
-                )
-                canvas_ids.append(rect_id)
+                # Рисуем по контуру (точки уже приведены к float)
+                return ('polygon', contour, options, None), opening_normalized
+            
+            # Простой прямоугольник для проема
+            position = opening_normalized.get('position', [0, 0])
+            if not isinstance(position, (list, tuple)) or len(position) < 2:
+                position = [0, 0]
+            
+            width = float(opening_normalized.get('width', 0.9))
+            height = float(opening_normalized.get('height', 0.2))
+            
+            x, y = float(position[0]), float(position[1])
+            
+            # Углы проверяются на NaN/inf так же, как контуры
+            corners = _reject_non_finite([[x - width/2, y - height/2], [x + width/2, y + height/2]])
+            if not corners:
+                logger.warning("Проем %d: некорректные координаты, пропущен", index)
+                return None, opening_normalized
+            return ('rectangle', corners, options, None), opening_normalized
             
         except Exception as e:
-            logger.error(f"Критическая ошибка отрисовки проема {index}: {e}")
+            logger.error("Критическая ошибка отрисовки проема %d: %s", index, e)
         
-        return canvas_ids
+        return None, opening_normalized
     
     def get_interaction_mode(self):
         """Получение текущего режима взаимодействия"""
@@ -722,6 +1258,178 @@ class InteractiveGeometryCanvas:
             self.interaction_controller.select_elements(element_ids, append)
 
 
+def bulk_write_text(text_widget, text: str):
+    """
+    Замена всего содержимого информационного виджета одной транзакцией
+    
+    Виджеты панелей только для чтения: между записями они остаются в
+    состоянии 'disabled', а стек отмены у них отключен.
+    """
+    text_widget.configure(state=tk.NORMAL)
+    text_widget.delete('1.0', tk.END)
+    text_widget.insert('1.0', text)
+    text_widget.configure(state=tk.DISABLED)
+
+
+class LazyPager(ABC):
+    """
+    Постраничный вывод длинного списка в прокручиваемый виджет
+    
+    В виджет сразу попадает только первая страница строк и строка-сводка;
+    следующая страница добавляется, когда прокрутка доходит до конца списка.
+    Подклассы реализуют очистку виджета и вставку страницы.
+    """
+    
+    MORE_TAG = 'pager_more'
+    
+    def __init__(self, widget, scrollbar, page_rows: int = TEXT_PAGE_ROWS):
+        self.widget = widget
+        self.page_rows = page_rows
+        self._rows = []
+        self._format_row = None
+        self._position = 0
+        self._page_scheduled = False
+        
+        # Перехватываем yscrollcommand, сохраняя обновление полосы прокрутки
+        self._scrollbar = scrollbar
+        widget.configure(yscrollcommand=self._on_scroll)
+    
+    def show(self, rows: List, format_row):
+        """
+        Замена содержимого первой страницей строк
+        
+        Args:
+            rows: Элементы списка
+            format_row: Функция (index, row) -> строка виджета
+        """
+        self._rows = rows
+        self._format_row = format_row
+        self._position = 0
+        
+        self._clear()
+        self._append_page()
+    
+    def _append_page(self):
+        """Добавление следующей страницы"""
+        self._page_scheduled = False
+        start = self._position
+        end = min(start + self.page_rows, len(self._rows))
+        if start >= end:
+            return
+        
+        format_row = self._format_row
+        page = [format_row(i, self._rows[i]) for i in range(start, end)]
+        self._position = end
+        
+        self._insert_page(page, len(self._rows) - end)
+    
+    @abstractmethod
+    def _clear(self):
+        """Очистка виджета перед первой страницей"""
+    
+    @abstractmethod
+    def _insert_page(self, page: List, remaining: int):
+        """Вставка страницы; сводка о remaining строках заменяет прежнюю"""
+    
+    def _on_scroll(self, first, last):
+        """yscrollcommand: при достижении конца списка догружаем страницу"""
+        if self._scrollbar is not None:
+            self._scrollbar.set(first, last)
+        
+        if (float(last) >= 1.0 and self._position < len(self._rows)
+                and not self._page_scheduled):
+            self._page_scheduled = True
+            self.widget.after_idle(self._append_page)
+
+
+class LazyTextPager(LazyPager):
+    """Постраничный вывод в ScrolledText: страница вставляется одним вызовом insert"""
+    
+    def __init__(self, text_widget, page_rows: int = TEXT_PAGE_ROWS):
+        super().__init__(text_widget, getattr(text_widget, 'vbar', None), page_rows)
+        self._header = ""
+    
+    def show(self, header: str, rows: List, format_row):
+        """
+        Замена содержимого: заголовок и первая страница строк
+        
+        Args:
+            header: Текст перед списком
+            rows: Элементы списка
+            format_row: Функция (index, row) -> str
+        """
+        self._header = header
+        super().show(rows, format_row)
+    
+    def _clear(self):
+        bulk_write_text(self.widget, self._header)
+    
+    def _insert_page(self, page: List[str], remaining: int):
+        text = self.widget
+        text.configure(state=tk.NORMAL)
+        
+        # Сводка "... еще N" заменяется следующей страницей
+        if text.tag_ranges(self.MORE_TAG):
+            text.delete(f"{self.MORE_TAG}.first", f"{self.MORE_TAG}.last")
+        
+        text.insert(tk.END, "".join(page))
+        
+        if remaining > 0:
+            text.insert(tk.END, f"... еще {remaining} (прокрутите вниз)\n", self.MORE_TAG)
+        
+        text.configure(state=tk.DISABLED)
+
+
+class LazyTreePager(LazyPager):
+    """
+    Постраничный вывод в ttk.Treeview: строка списка - кортеж значений колонок
+    
+    Сводка "... еще N" выводится в колонке summary_column отдельной строкой.
+    """
+    
+    def __init__(self, tree, scrollbar, summary_column: int = 0,
+                 page_rows: int = TEXT_PAGE_ROWS):
+        super().__init__(tree, scrollbar, page_rows)
+        self._empty_values = ('',) * len(tree['columns'])
+        self._summary_column = summary_column
+        self._summary_item = None
+    
+    def show_message(self, message: str):
+        """Замена содержимого одной строкой сообщения (например, об ошибке)"""
+        self.show([message], self._message_row)
+    
+    def _message_row(self, index: int, message: str) -> tuple:
+        return self._summary_values(message)
+    
+    def _summary_values(self, text: str) -> tuple:
+        values = list(self._empty_values)
+        values[self._summary_column] = text
+        return tuple(values)
+    
+    def _clear(self):
+        tree = self.widget
+        tree.delete(*tree.get_children())
+        self._summary_item = None
+    
+    def _insert_page(self, page: List[tuple], remaining: int):
+        tree = self.widget
+        
+        # Сводка "... еще N" заменяется следующей страницей
+        if self._summary_item is not None:
+            tree.delete(self._summary_item)
+            self._summary_item = None
+        
+        insert = tree.insert
+        for values in page:
+            insert('', tk.END, values=values)
+        
+        if remaining > 0:
+            self._summary_item = insert(
+                '', tk.END, values=self._summary_values(f"... еще {remaining} (прокрутите вниз)"),
+                tags=(self.MORE_TAG,)
+            )
+
+
 class ModernBessApp:
     """
     Главный класс приложения BESS_Geometry с исправленной обработкой данных
@@ -746,6 +1454,14 @@ class ModernBessApp:
         self.geometry_canvas = None
         self.selected_elements_info = {}
         
+        # Фоновый поток чтения файлов; _fallback_load - последняя запущенная загрузка
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._fallback_load = None
+        
+        # Отложенное обновление строки статуса (см. _update_status)
+        self._pending_status = None
+        self._status_after_id = None
+        
         # Создаем главное окно
         self.root = self._create_main_window()
         
@@ -889,12 +1605,7 @@ class ModernBessApp:
         
         # Индикатор функциональности
         capability_level = self.component_checker.get_capability_level()
-        color = {
-            "Полная функциональность": "#00aa00",
-            "Расширенная функциональность": "#aa6600", 
-            "Базовая функциональность": "#aa6600",
-            "Ограниченная функциональность": "#aa0000"
-        }.get(capability_level, "#666666")
+        color = CAPABILITY_COLORS.get(capability_level, "#666666")
         
         tk.Label(header_frame, text=f"● {capability_level}", fg=color, bg='#e8e8e8', 
                 font=('Arial', 9)).pack(side=tk.RIGHT, padx=10, pady=5)
@@ -953,37 +1664,81 @@ class ModernBessApp:
         notebook = ttk.Notebook(info_frame)
         notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        self.info_notebook = notebook
+        
+        # Списки для скрытых вкладок заполняются при переключении на них:
+        # путь фрейма вкладки -> (метод обновления, данные)
+        self._pending_panels = {}
+        notebook.bind('<<NotebookTabChanged>>', self._on_info_tab_changed)
+        
         # Вкладка "Уровни"
-        levels_frame = tk.Frame(notebook)
-        notebook.add(levels_frame, text="Уровни")
+        self.levels_frame = tk.Frame(notebook)
+        notebook.add(self.levels_frame, text="Уровни")
         
-        self.levels_text = scrolledtext.ScrolledText(levels_frame, wrap=tk.WORD, height=8)
-        self.levels_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.levels_tree, self.levels_pager = self._create_table(self.levels_frame, (
+            ('name', "Уровень", 140, tk.W),
+            ('elevation', "Отметка, м", 80, tk.E),
+        ))
         
         # Вкладка "Помещения"
-        rooms_frame = tk.Frame(notebook)
-        notebook.add(rooms_frame, text="Помещения")
+        self.rooms_frame = tk.Frame(notebook)
+        notebook.add(self.rooms_frame, text="Помещения")
         
-        self.rooms_text = scrolledtext.ScrolledText(rooms_frame, wrap=tk.WORD, height=8)
-        self.rooms_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.rooms_tree, self.rooms_pager = self._create_table(self.rooms_frame, (
+            ('index', "№", 50, tk.E),
+            ('name', "Название", 140, tk.W),
+            ('area', "Площадь, м²", 80, tk.E),
+            ('level', "Уровень", 80, tk.W),
+        ), summary_column=1)
         
         # Вкладка "Выделение" (новая)
         selection_frame = tk.Frame(notebook)
         notebook.add(selection_frame, text="Выделение")
         
-        self.selection_text = scrolledtext.ScrolledText(selection_frame, wrap=tk.WORD, height=8)
+        self.selection_text = scrolledtext.ScrolledText(selection_frame, wrap=tk.WORD, height=8, undo=False)
         self.selection_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.selection_text.insert('1.0', "Выберите элементы на плане для просмотра информации")
+        bulk_write_text(self.selection_text, "Выберите элементы на плане для просмотра информации")
         
         # Вкладка "Проемы"
-        openings_frame = tk.Frame(notebook)
-        notebook.add(openings_frame, text="Проемы")
+        self.openings_frame = tk.Frame(notebook)
+        notebook.add(self.openings_frame, text="Проемы")
         
-        self.openings_text = scrolledtext.ScrolledText(openings_frame, wrap=tk.WORD, height=8)
-        self.openings_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.openings_tree, self.openings_pager = self._create_table(self.openings_frame, (
+            ('index', "№", 50, tk.E),
+            ('name', "Название", 140, tk.W),
+            ('category', "Тип", 80, tk.W),
+            ('level', "Уровень", 80, tk.W),
+        ), summary_column=1)
+        
+        # Длинные списки выводятся постранично
+        self.selection_pager = LazyTextPager(self.selection_text)
         
         return info_frame
     
+    def _create_table(self, parent, columns, summary_column: int = 0):
+        """
+        Таблица ttk.Treeview с вертикальной прокруткой и постраничным выводом
+        
+        Args:
+            parent: Родительский фрейм
+            columns: Описания колонок (id, заголовок, ширина, выравнивание)
+            summary_column: Колонка для сводки "... еще N" и сообщений
+            
+        Returns:
+            (tree, LazyTreePager)
+        """
+        tree = ttk.Treeview(parent, columns=[column[0] for column in columns],
+                            show='headings', height=8)
+        for column_id, heading, width, anchor in columns:
+            tree.heading(column_id, text=heading, anchor=anchor)
+            tree.column(column_id, width=width, anchor=anchor, stretch=column_id == 'name')
+        
+        scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=5)
+        
+        return tree, LazyTreePager(tree, scrollbar, summary_column)
+    
     def _create_status_bar(self):
         """Создание статусной строки"""
         self.status_bar = tk.Label(
@@ -996,10 +1751,21 @@ class ModernBessApp:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
     def _update_status(self, message):
-        """Обновление статусной строки"""
+        """
+        Обновление статусной строки
+        
+        Сообщения копятся до ближайшего _flush_status; перерисовку Tk
+        выполняет сам при простое, без принудительного update_idletasks.
+        """
         if hasattr(self, 'status_bar'):
-            self.status_bar.config(text=str(message))
-            self.root.update_idletasks()
+            self._pending_status = str(message)
+            if self._status_after_id is None:
+                self._status_after_id = self.root.after(STATUS_FLUSH_MS, self._flush_status)
+    
+    def _flush_status(self):
+        """Вывод последнего сообщения в статусную строку"""
+        self._status_after_id = None
+        self.status_bar.config(text=self._pending_status)
     
     # ===============================================
     # ОБРАБОТЧИКИ СОБЫТИЙ ОТ InteractionController
@@ -1007,54 +1773,51 @@ class ModernBessApp:
     
     def _on_selection_changed(self, selected_ids):
         """Обработка изменения выделения от InteractionController"""
-        logger.info(f"🎯 Приложение получило изменение выделения: {selected_ids}")
+        logger.info("🎯 Приложение получило изменение выделения: %d элементов", len(selected_ids))
         
         try:
-            # Очищаем вкладку выделения
-            self.selection_text.delete('1.0', tk.END)
-            
             if not selected_ids:
-                self.selection_text.insert('1.0', "Ничего не выделено\n\nВыберите элементы на плане кликом мыши.")
+                self.selection_pager.show("Ничего не выделено\n\nВыберите элементы на плане кликом мыши.", [], None)
                 return
             
             # Показываем информацию о выделенных элементах
-            self.selection_text.insert('1.0', f"Выделено элементов: {len(selected_ids)}\n\n")
+            header = f"Выделено элементов: {len(selected_ids)}\n\n"
             
-            # Получаем детальную информацию о каждом элементе
+            # Детальная информация о каждом элементе выводится постранично
             if self.geometry_canvas and self.geometry_canvas.interaction_controller:
-                for i, element_id in enumerate(selected_ids, 1):
-                    # Ищем элемент в зарегистрированных
-                    element_info = None
-                    for canvas_id, hit_info in self.geometry_canvas.interaction_controller.element_mappings.items():
-                        if hit_info.element_id == element_id:
-                            element_info = hit_info
-                            break
-                    
-                    if element_info:
-                        self.selection_text.insert(tk.END, f"{i}. {element_info.element_type.upper()}: {element_id}\n")
-                        
-                        # Добавляем свойства
-                        if element_info.properties:
-                            for key, value in element_info.properties.items():
-                                if key == 'name':
-                                    self.selection_text.insert(tk.END, f"   Название: {value}\n")
-                                elif key == 'area' and value > 0:
-                                    self.selection_text.insert(tk.END, f"   Площадь: {value:.2f} м²\n")
-                                elif key == 'level':
-                                    self.selection_text.insert(tk.END, f"   Уровень: {value}\n")
-                                elif key == 'type' and value != element_info.element_type:
-                                    self.selection_text.insert(tk.END, f"   Тип: {value}\n")
-                                elif key == 'width' and value > 0:
-                                    self.selection_text.insert(tk.END, f"   Ширина: {value:.2f} м\n")
-                        
-                        self.selection_text.insert(tk.END, "\n")
-                    else:
-                        self.selection_text.insert(tk.END, f"{i}. {element_id} (информация недоступна)\n\n")
+                self.selection_pager.show(header, list(selected_ids), self._format_selection_row)
+            else:
+                self.selection_pager.show(header, [], None)
             
         except Exception as e:
             logger.error(f"Ошибка обновления информации о выделении: {e}")
-            self.selection_text.delete('1.0', tk.END)
-            self.selection_text.insert('1.0', f"Ошибка загрузки информации: {e}")
+            bulk_write_text(self.selection_text, f"Ошибка загрузки информации: {e}")
+    
+    def _format_selection_row(self, index: int, element_id: str) -> str:
+        """Текст вкладки "Выделение" для одного элемента"""
+        i = index + 1
+        
+        # Ищем элемент в зарегистрированных
+        element_info = self.geometry_canvas.interaction_controller.get_element_info(element_id)
+        
+        if not element_info:
+            return f"{i}. {element_id} (информация недоступна)\n\n"
+        
+        element_type = element_info.element_type
+        lines = [f"{i}. {element_type.upper()}: {element_id}\n"]
+        
+        # Добавляем свойства
+        if element_info.properties:
+            get_formatter = SELECTION_PROPERTY_FORMATTERS.get
+            for key, value in element_info.properties.items():
+                formatter = get_formatter(key)
+                if formatter is not None:
+                    line = formatter(value, element_type)
+                    if line is not None:
+                        lines.append(line)
+        
+        lines.append("\n")
+        return "".join(lines)
     
     def _on_element_clicked(self, element_id, element_type, properties):
         """Обработка клика по элементу от InteractionController"""
@@ -1110,8 +1873,11 @@ class ModernBessApp:
         if not filepath:
             return
         
+        # Незавершенная fallback-загрузка предыдущего файла больше не нужна
+        self._fallback_load = None
+        
         try:
-            system_status = self.component_checker.check_all_components()
+            system_status = self.system_status
             
             if IO_MODULES_AVAILABLE:
                 # Загружаем через специализированные модули
@@ -1119,6 +1885,7 @@ class ModernBessApp:
                 self._update_status("Загрузка файла через IO модули...")
                 
                 try:
+                    load_bess_export, AppState = _io_modules()
                     meta, levels, rooms, areas, openings, shafts = load_bess_export(filepath)
                     
                     # Создаем состояние приложения
@@ -1136,7 +1903,7 @@ class ModernBessApp:
                         logger.info(f"🏢 Выбран уровень: {first_level}")
                     
                     # Обновляем UI
-                    self._update_levels_list(levels)
+                    self._schedule_panel_update(self.levels_frame, "Уровни", self._update_levels_list, levels)
                     
                     # Отрисовываем геометрию
                     if system_status['overall_status']['can_render_geometry'] and self.geometry_canvas:
@@ -1151,13 +1918,17 @@ class ModernBessApp:
                             'openings': openings
                         }
                         
-                        self.geometry_canvas.render_data(render_data)
+                        # Статус с именем файла - после отложенной отрисовки,
+                        # иначе его заменит строка "Загружено: N элементов"
+                        status = f"Загружен файл: {Path(filepath).name}"
+                        self.geometry_canvas.render_data(
+                            render_data, on_complete=lambda count: self._update_status(status)
+                        )
                         
                         # Обновляем информационные панели
-                        self._update_rooms_list(rooms)
-                        self._update_openings_list(openings)
+                        self._schedule_panel_update(self.rooms_frame, "Помещения", self._update_rooms_list, rooms)
+                        self._schedule_panel_update(self.openings_frame, "Проемы", self._update_openings_list, openings)
                         
-                        self._update_status(f"Загружен файл: {Path(filepath).name}")
                         logger.info("✅ Файл успешно загружен и отображен через IO модули")
                     else:
                         self._update_status("Файл загружен, но геометрия не может быть отображена")
@@ -1185,153 +1956,224 @@ class ModernBessApp:
             logger.info(f"📥 Fallback загрузка JSON: {filepath}")
             self._update_status("Загрузка JSON файла...")
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # ИСПРАВЛЕНИЕ: Нормализуем структуру данных
-            data_normalized = normalize_data_structure(data)
-            
-            self.current_file_path = filepath
-            self._update_status(f"Загружен файл (режим просмотра): {Path(filepath).name}")
-            
-            # Извлекаем данные с безопасной обработкой
-            levels = safe_get(data_normalized, 'levels', {})
-            rooms = safe_get(data_normalized, 'rooms', [])
-            areas = safe_get(data_normalized, 'areas', [])
-            openings = safe_get(data_normalized, 'openings', [])
-            
-            # Убеждаемся что это списки
-            if not isinstance(levels, dict):
-                levels = {}
-            if not isinstance(rooms, list):
-                rooms = []
-            if not isinstance(areas, list):
-                areas = []
-            if not isinstance(openings, list):
-                openings = []
-            
-            logger.info(f"📊 Найдено: {len(levels)} уровней, {len(rooms)} помещений, {len(areas)} зон, {len(openings)} проемов")
-            
-            # Обновляем информационные панели
-            self._update_levels_list(levels)
-            self._update_rooms_list(rooms)
-            self._update_openings_list(openings)
-            
-            # Пытаемся отрисовать геометрию
-            system_status = self.component_checker.check_all_components()
-            if system_status['overall_status']['can_render_geometry'] and self.geometry_canvas:
-                logger.info("🎨 Отрисовка данных на canvas (JSON режим)...")
-                self._update_status("Отрисовка геометрии (JSON режим)...")
-                
-                render_data = {
+            # Чтение, разбор и подготовка геометрии не блокируют главный цикл Tk
+            future = self._io_executor.submit(self._read_fallback_file, filepath)
+            self._fallback_load = future
+            self.root.after(FALLBACK_POLL_MS, self._poll_fallback_load, future, filepath)
+        
+        except Exception as e:
+            self._report_fallback_error(e)
+    
+    def _poll_fallback_load(self, future, filepath: str):
+        """Ожидание результата фонового чтения JSON в главном потоке"""
+        if future is not self._fallback_load:
+            # Файл уже заменен более поздней загрузкой
+            return
+        
+        if not future.done():
+            self.root.after(FALLBACK_POLL_MS, self._poll_fallback_load, future, filepath)
+            return
+        
+        self._fallback_load = None
+        try:
+            data, elements = future.result()
+            self._apply_fallback_json(data, filepath, elements)
+        except Exception as e:
+            self._report_fallback_error(e)
+    
+    def _read_fallback_file(self, filepath: str) -> Tuple[Any, Optional[RenderElements]]:
+        """
+        Фоновая часть fallback-загрузки: чтение JSON и пакет геометрии
+        
+        Returns:
+            (data, elements): elements - RenderElements для отрисовки или None,
+            если отрисовка недоступна
+        """
+        data = read_json_file(filepath)
+        
+        elements = None
+        if self.system_status['overall_status']['can_render_geometry'] and self.geometry_canvas:
+            elements = self.geometry_canvas.prepare_render_data(data)
+        
+        return data, elements
+    
+    def _apply_fallback_json(self, data: Any, filepath: str,
+                             elements: Optional[RenderElements] = None):
+        """Обновление панелей и отрисовка данных, прочитанных fallback-загрузкой"""
+        # ИСПРАВЛЕНИЕ: Нормализуем структуру данных
+        data_normalized = normalize_data_structure(data)
+        
+        self.current_file_path = filepath
+        self._update_status(f"Загружен файл (режим просмотра): {Path(filepath).name}")
+        
+        # Извлекаем данные с безопасной обработкой
+        levels = safe_get(data_normalized, 'levels', {})
+        rooms = safe_get(data_normalized, 'rooms', [])
+        areas = safe_get(data_normalized, 'areas', [])
+        openings = safe_get(data_normalized, 'openings', [])
+        
+        # Убеждаемся что это списки
+        if not isinstance(levels, dict):
+            levels = {}
+        if not isinstance(rooms, list):
+            rooms = []
+        if not isinstance(areas, list):
+            areas = []
+        if not isinstance(openings, list):
+            openings = []
+        
+        logger.info(f"📊 Найдено: {len(levels)} уровней, {len(rooms)} помещений, {len(areas)} зон, {len(openings)} проемов")
+        
+        # Обновляем информационные панели
+        self._schedule_panel_update(self.levels_frame, "Уровни", self._update_levels_list, levels)
+        self._schedule_panel_update(self.rooms_frame, "Помещения", self._update_rooms_list, rooms)
+        self._schedule_panel_update(self.openings_frame, "Проемы", self._update_openings_list, openings)
+        
+        # Пытаемся отрисовать геометрию
+        system_status = self.system_status
+        if system_status['overall_status']['can_render_geometry'] and self.geometry_canvas:
+            logger.info("🎨 Отрисовка данных на canvas (JSON режим)...")
+            self._update_status("Отрисовка геометрии (JSON режим)...")
+            
+            # Геометрия обычно уже упакована в фоновом потоке
+            if elements is None:
+                elements = {
                     'levels': levels,
                     'rooms': rooms,
                     'areas': areas,
                     'openings': openings
                 }
-                
-                self.geometry_canvas.render_data(render_data)
-                
-                self._update_status(f"Загружен файл: {Path(filepath).name} (JSON)")
-                logger.info("✅ Файл успешно загружен и отображен (JSON режим)")
-            else:
-                self._update_status(f"Файл загружен: {Path(filepath).name} (только просмотр)")
-                logger.info("✅ Файл загружен в режиме просмотра (без отрисовки)")
+            
+            status = f"Загружен файл: {Path(filepath).name} (JSON)"
+            self.geometry_canvas.render_data(
+                elements, on_complete=lambda count: self._update_status(status)
+            )
+            
+            logger.info("✅ Файл успешно загружен и отображен (JSON режим)")
+        else:
+            self._update_status(f"Файл загружен: {Path(filepath).name} (только просмотр)")
+            logger.info("✅ Файл загружен в режиме просмотра (без отрисовки)")
+    
+    def _report_fallback_error(self, e: Exception):
+        """Сообщение об ошибке fallback-загрузки"""
+        error_msg = f"Ошибка fallback загрузки JSON: {e}"
+        logger.error(error_msg)
+        logger.error(traceback.format_exc())
+        messagebox.showerror("Ошибка JSON", error_msg)
+        self._update_status("Ошибка загрузки JSON файла")
+    
+    def _schedule_panel_update(self, frame, title: str, update, data):
+        """
+        Обновление информационной панели: сразу, если ее вкладка открыта,
+        иначе при переключении на вкладку (заголовок с числом строк - сразу)
+        """
+        count = len(data) if isinstance(data, (list, dict)) else 0
+        self.info_notebook.tab(frame, text=f"{title} ({count})")
         
-        except Exception as e:
-            error_msg = f"Ошибка fallback загрузки JSON: {e}"
-            logger.error(error_msg)
-            logger.error(traceback.format_exc())
-            messagebox.showerror("Ошибка JSON", error_msg)
-            self._update_status("Ошибка загрузки JSON файла")
+        if self.info_notebook.select() == str(frame):
+            self._pending_panels.pop(str(frame), None)
+            update(data)
+        else:
+            self._pending_panels[str(frame)] = (update, data)
+    
+    def _on_info_tab_changed(self, event=None):
+        """Заполнение списка вкладки, данные которой изменились, пока она была скрыта"""
+        pending = self._pending_panels.pop(self.info_notebook.select(), None)
+        if pending is not None:
+            update, data = pending
+            update(data)
     
     def _update_levels_list(self, levels):
         """Обновление списка уровней с безопасной обработкой"""
-        if not hasattr(self, 'levels_text'):
+        if not hasattr(self, 'levels_tree'):
             return
             
         try:
-            self.levels_text.delete('1.0', tk.END)
-            
             levels_normalized = normalize_data_structure(levels)
             
-            self.levels_text.insert('1.0', f"Уровни здания ({len(levels_normalized)}):\n\n")
-            
-            for level_id, level_data in levels_normalized.items():
-                level_data_norm = normalize_data_structure(level_data)
-                
-                name = safe_get(level_data_norm, 'name', str(level_id))
-                elevation = float(safe_get(level_data_norm, 'elevation', 0))
-                self.levels_text.insert(tk.END, f"• {name}\n  Отметка: {elevation:.2f} м\n\n")
+            self.levels_pager.show(list(levels_normalized.items()), self._format_level_row)
                 
         except Exception as e:
             logger.error(f"Ошибка обновления списка уровней: {e}")
-            self.levels_text.delete('1.0', tk.END)
-            self.levels_text.insert('1.0', f"Ошибка отображения уровней: {e}")
+            self.levels_pager.show_message(f"Ошибка отображения уровней: {e}")
+    
+    def _format_level_row(self, i: int, level_item) -> tuple:
+        """Строка таблицы уровней: (название, отметка)"""
+        level_id, level_data = level_item
+        try:
+            level_data_norm = normalize_data_structure(level_data)
+            get = level_data_norm.get
+            
+            name = get('name', str(level_id))
+            elevation = float(get('elevation', 0))
+            return (name, f"{elevation:.2f}")
+            
+        except Exception as e:
+            logger.warning(f"Ошибка обработки уровня {level_id}: {e}")
+            return (str(level_id), "ошибка")
     
     def _update_rooms_list(self, rooms):
         """Обновление списка помещений с безопасной обработкой"""
-        if not hasattr(self, 'rooms_text'):
+        if not hasattr(self, 'rooms_tree'):
             return
             
         try:
-            self.rooms_text.delete('1.0', tk.END)
-            
             if not isinstance(rooms, list):
                 rooms = []
             
-            self.rooms_text.insert('1.0', f"Помещения ({len(rooms)}):\n\n")
-            
-            for i, room_data in enumerate(rooms[:50]):  # Ограничиваем для производительности
-                try:
-                    room_normalized = normalize_data_structure(room_data)
-                    
-                    name = safe_get(room_normalized, 'name', f'Помещение {i+1}')
-                    area = float(safe_get(room_normalized, 'area', 0))
-                    level = safe_get(room_normalized, 'level', 'Неизвестно')
-                    self.rooms_text.insert(tk.END, f"{i+1}. {name}\n   Площадь: {area:.2f} м²\n   Уровень: {level}\n\n")
-                    
-                except Exception as e:
-                    logger.warning(f"Ошибка обработки помещения {i}: {e}")
-                    self.rooms_text.insert(tk.END, f"{i+1}. Ошибка обработки помещения\n\n")
-                    continue
+            # Список выводится постранично по мере прокрутки
+            self.rooms_pager.show(rooms, self._format_room_row)
                     
         except Exception as e:
             logger.error(f"Ошибка обновления списка помещений: {e}")
-            self.rooms_text.delete('1.0', tk.END)
-            self.rooms_text.insert('1.0', f"Ошибка отображения помещений: {e}")
+            self.rooms_pager.show_message(f"Ошибка отображения помещений: {e}")
+    
+    def _format_room_row(self, i: int, room_data) -> tuple:
+        """Строка таблицы помещений: (№, название, площадь, уровень)"""
+        try:
+            # Результат normalize_data_structure всегда словарь: safe_get не нужен
+            room_normalized = normalize_data_structure(room_data)
+            get = room_normalized.get
+            
+            name = get('name', f'Помещение {i+1}')
+            area = room_area(room_normalized)
+            level = get('level', 'Неизвестно')
+            return (i + 1, name, f"{area:.2f}", level)
+            
+        except Exception as e:
+            logger.warning(f"Ошибка обработки помещения {i}: {e}")
+            return (i + 1, "Ошибка обработки помещения", "", "")
     
     def _update_openings_list(self, openings):
         """Обновление списка проемов с безопасной обработкой"""
-        if not hasattr(self, 'openings_text'):
+        if not hasattr(self, 'openings_tree'):
             return
             
         try:
-            self.openings_text.delete('1.0', tk.END)
-            
             if not isinstance(openings, list):
                 openings = []
             
-            self.openings_text.insert('1.0', f"Проемы ({len(openings)}):\n\n")
-            
-            for i, opening_data in enumerate(openings[:50]):
-                try:
-                    opening_normalized = normalize_data_structure(opening_data)
-                    
-                    name = safe_get(opening_normalized, 'name', f'Проем {i+1}')
-                    category = safe_get(opening_normalized, 'category', 'Неизвестно')
-                    level = safe_get(opening_normalized, 'level', 'Неизвестно')
-                    self.openings_text.insert(tk.END, f"{i+1}. {name}\n   Тип: {category}\n   Уровень: {level}\n\n")
-                    
-                except Exception as e:
-                    logger.warning(f"Ошибка обработки проема {i}: {e}")
-                    self.openings_text.insert(tk.END, f"{i+1}. Ошибка обработки проема\n\n")
-                    continue
+            # Список выводится постранично по мере прокрутки
+            self.openings_pager.show(openings, self._format_opening_row)
                     
         except Exception as e:
             logger.error(f"Ошибка обновления списка проемов: {e}")
-            self.openings_text.delete('1.0', tk.END)
-            self.openings_text.insert('1.0', f"Ошибка отображения проемов: {e}")
+            self.openings_pager.show_message(f"Ошибка отображения проемов: {e}")
+    
+    def _format_opening_row(self, i: int, opening_data) -> tuple:
+        """Строка таблицы проемов: (№, название, тип, уровень)"""
+        try:
+            opening_normalized = normalize_data_structure(opening_data)
+            get = opening_normalized.get
+            
+            name = get('name', f'Проем {i+1}')
+            category = get('category', 'Неизвестно')
+            level = get('level', 'Неизвестно')
+            return (i + 1, name, category, level)
+            
+        except Exception as e:
+            logger.warning(f"Ошибка обработки проема {i}: {e}")
+            return (i + 1, "Ошибка обработки проема", "", "")
     
     # ===============================================
     # ДОПОЛНИТЕЛЬНЫЕ МЕТОДЫ
@@ -1385,6 +2227,8 @@ class ModernBessApp:
     def _on_closing(self):
         """Обработчик закрытия приложения"""
         logger.info("👋 Завершение работы приложения")
+        self._fallback_load = None
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
     
     def initialize(self):
@@ -17,13 +17,14 @@ Performance - система мониторинга и оптимизации п
 import time
 import threading
 import weakref
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from typing import Dict, List, Set, Tuple, Optional, Any, Callable, Union
 from dataclasses import dataclass, field
 from functools import wraps
 import hashlib
 import pickle
 import math
+import sys
 
 from geometry_utils import bounds, polygon_area
 
@@ -339,6 +340,82 @@ class RenderCache:
             }
 
 
+def _approximate_size(obj: Any, depth: int = 3) -> int:
+    """Приблизительный размер объекта в байтах (с учетом вложенных контейнеров)"""
+    size = sys.getsizeof(obj)
+    if depth > 0:
+        if isinstance(obj, (tuple, list)):
+            size += sum(_approximate_size(item, depth - 1) for item in obj)
+        elif isinstance(obj, dict):
+            size += sum(_approximate_size(k, depth - 1) + _approximate_size(v, depth - 1)
+                        for k, v in obj.items())
+    return size
+
+
+class LRUCache:
+    """
+    Кэш с вытеснением давно неиспользуемых записей (LRU)
+    
+    Ограничивает как количество записей, так и их приблизительный суммарный
+    объем в памяти. Используется вместо обычных словарей для кэшей
+    результатов расчетов, чтобы память не росла неограниченно при обработке
+    множества зданий в одном процессе.
+    """
+    
+    def __init__(self, max_size: int = 8192, max_bytes: int = 128 * 1024 * 1024):
+        """
+        Инициализация кэша
+        
+        Args:
+            max_size: Максимальное количество записей
+            max_bytes: Максимальный приблизительный объем записей в байтах
+        """
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._data: OrderedDict = OrderedDict()
+        self._sizes: Dict[Any, int] = {}
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __getitem__(self, key: Any) -> Any:
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self._data:
+            self.total_bytes -= self._sizes[key]
+        
+        entry_size = _approximate_size(key) + _approximate_size(value)
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._sizes[key] = entry_size
+        self.total_bytes += entry_size
+        
+        # Вытесняем самые старые записи, пока не уложимся в оба лимита
+        while self._data and (len(self._data) > self.max_size or
+                              (self.total_bytes > self.max_bytes and len(self._data) > 1)):
+            old_key, _ = self._data.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(old_key)
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Получение значения с обновлением порядка использования"""
+        if key in self._data:
+            return self[key]
+        return default
+    
+    def clear(self) -> None:
+        """Очистка кэша"""
+        self._data.clear()
+        self._sizes.clear()
+        self.total_bytes = 0
+
+
 class SpatialIndex:
     """
     Система пространственного индексирования для быстрого поиска элементов
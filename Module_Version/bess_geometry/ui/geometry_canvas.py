@@ -194,6 +194,41 @@ class CoordinateSystem:
         screen_y = -y * self.scale + self.offset_y  # Инверсия Y как в legacy
         return (screen_x, screen_y)
     
+    def world_to_screen_flat(self, points) -> List[float]:
+        """
+        Пакетное преобразование контура в плоский список [X1, Y1, X2, Y2, ...]
+        
+        Формат сразу подходит для canvas.create_polygon; параметры трансформации
+        читаются один раз на контур, а не на каждую точку.
+        
+        Args:
+            points: Точки [[x, y], ...] в мировых координатах (числа)
+            
+        Returns:
+            Плоский список экранных координат
+        """
+        scale, offset_x, offset_y = self.scale, self.offset_x, self.offset_y
+        # Список нужной длины заполняется срезами: без кортежа на каждую точку
+        # и без роста списка по мере добавления
+        screen = [0.0] * (2 * len(points))
+        screen[0::2] = [x * scale + offset_x for x, _ in points]
+        screen[1::2] = [-y * scale + offset_y for _, y in points]
+        return screen
+    
+    def world_to_screen_columns(self, xs, ys) -> Tuple[List[float], List[float]]:
+        """
+        Пакетное преобразование колонок координат (Structure-of-Arrays)
+        
+        Args:
+            xs, ys: Последовательности X и Y в мировых координатах
+            
+        Returns:
+            Списки экранных X и Y
+        """
+        scale, offset_x, offset_y = self.scale, self.offset_x, self.offset_y
+        return ([x * scale + offset_x for x in xs],
+                [-y * scale + offset_y for y in ys])
+    
     def screen_to_world(self, X: float, Y: float) -> Tuple[float, float]:
         """
         Преобразование экранных координат в мировые
@@ -326,6 +361,10 @@ class GeometryRenderer:
         self.render_cache = {}
         self.cache_version = 0
         
+        # Кэш позиций подписей: id(element) -> (element, outer_points, centroid_x, centroid_y).
+        # Центроид меняется только при замене контура, а не при панорамировании/масштабировании
+        self.label_cache = {}
+        
         # Статистика производительности
         self.render_stats = {
             'elements_drawn': 0,
@@ -552,14 +591,25 @@ class GeometryRenderer:
         if self.coords.scale < self.lod_settings['text_scale_threshold']:
             return
         
+        label_cache = self.label_cache
+        used_labels = {}
+        
         for element in elements:
             try:
                 outer_points = element.get('outer_xy_m', [])
-                if len(outer_points) < 3:
-                    continue
                 
-                # Вычисляем центроид для размещения текста
-                centroid_x, centroid_y = self._calculate_centroid(outer_points)
+                # Центроид пересчитывается только для новых элементов и замененных контуров
+                cached = label_cache.get(id(element))
+                if cached is None or cached[0] is not element or cached[1] is not outer_points:
+                    if len(outer_points) < 3:
+                        continue
+                    
+                    # Вычисляем центроид для размещения текста
+                    centroid_x, centroid_y = self._calculate_centroid(outer_points)
+                    cached = (element, outer_points, centroid_x, centroid_y)
+                
+                used_labels[id(element)] = cached
+                centroid_x, centroid_y = cached[2], cached[3]
                 
                 # Преобразуем в экранные координаты
                 screen_x, screen_y = self.coords.world_to_screen(centroid_x, centroid_y)
@@ -579,6 +629,9 @@ class GeometryRenderer:
                 
             except Exception as e:
                 print(f"⚠️ Ошибка отрисовки названия {element.get('id', 'unknown')}: {e}")
+        
+        # В кэше остаются только элементы текущей отрисовки
+        self.label_cache = used_labels
     
     def _draw_polygon(self, points: List[List[float]], fill_color: Optional[str] = None, 
                      outline_color: str = "black", outline_width: int = 1) -> List[int]:
@@ -590,12 +643,18 @@ class GeometryRenderer:
             return []
         
         try:
-            # Преобразуем мировые координаты в экранные (порт legacy _to_screen)
-            screen_points = []
-            for point in points:
-                if len(point) >= 2:
-                    screen_x, screen_y = self.coords.world_to_screen(point[0], point[1])
-                    screen_points.extend([screen_x, screen_y])
+            # Преобразуем мировые координаты в экранные (порт legacy _to_screen).
+            # Контуры из io_bess уже нормализованы в пары float - весь контур
+            # преобразуется одним вызовом без поточечных проверок
+            try:
+                screen_points = self.coords.world_to_screen_flat(points)
+            except (TypeError, ValueError):
+                # Точки другой длины или формата - поточечный разбор
+                screen_points = []
+                for point in points:
+                    if len(point) >= 2:
+                        screen_x, screen_y = self.coords.world_to_screen(point[0], point[1])
+                        screen_points.extend([screen_x, screen_y])
             
             if len(screen_points) < 6:  # Минимум 3 точки = 6 координат
                 return []